@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
 
 from bs4 import BeautifulSoup, Tag
+from bs4.builder import builder_registry
 from datetime import datetime, date
 
 
@@ -90,6 +91,10 @@ NON_CREDITOR_HEADERS = {
 
 BUREAUS: Sequence[str] = ("TransUnion", "Experian", "Equifax")
 
+# BeautifulSoup tree builders in "auto" preference order (METRO2_HTML_BACKEND).
+HTML_BACKENDS: Sequence[str] = ("lxml", "html5lib", "html.parser")
+DEFAULT_HTML_BACKEND = "html.parser"
+
 # ---------------------------------------------------------------------------
 # Globals
 # ---------------------------------------------------------------------------
@@ -164,8 +169,32 @@ def _load_rulebook() -> Dict[str, Dict[str, Any]]:
     return data
 
 
+class _LazyRulebook(Mapping[str, Dict[str, Any]]):
+    """Rulebook mapping that locates and parses the JSON on first use.
+
+    Resolving the path scans the repo and the file is large, so importing this
+    module (or the tests that exercise single helpers) should not pay for it.
+    """
+
+    def __init__(self) -> None:
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._data is None:
+            self._data = _load_rulebook()
+        return self._data
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
 
-RULEBOOK: Dict[str, Dict[str, Any]] = _load_rulebook()
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+RULEBOOK: Mapping[str, Dict[str, Any]] = _LazyRulebook()
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -1820,11 +1849,27 @@ def print_audit_summary(
 # Public API
 # ---------------------------------------------------------------------------
 
-def parse_credit_report_html(html_content: str) -> AuditPayload:
+def resolve_html_backend(backend: Optional[str] = None) -> str:
+    """Return an installed tree builder for ``backend`` / ``METRO2_HTML_BACKEND``."""
+    requested = (backend or os.getenv("METRO2_HTML_BACKEND") or DEFAULT_HTML_BACKEND).strip().lower()
+    if requested == "auto":
+        candidates: Sequence[str] = HTML_BACKENDS
+    elif requested in HTML_BACKENDS:
+        candidates = (requested, DEFAULT_HTML_BACKEND)
+    else:
+        raise ValueError(f"Unknown HTML backend {requested!r}")
+    for name in candidates:
+        if builder_registry.lookup(name) is not None:
+            return name
+    return DEFAULT_HTML_BACKEND
+
+
+def parse_credit_report_html(html_content: str, backend: Optional[str] = None) -> AuditPayload:
+    backend = resolve_html_backend(backend)
     metro2_parser = _load_metro2_parser(Path.cwd())
     if metro2_parser:
         try:
-            parsed = metro2_parser(html_content)
+            parsed = metro2_parser(html_content, backend=backend)
             return _audit_payload_from_metro2(parsed)
         except Exception as exc:
             logging.getLogger("metro2").warning(
@@ -1832,7 +1877,7 @@ def parse_credit_report_html(html_content: str) -> AuditPayload:
                 exc,
             )
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = BeautifulSoup(html_content, backend)
     personal = parse_personal_info(soup)
     personal_violations = detect_personal_violations(personal)
     tradelines = detect_tradeline_violations(parse_account_history(soup))
@@ -1849,7 +1894,7 @@ def parse_credit_report_html(html_content: str) -> AuditPayload:
     )
 
 
-def parse_credit_report_file(path: str) -> AuditPayload:
+def parse_credit_report_file(path: str, backend: Optional[str] = None) -> AuditPayload:
     report_path = Path(path)
     if report_path.suffix.lower() == ".pdf":
         payload = parse_credit_report_pdf(report_path)
@@ -1862,7 +1907,7 @@ def parse_credit_report_file(path: str) -> AuditPayload:
             inquiry_violations=payload.get("inquiry_violations") or [],
         )
     with open(path, "r", encoding="utf-8") as handle:
-        return parse_credit_report_html(handle.read())
+        return parse_credit_report_html(handle.read(), backend=backend)
 
 
 def _add_metro2_module_path(report_path: Path) -> None:
@@ -1922,6 +1967,11 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("-o", "--output", dest="output", help="Optional path to write JSON results")
     parser.add_argument("--json-only", action="store_true", help="Suppress CLI summary and emit JSON only")
     parser.add_argument("--debug", action="store_true", help="Enable verbose debug logging")
+    parser.add_argument(
+        "--html-backend",
+        choices=(*HTML_BACKENDS, "auto"),
+        help="BeautifulSoup tree builder (default: $METRO2_HTML_BACKEND or html.parser)",
+    )
     args = parser.parse_args(argv)
     logger = setup_logger(args.debug)
     logger.info("Starting Metro2 audit for %s", args.input_cli or args.input)
@@ -1929,7 +1979,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     html_path = args.input_cli or args.input
     if not html_path:
         parser.error("Missing input HTML file")
-    payload = parse_credit_report_file(html_path)
+    payload = parse_credit_report_file(html_path, backend=args.html_backend)
     data = {
         "personal_information": payload.personal_information,
         "personal_violations": payload.personal_violations,
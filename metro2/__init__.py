@@ -1,13 +1,35 @@
-"""Metro2 parsing and auditing helpers."""
-
-from .parser import (
-    parse_client_portal_data,
-    parse_credit_report_html,
-    parse_negative_item_cards,
-)
-
-__all__ = [
-    "parse_client_portal_data",
-    "parse_credit_report_html",
-    "parse_negative_item_cards",
-]
+"""Metro2 parsing and auditing helpers.
+
+Public names are resolved lazily so that importing a single submodule such as
+``metro2.audit_rules`` does not pull in BeautifulSoup, asyncio or the Node
+bridge machinery.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "iter_report_events": "parser",
+    "iter_tradelines": "parser",
+    "parse_client_portal_data": "parser",
+    "parse_client_portal_data_async": "async_parser",
+    "parse_credit_report_html": "parser",
+    "parse_negative_item_cards": "parser",
+    "parse_negative_item_cards_async": "async_parser",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+__all__ = sorted(_EXPORTS)
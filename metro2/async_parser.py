@@ -0,0 +1,171 @@
+"""asyncio entry points for the Metro 2 parse pipeline.
+
+The Node bridge runs as an ``asyncio`` subprocess so the event loop is never
+blocked on it; cancelling the task or hitting the timeout kills the child.
+The CPU-bound stages (DOM fallback, normalization and audits) run on an
+executor: the loop's default thread pool, or any ``concurrent.futures``
+executor the caller supplies (a ``ProcessPoolExecutor`` keeps them off the
+GIL entirely).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional
+
+from .bridge_pool import NODE_BRIDGE, bridge_output_flags, default_bridge_timeout
+from .html_slim import slim_enabled
+from .parse_cache import get_parse_cache
+from .parser import (
+    ReportSource,
+    _ReportMarkup,
+    _assemble_report,
+    _load_markup,
+    _parse_report,
+    _resolve_source,
+    resolve_html_backend,
+)
+from .report_adapters import is_pdf_source
+
+_DEFAULT_TIMEOUT = object()
+
+
+def _bridge_command() -> List[str]:
+    return ["node", str(NODE_BRIDGE), *bridge_output_flags()]
+
+
+async def _call_js_parser_async(html: Any, timeout: Optional[float]) -> Dict[str, Any]:
+    if not html or not NODE_BRIDGE.exists():
+        return {}
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *_bridge_command(),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+    except OSError:
+        return {}
+
+    body = html.encode("utf-8") if isinstance(html, str) else bytes(html)
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(body), timeout)
+    except asyncio.TimeoutError:
+        await _kill(process)
+        return {}
+    except BaseException:
+        # Cancellation (or anything else) must not leave an orphaned bridge.
+        await _kill(process)
+        raise
+
+    if process.returncode != 0:
+        return {}
+    try:
+        payload = json.loads(stdout.decode("utf-8") or "{}")
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+async def _kill(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+    await process.wait()
+
+
+def _assemble_from_markup(
+    markup: _ReportMarkup, payload: Dict[str, Any], include_personal: bool
+) -> Dict[str, Any]:
+    # Module-level and argument-only so it can be shipped to a process pool;
+    # the markup is only decoded here, and only if the fallback needs the DOM.
+    return _assemble_report(payload, markup.soup, include_personal=include_personal)
+
+
+async def _parse_report_async(
+    doc: ReportSource,
+    include_personal: bool,
+    backend: Optional[str],
+    executor: Optional[Executor],
+    timeout: Any,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
+    loop = asyncio.get_running_loop()
+    backend = resolve_html_backend(backend)
+    doc = _resolve_source(doc)
+    if is_pdf_source(doc):
+        return await loop.run_in_executor(
+            executor, functools.partial(_parse_report, doc, include_personal, backend, dom_build=dom_build)
+        )
+
+    markup = await asyncio.to_thread(_load_markup, doc, backend, dom_build)
+    try:
+        cache = get_parse_cache()
+        cache_key: Optional[str] = None
+        if cache is not None:
+            cache_key = await asyncio.to_thread(
+                cache.key_for, markup.body, include_personal, backend, markup.dom_build
+            )
+            if cache_key is not None:
+                cached = await asyncio.to_thread(cache.get, cache_key)
+                if cached is not None:
+                    return cached
+
+        if slim_enabled():
+            await asyncio.to_thread(markup.slim)
+        if timeout is _DEFAULT_TIMEOUT:
+            timeout = default_bridge_timeout()
+        payload = await _call_js_parser_async(markup.body, timeout)
+        parsed = await loop.run_in_executor(
+            executor,
+            functools.partial(_assemble_from_markup, markup, payload, include_personal),
+        )
+    finally:
+        markup.close()
+    if cache_key is not None:
+        await asyncio.to_thread(cache.put, cache_key, parsed)
+    return parsed
+
+
+async def parse_negative_item_cards_async(
+    doc: ReportSource,
+    backend: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    timeout: Any = _DEFAULT_TIMEOUT,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async :func:`metro2.parser.parse_negative_item_cards`.
+
+    ``timeout`` bounds the bridge subprocess (default ``METRO2_BRIDGE_TIMEOUT``;
+    ``None`` waits forever). On timeout the bridge is killed and the DOM
+    fallback is used, just as when the bridge fails.
+    """
+
+    parsed = await _parse_report_async(doc, False, backend, executor, timeout, dom_build)
+    return {
+        "accounts": parsed.get("accounts", []),
+        "inquiries": parsed.get("inquiries", []),
+    }
+
+
+async def parse_client_portal_data_async(
+    doc: ReportSource,
+    backend: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    timeout: Any = _DEFAULT_TIMEOUT,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Async :func:`metro2.parser.parse_client_portal_data`; see the negative variant."""
+
+    return await _parse_report_async(doc, True, backend, executor, timeout, dom_build)
+
+
+__all__ = [
+    "parse_client_portal_data_async",
+    "parse_negative_item_cards_async",
+]
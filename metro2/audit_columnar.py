@@ -0,0 +1,198 @@
+"""Columnar NumPy prefilter for high-volume re-audits.
+
+:func:`run_columnar_audits` audits many payloads at once through
+:func:`metro2.audit_rules.run_batch_audits`.  The tradelines of every report
+are turned into NumPy columns (amounts, date ordinals and a status bitmask
+taken from their :class:`~metro2.audit_rules.TradelineView`), the numeric and
+date-threshold rules are evaluated as vectorized masks, and each of those
+rules then runs its own check only on the rows its mask selected.  The masks
+over-approximate, so the output is identical to :func:`run_all_audits`.
+
+NumPy is optional: without it :func:`run_columnar_audits` runs the plain
+dict engine.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, List, Mapping, MutableMapping, Sequence
+
+from . import audit_rules
+from .audit_rules import TradelineView
+
+# Status bitmask; each flag is a superset of the keyword test in the rules.
+STATUS_CURRENT = 1 << 0  # "current", "pays as agreed", "paid as agreed", "ok"
+STATUS_ACTIVE = 1 << 1  # "open", "current", "pays as agreed", "ok"
+STATUS_OPEN = 1 << 2
+STATUS_REVOLVING = 1 << 3
+STATUS_INSTALLMENT = 1 << 4
+STATUS_LAST_REPORTED_RAW = 1 << 5  # a Last Reported value parse_date could not read
+STATUS_DEROGATORY = 1 << 6  # "charge", "collection"
+STATUS_CLOSED = 1 << 7  # "closed", "paid", "charge", "collection"
+
+_STATUS_WORDS = (
+    (STATUS_CURRENT, ("current", "pays as agreed", "paid as agreed", "ok")),
+    (STATUS_ACTIVE, ("open", "current", "pays as agreed", "ok")),
+    (STATUS_OPEN, ("open",)),
+    (STATUS_DEROGATORY, ("charge", "collection")),
+    (STATUS_CLOSED, ("closed", "paid", "charge", "collection")),
+)
+# Slack (days) on the "older than N days" thresholds, in case the clock
+# crosses midnight between the prefilter and the rule checks.
+_DAY_MARGIN = 1
+
+
+def columnar_available() -> bool:
+    return find_spec("numpy") is not None
+
+
+def _ordinal(value: date | None) -> int:
+    # Real dates start at ordinal 1, so 0 marks a missing one.
+    return value.toordinal() if value else 0
+
+
+@lru_cache(maxsize=1024)
+def _status_word_flags(status: str) -> int:
+    flags = 0
+    for flag, words in _STATUS_WORDS:
+        if any(word in status for word in words):
+            flags |= flag
+    return flags
+
+
+def _status_flags(record: Mapping[str, Any], view: TradelineView) -> int:
+    flags = _status_word_flags(view.status)
+    if view.is_revolving:
+        flags |= STATUS_REVOLVING
+    if view.is_installment:
+        flags |= STATUS_INSTALLMENT
+    if view.last_reported is None and (record.get("last_reported") or record.get("date_last_reported")):
+        flags |= STATUS_LAST_REPORTED_RAW
+    return flags
+
+
+@dataclass(frozen=True)
+class TradelineColumns:
+    """One NumPy array per field; dates are ordinals with 0 for missing."""
+
+    balance: Any
+    past_due: Any
+    credit_limit: Any
+    high_credit: Any
+    monthly_payment: Any
+    date_opened: Any
+    date_closed: Any
+    last_reported: Any
+    date_last_active: Any
+    last_active: Any
+    flags: Any
+
+    @classmethod
+    def build(
+        cls, records: Sequence[Mapping[str, Any]], views: Sequence[TradelineView]
+    ) -> "TradelineColumns":
+        import numpy as np
+
+        count = len(views)
+
+        def amounts(slot: str) -> Any:
+            return np.fromiter((getattr(view, slot) for view in views), dtype=np.float64, count=count)
+
+        def ordinals(slot: str) -> Any:
+            return np.fromiter((_ordinal(getattr(view, slot)) for view in views), dtype=np.int32, count=count)
+
+        return cls(
+            balance=amounts("balance"),
+            past_due=amounts("past_due"),
+            credit_limit=amounts("credit_limit"),
+            high_credit=amounts("high_credit"),
+            monthly_payment=amounts("monthly_payment"),
+            date_opened=ordinals("date_opened"),
+            date_closed=ordinals("date_closed"),
+            last_reported=ordinals("last_reported"),
+            date_last_active=ordinals("date_last_active"),
+            last_active=ordinals("last_active"),
+            flags=np.fromiter(
+                (_status_flags(record, view) for record, view in zip(records, views)),
+                dtype=np.uint8,
+                count=count,
+            ),
+        )
+
+    def has(self, flag: int) -> Any:
+        return (self.flags & flag) != 0
+
+
+def rule_masks(columns: TradelineColumns, today_ordinal: int) -> Dict[Callable[..., None], Any]:
+    """Candidate mask per vectorized rule; a rule can only flag rows set in its mask."""
+
+    import numpy as np
+
+    c = columns
+    has_limit = c.credit_limit > 0
+    utilization = np.divide(c.balance, c.credit_limit, out=np.zeros_like(c.balance), where=has_limit)
+    opened = c.date_opened
+
+    def before_opened(dates: Any) -> Any:
+        return (dates > 0) & (dates < opened)
+
+    return {
+        audit_rules.audit_stale_data: (
+            (c.last_reported > 0) & (c.last_reported < today_ordinal - 365 + _DAY_MARGIN)
+        )
+        | c.has(STATUS_LAST_REPORTED_RAW),
+        audit_rules.audit_high_utilization: has_limit & (utilization > 0.9),
+        audit_rules.audit_current_with_past_due: (c.past_due > 0) & c.has(STATUS_CURRENT),
+        audit_rules.audit_zero_balance_with_past_due: (c.balance <= 1) & (c.past_due > 0),
+        audit_rules.audit_open_zero_balance: c.has(STATUS_OPEN) & (c.balance <= 0),
+        audit_rules.audit_revolving_zero_limit_comment: c.has(STATUS_REVOLVING)
+        & (c.credit_limit == 0)
+        & (c.high_credit > 0),
+        audit_rules.audit_high_credit_exceeds_limit: has_limit & (c.high_credit > c.credit_limit),
+        audit_rules.audit_revolving_missing_limit: c.has(STATUS_REVOLVING)
+        & (c.credit_limit <= 0)
+        & (c.high_credit <= 0),
+        audit_rules.audit_installment_has_limit: c.has(STATUS_INSTALLMENT) & has_limit,
+        audit_rules.audit_co_collection_past_due: (c.past_due > 0) & c.has(STATUS_DEROGATORY),
+        audit_rules.audit_derog_rating_but_current: (c.past_due <= 0) & c.has(STATUS_CURRENT),
+        audit_rules.audit_closed_account_monthly_payment: (c.monthly_payment > 0) & c.has(STATUS_CLOSED),
+        audit_rules.audit_stale_active_reporting: c.has(STATUS_ACTIVE)
+        & (c.last_active > 0)
+        & (c.last_active < today_ordinal - 180 + _DAY_MARGIN),
+        audit_rules.audit_metro2_code_3_conflict: c.has(STATUS_ACTIVE) & (c.date_closed > 0),
+        audit_rules.audit_date_order_sanity: (opened > 0)
+        & (before_opened(c.last_reported) | before_opened(c.date_last_active) | before_opened(c.date_closed)),
+    }
+
+
+def columnar_prefilter(
+    records: Sequence[Mapping[str, Any]], views: Sequence[TradelineView]
+) -> Dict[Callable[..., None], List[int]]:
+    """:data:`~metro2.audit_rules.Prefilter` backed by :func:`rule_masks`."""
+
+    import numpy as np
+
+    columns = TradelineColumns.build(records, views)
+    today_ordinal = audit_rules.today().toordinal()
+    return {fn: np.flatnonzero(mask).tolist() for fn, mask in rule_masks(columns, today_ordinal).items()}
+
+
+def run_columnar_audits(
+    payloads: Sequence[MutableMapping[str, Any]], force: bool = False
+) -> Sequence[MutableMapping[str, Any]]:
+    """Audit ``payloads`` in place like :func:`run_all_audits`, vectorizing where possible."""
+
+    prefilter = columnar_prefilter if columnar_available() else None
+    return audit_rules.run_batch_audits(payloads, force=force, prefilter=prefilter)
+
+
+__all__ = [
+    "TradelineColumns",
+    "columnar_available",
+    "columnar_prefilter",
+    "rule_masks",
+    "run_columnar_audits",
+]
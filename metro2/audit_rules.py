@@ -9,10 +9,18 @@ information blocks, and also knows how to render a color-coded CLI summary.
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
+from contextvars import ContextVar
 from datetime import date, datetime
+from functools import lru_cache, wraps
+import hashlib
+import json
+from pathlib import Path
 import re
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Sequence
+
+from .payment_history import DEROGATORY, PaymentGrid
 
 
 # ---------------------------------------------------------------------------
@@ -32,10 +40,10 @@ def clean_amount(value: Any) -> float:
 SANITIZE_KEY_RE = re.compile(r"[^a-z0-9]+")
 
 
+@lru_cache(maxsize=1024)
 def _normalize_key_name(name: str) -> str:
-    normalized = SANITIZE_KEY_RE.sub("_", name.strip().lower())
-    normalized = re.sub(r"_+", "_", normalized).strip("_")
-    return normalized
+    # Underscores fall in the sanitized class, so runs collapse in one pass.
+    return SANITIZE_KEY_RE.sub("_", name.strip().lower()).strip("_")
 
 
 DATE_FORMATS = (
@@ -50,8 +58,19 @@ DATE_FORMATS = (
 )
 
 
+# Fast paths for the two shapes that make up nearly every report date.
+_MDY_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+PARSE_DATE_CACHE_SIZE = 4096
+_EMPTY_DATE_TEXTS = frozenset({"-", "--", "—", "n/a", "na", "not reported"})
+
+
 def parse_date(value: Any) -> date | None:
-    """Parse common Metro-2 date formats into :class:`datetime.date`."""
+    """Parse common Metro-2 date formats into :class:`datetime.date`.
+
+    Text values are memoized (see :data:`PARSE_DATE_CACHE_SIZE`); a report
+    repeats the same handful of date strings across every rule.
+    """
 
     if not value:
         return None
@@ -59,11 +78,33 @@ def parse_date(value: Any) -> date | None:
         return value.date()
     if isinstance(value, date):
         return value
+    return _parse_date_text(value if isinstance(value, str) else str(value))
 
-    text = str(value).strip()
+
+@lru_cache(maxsize=PARSE_DATE_CACHE_SIZE)
+def _parse_date_text(raw: str) -> date | None:
+    text = raw.strip()
     if not text:
         return None
-    if text.lower() in {"-", "--", "—", "n/a", "na", "not reported"}:
+    match = _MDY_DATE_RE.fullmatch(text)
+    if match:
+        month, day, year = match.groups()
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    match = _ISO_DATE_RE.fullmatch(text)
+    if match:
+        year, month, day = match.groups()
+        try:
+            return date(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    return _parse_date_slow(text)
+
+
+def _parse_date_slow(text: str) -> date | None:
+    if text.lower() in _EMPTY_DATE_TEXTS:
         return None
 
     # Normalize ISO8601 timezone shorthand (trailing Z or offsets without colon).
@@ -248,10 +289,17 @@ def _falseyish(value: Any) -> bool:
     return text in {"0", "false", "no", "n"}
 
 
+def _payment_grid(record: Mapping[str, Any]) -> PaymentGrid | None:
+    history = record.get("payment_history")
+    return history if isinstance(history, PaymentGrid) else None
+
+
 def _payment_history_entries(record: Mapping[str, Any]) -> List[Mapping[str, Any]]:
     history = record.get("payment_history")
     if not history:
         return []
+    if isinstance(history, PaymentGrid):
+        return [{"date": month, "status": label} for month, label in history.months()]
     if isinstance(history, Mapping):
         return [
             {"date": key, "status": value}
@@ -288,6 +336,9 @@ LATE_PAYMENT_MARKERS = (
 
 
 def _payment_history_has_late(record: Mapping[str, Any]) -> bool:
+    grid = _payment_grid(record)
+    if grid is not None:
+        return grid.has_late()
     for entry in _payment_history_entries(record):
         status = _normalize_status(entry.get("status") or entry.get("payment_status"))
         if not status:
@@ -315,42 +366,129 @@ def _has_prior_dispute(record: Mapping[str, Any]) -> bool:
     return False
 
 
+def assign_account_group(records: Sequence[MutableMapping[str, Any]], group_id: str) -> None:
+    """Stamp one tradeline's per-bureau records with ``group_id`` and ``account_key``.
+
+    Parsers call this for records they know describe the same account (one
+    bridge tradeline, one fallback account table).  ``account_key`` is
+    ``CREDITOR|ACCOUNT`` and stays the same across re-parses of a report.
+    """
+
+    creditor = next(
+        (str(r["creditor_name"]).strip().upper() for r in records if r.get("creditor_name")),
+        "UNKNOWN",
+    )
+    account = next((number for r in records if (number := _normalized_account_number(r))), "")
+    account_key = f"{creditor}|{account or group_id}"
+    for record in records:
+        record["group_id"] = group_id
+        record["account_key"] = account_key
+
+
 def group_by_creditor(
     tradelines: Iterable[Mapping[str, Any]]
 ) -> Dict[tuple[str, str], List[Mapping[str, Any]]]:
-    """Group tradelines by creditor using a cross-bureau matching score."""
+    """Group tradelines by creditor using a cross-bureau matching score.
+
+    Records carrying a parser-assigned ``group_id`` (see
+    :func:`assign_account_group`) are grouped by it as-is; only the rest go
+    through fuzzy matching.
+    """
 
     grouped: Dict[tuple[str, str], List[Mapping[str, Any]]] = {}
     by_creditor: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+    by_group: Dict[Any, List[Mapping[str, Any]]] = {}
 
     for tl in tradelines:
+        group_id = tl.get("group_id")
+        if group_id not in (None, ""):
+            by_group.setdefault(group_id, []).append(tl)
+            continue
         name = (tl.get("creditor_name") or "UNKNOWN").strip().upper()
         by_creditor[name].append(tl)
 
     for name, records in by_creditor.items():
-        partitions: List[List[Mapping[str, Any]]] = []
-        for record in records:
-            best_index = None
-            best_score = float("-inf")
-            for idx, partition in enumerate(partitions):
-                score = _match_score(record, partition)
-                if score > best_score:
-                    best_score = score
-                    best_index = idx
-            if best_index is not None and best_score >= MATCH_SCORE_THRESHOLD:
-                partitions[best_index].append(record)
-            else:
-                partitions.append([record])
-
+        partitions = _partition_records(records)
         for idx, partition in enumerate(partitions):
             account = _normalized_account_number(partition[0])
             if not account:
                 account = f"__NO_ACCOUNT__#{idx}"
             grouped[(name, account)] = partition
 
+    for group_id, partition in by_group.items():
+        name = (partition[0].get("creditor_name") or "UNKNOWN").strip().upper()
+        account = _normalized_account_number(partition[0]) or f"__NO_ACCOUNT__#{group_id}"
+        if (name, account) in grouped:
+            account = f"{account}#{group_id}"
+        grouped[(name, account)] = partition
+
     return grouped
 
 
+def _creditor_buckets(
+    tradelines: Iterable[Mapping[str, Any]]
+) -> Dict[str, List[Mapping[str, Any]]]:
+    by_creditor: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+    for record in tradelines:
+        name = (record.get("creditor_name") or "UNKNOWN").strip().upper()
+        by_creditor[name].append(record)
+    return by_creditor
+
+
+class AuditContext:
+    """Per-run cache of the tradeline views and groupings shared by the rules.
+
+    :func:`run_all_audits` builds one and hands it to every rule that takes a
+    ``context``; each grouping is computed on first use and reused after
+    that.  Rules only attach violations, so the groupings stay valid for the
+    whole run.
+    """
+
+    def __init__(
+        self,
+        tradelines: Sequence[Mapping[str, Any]],
+        views: Dict[int, "TradelineView"] | None = None,
+    ) -> None:
+        self.tradelines = tradelines
+        self._views: Dict[int, TradelineView] = views if views is not None else {}
+        self._groups: Dict[tuple[str, str], List[Mapping[str, Any]]] | None = None
+        self._by_creditor: Dict[str, List[Mapping[str, Any]]] | None = None
+
+    def view(self, record: Mapping[str, Any]) -> "TradelineView":
+        """The record's :class:`TradelineView`, built on first request."""
+
+        view = self._views.get(id(record))
+        if view is None:
+            view = self._views[id(record)] = TradelineView.build(record)
+        return view
+
+    @property
+    def groups(self) -> Dict[tuple[str, str], List[Mapping[str, Any]]]:
+        """:func:`group_by_creditor` of the run's tradelines."""
+
+        if self._groups is None:
+            self._groups = group_by_creditor(self.tradelines)
+        return self._groups
+
+    @property
+    def by_creditor(self) -> Dict[str, List[Mapping[str, Any]]]:
+        """Tradelines bucketed by upper-cased creditor name, in input order."""
+
+        if self._by_creditor is None:
+            self._by_creditor = _creditor_buckets(self.tradelines)
+        return self._by_creditor
+
+
+def _view(record: Mapping[str, Any], context: AuditContext | None) -> "TradelineView":
+    return context.view(record) if context is not None else TradelineView.build(record)
+
+
+def _grouped(
+    tradelines: Iterable[Mapping[str, Any]], context: AuditContext | None
+) -> Dict[tuple[str, str], List[Mapping[str, Any]]]:
+    return context.groups if context is not None else group_by_creditor(tradelines)
+
+
 def _match_score(record: Mapping[str, Any], partition: Sequence[Mapping[str, Any]]) -> float:
     score = float("-inf")
     for candidate in partition:
@@ -359,35 +497,101 @@ def _match_score(record: Mapping[str, Any], partition: Sequence[Mapping[str, Any
 
 
 def _match_score_pair(a: Mapping[str, Any], b: Mapping[str, Any]) -> float:
-    score = 0.0
-
-    account_a = _normalized_account_number(a)
-    account_b = _normalized_account_number(b)
-    if account_a and account_b:
-        if account_a == account_b:
-            score += 80
-        elif (account_a.endswith(account_b) or account_b.endswith(account_a)
-              or account_a.startswith(account_b) or account_b.startswith(account_a)):
-            score += 80
-        else:
-            score -= 100
+    return _MatchKey.build(a).score(_MatchKey.build(b))
+
+
+class _MatchKey:
+    """The fields :func:`_match_score_pair` compares, derived once per record."""
+
+    __slots__ = ("account", "opened", "last_reported", "bucket")
+
+    @classmethod
+    def build(cls, record: Mapping[str, Any]) -> "_MatchKey":
+        key = cls()
+        key.account = _normalized_account_number(record)
+        key.opened = parse_date(record.get("date_opened"))
+        key.last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
+        key.bucket = _account_type_bucket(record)
+        return key
+
+    def score(self, other: "_MatchKey") -> float:
+        score = 0.0
+
+        account_a = self.account
+        account_b = other.account
+        if account_a and account_b:
+            if account_a == account_b:
+                score += 80
+            elif (account_a.endswith(account_b) or account_b.endswith(account_a)
+                  or account_a.startswith(account_b) or account_b.startswith(account_a)):
+                score += 80
+            else:
+                score -= 100
 
-    open_a = parse_date(a.get("date_opened"))
-    open_b = parse_date(b.get("date_opened"))
-    if open_a and open_b and abs((open_a - open_b).days) <= 30:
-        score += 30
+        if self.opened and other.opened and abs((self.opened - other.opened).days) <= 30:
+            score += 30
 
-    last_reported_a = parse_date(a.get("last_reported") or a.get("date_last_reported"))
-    last_reported_b = parse_date(b.get("last_reported") or b.get("date_last_reported"))
-    if last_reported_a and last_reported_b and abs((last_reported_a - last_reported_b).days) <= 60:
-        score += 20
+        if (self.last_reported and other.last_reported
+                and abs((self.last_reported - other.last_reported).days) <= 60):
+            score += 20
 
-    type_a = _account_type_bucket(a)
-    type_b = _account_type_bucket(b)
-    if type_a and type_b and type_a == type_b:
-        score += 15
+        if self.bucket and other.bucket and self.bucket == other.bucket:
+            score += 15
 
-    return score
+        return score
+
+
+def _account_affixes(account: str) -> Iterator[str]:
+    for size in range(1, len(account) + 1):
+        yield account[:size]
+        yield account[-size:]
+
+
+def _partition_records(records: Sequence[Mapping[str, Any]]) -> List[List[Mapping[str, Any]]]:
+    """Split one creditor's records into cross-bureau partitions.
+
+    Same result as scoring every record against every earlier partition with
+    :func:`_match_score` and joining the best one at or above
+    :data:`MATCH_SCORE_THRESHOLD` (first partition on ties), but only members
+    whose account number is equal to, or a prefix or suffix of, the record's
+    are scored.  Those are the only pairs that can reach the threshold: the
+    date and type bonuses add up to 65, and a mismatched number costs 100.
+    """
+
+    partitions: List[List[Mapping[str, Any]]] = []
+    # Members by full account number, and by every prefix and suffix of it.
+    by_account: Dict[str, List[tuple[int, _MatchKey]]] = defaultdict(list)
+    by_affix: Dict[str, List[tuple[int, _MatchKey]]] = defaultdict(list)
+
+    for record in records:
+        key = _MatchKey.build(record)
+        account = key.account
+        if not account:
+            partitions.append([record])
+            continue
+
+        candidates = list(by_affix.get(account, ()))
+        for affix in _account_affixes(account):
+            candidates.extend(by_account.get(affix, ()))
+
+        best_index = None
+        best_score = float("-inf")
+        for idx, member in candidates:
+            score = key.score(member)
+            if score > best_score or (score == best_score and idx < best_index):
+                best_score = score
+                best_index = idx
+
+        if best_index is None or best_score < MATCH_SCORE_THRESHOLD:
+            best_index = len(partitions)
+            partitions.append([])
+        partitions[best_index].append(record)
+        entry = (best_index, key)
+        by_account[account].append(entry)
+        for affix in set(_account_affixes(account)):
+            by_affix[affix].append(entry)
+
+    return partitions
 
 
 def _account_type_bucket(record: Mapping[str, Any]) -> str | None:
@@ -483,11 +687,74 @@ KNOWN_BUREAUS = {
 }
 
 
-def normalize_tradeline(record: MutableMapping[str, Any]) -> None:
-    """Normalize keys and whitespace so audit rules see consistent fields."""
+class TradelineView:
+    """Parsed amounts, dates and lowercased statuses of one normalized tradeline.
+
+    Built once per record by :func:`normalize_tradeline` so the rules stop
+    re-deriving the same values from the raw dict.  Each slot holds exactly
+    what the matching helper returns (``balance`` is
+    ``clean_amount(record.get("balance"))``, ``bucket`` is
+    :func:`_account_type_bucket`, and so on); the view is never written back
+    into the record, so the JSON output is unaffected.
+    """
+
+    __slots__ = (
+        "balance",
+        "past_due",
+        "credit_limit",
+        "high_credit",
+        "monthly_payment",
+        "status",
+        "payment_status",
+        "comments",
+        "is_revolving",
+        "is_installment",
+        "bucket",
+        "account_number",
+        "date_opened",
+        "date_closed",
+        "last_reported",
+        "date_last_active",
+        "last_active",
+        "last_payment",
+        "last_payment_ref",
+        "past_due_date",
+    )
+
+    @classmethod
+    def build(cls, record: Mapping[str, Any]) -> "TradelineView":
+        view = cls()
+        view.balance = clean_amount(record.get("balance"))
+        view.past_due = clean_amount(record.get("past_due"))
+        view.credit_limit = clean_amount(record.get("credit_limit"))
+        view.high_credit = clean_amount(record.get("high_credit"))
+        view.monthly_payment = clean_amount(record.get("monthly_payment"))
+        view.status = _normalize_status(record.get("account_status"))
+        view.payment_status = _normalize_status(record.get("payment_status"))
+        view.comments = _normalize_status(_get_comments(record))
+        view.is_revolving = _is_revolving(record)
+        view.is_installment = _is_installment(record)
+        view.bucket = _account_type_bucket(record)
+        view.account_number = _normalized_account_number(record)
+        view.date_opened = parse_date(record.get("date_opened"))
+        view.date_closed = parse_date(record.get("date_closed"))
+        view.last_reported = parse_date(record.get("last_reported"))
+        view.date_last_active = parse_date(record.get("date_last_active"))
+        view.last_active = parse_date(record.get("last_reported") or record.get("date_last_active"))
+        view.last_payment = _get_last_payment_date(record)
+        view.last_payment_ref = _get_last_payment_reference(record)
+        view.past_due_date = _get_past_due_date(record)
+        return view
+
+
+def normalize_tradeline(record: MutableMapping[str, Any]) -> TradelineView | None:
+    """Normalize keys and whitespace so audit rules see consistent fields.
+
+    Returns the record's :class:`TradelineView` (``None`` for non-mappings).
+    """
 
     if not isinstance(record, MutableMapping):
-        return
+        return None
 
     staged_updates: Dict[str, Any] = {}
     for key, value in list(record.items()):
@@ -532,6 +799,8 @@ def normalize_tradeline(record: MutableMapping[str, Any]) -> None:
         bureau_value = record["bureau"].strip()
         record["bureau"] = KNOWN_BUREAUS.get(bureau_value.lower(), bureau_value.title())
 
+    return TradelineView.build(record)
+
 
 # ---------------------------------------------------------------------------
 # Rule metadata helpers
@@ -708,8 +977,16 @@ RULE_METADATA: Dict[str, Dict[str, Any]] = {
 
 
 def _attach_violation(
-    record: MutableMapping[str, Any], rule_id: str, title: str, extra: Dict[str, Any] | None = None
+    record: MutableMapping[str, Any],
+    rule_id: str,
+    title: str,
+    extra: Dict[str, Any] | None = None,
+    unique: bool = False,
 ) -> None:
+    """Append a violation for ``rule_id``; with ``unique``, only if the record has none yet."""
+
+    if unique and _has_violation(record, rule_id):
+        return
     meta = RULE_METADATA.get(rule_id, {"severity": "minor", "fcra_section": "FCRA §607(b)"})
     violation = {
         "id": rule_id,
@@ -726,8 +1003,84 @@ def _attach_violation(
     record.setdefault("violations", []).append(violation)
 
 
+class _ViolationIds:
+    """Rule ids seen in one ``violations`` list, indexed up to ``count`` entries."""
+
+    __slots__ = ("violations", "count", "ids")
+
+    def __init__(self, violations: List[Mapping[str, Any]]) -> None:
+        self.violations = violations
+        self.count = 0
+        self.ids: set = set()
+
+    def sync(self) -> set:
+        violations = self.violations
+        if len(violations) < self.count:
+            self.count = 0
+            self.ids = set()
+        for violation in violations[self.count :]:
+            self.ids.add(violation.get("id"))
+        self.count = len(violations)
+        return self.ids
+
+
+# Per-run index of rule ids by ``violations`` list identity, installed by
+# :func:`run_batch_audits`.  Keyed by the list rather than the record so lists
+# shared between records stay in step; entries keep their list alive, so an
+# id is never reused while the run lasts.  Rules only ever append, which is
+# what :meth:`_ViolationIds.sync` relies on.
+_VIOLATION_INDEX: ContextVar[Dict[int, _ViolationIds] | None] = ContextVar(
+    "metro2_violation_index", default=None
+)
+
+
 def _has_violation(record: Mapping[str, Any], rule_id: str) -> bool:
-    return any(v.get("id") == rule_id for v in record.get("violations", []) or [])
+    violations = record.get("violations")
+    if not violations:
+        return False
+    index = _VIOLATION_INDEX.get()
+    if index is None or not isinstance(violations, list):
+        return any(v.get("id") == rule_id for v in violations)
+    entry = index.get(id(violations))
+    if entry is None or entry.violations is not violations:
+        entry = index[id(violations)] = _ViolationIds(violations)
+    return rule_id in entry.sync()
+
+
+# ---------------------------------------------------------------------------
+# Rule registration
+# ---------------------------------------------------------------------------
+
+
+RecordCheck = Callable[[MutableMapping[str, Any], "TradelineView"], None]
+
+
+def per_record_rule(check: RecordCheck) -> Callable[..., None]:
+    """Register ``check(record, view)`` as a rule that looks at one tradeline.
+
+    The decorated name stays a list-level rule, ``rule(tradelines,
+    context=None)``, so it can still be called on its own or from
+    ``AUDIT_FUNCTIONS``.  :func:`run_all_audits` calls ``rule.check`` directly
+    with the views it already built.
+    """
+
+    @wraps(check)
+    def rule(
+        tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+    ) -> None:
+        for record in tradelines:
+            check(record, _view(record, context))
+
+    rule.check = check  # type: ignore[attr-defined]
+    rule.scope = "record"  # type: ignore[attr-defined]
+    return rule
+
+
+def group_rule(rule: Callable[..., None]) -> Callable[..., None]:
+    """Mark ``rule(tradelines, context=None)`` as comparing tradelines with each other."""
+
+    rule.scope = "group"  # type: ignore[attr-defined]
+    return rule
 
 
 # ---------------------------------------------------------------------------
@@ -735,22 +1088,25 @@ def _has_violation(record: Mapping[str, Any], rule_id: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def audit_missing_open_date(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        if not record.get("date_opened"):
-            _attach_violation(record, "MISSING_OPEN_DATE", "Missing Date Opened")
-        if not _normalized_account_number(record):
-            last_reported = record.get("last_reported") or record.get("date_last_reported")
-            if last_reported:
-                _attach_violation(
-                    record,
-                    "missing_account_number",
-                    "Active tradeline missing account number",
-                )
+@per_record_rule
+def audit_missing_open_date(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    if not record.get("date_opened"):
+        _attach_violation(record, "MISSING_OPEN_DATE", "Missing Date Opened")
+    if not _normalized_account_number(record):
+        last_reported = record.get("last_reported") or record.get("date_last_reported")
+        if last_reported:
+            _attach_violation(
+                record,
+                "missing_account_number",
+                "Active tradeline missing account number",
+            )
 
 
-def audit_balance_status_mismatch(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    grouped = group_by_creditor(tradelines)
+@group_rule
+def audit_balance_status_mismatch(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    grouped = _grouped(tradelines, context)
     for records in grouped.values():
         if len(records) < 2:
             continue
@@ -818,11 +1174,11 @@ def audit_balance_status_mismatch(tradelines: Iterable[MutableMapping[str, Any]]
                 )
 
 
-def audit_possible_mismatched_accounts(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    by_creditor: Dict[str, List[MutableMapping[str, Any]]] = defaultdict(list)
-    for record in tradelines:
-        name = (record.get("creditor_name") or "UNKNOWN").strip().upper()
-        by_creditor[name].append(record)
+@group_rule
+def audit_possible_mismatched_accounts(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    by_creditor = context.by_creditor if context is not None else _creditor_buckets(tradelines)
 
     for name, records in by_creditor.items():
         account_numbers = {_normalized_account_number(r) for r in records if _normalized_account_number(r)}
@@ -839,8 +1195,11 @@ def audit_possible_mismatched_accounts(tradelines: Iterable[MutableMapping[str,
             )
 
 
-def audit_payment_history_mismatch(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    grouped = group_by_creditor(tradelines)
+@group_rule
+def audit_payment_history_mismatch(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    grouped = _grouped(tradelines, context)
     for records in grouped.values():
         histories = {str(r.get("payment_status") or "").strip().lower() for r in records if r.get("payment_status")}
         if {"late", "ok"}.issubset({word for hist in histories for word in hist.split()}):
@@ -852,8 +1211,11 @@ def audit_payment_history_mismatch(tradelines: Iterable[MutableMapping[str, Any]
                 )
 
 
-def audit_open_closed_mismatch(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    grouped = group_by_creditor(tradelines)
+@group_rule
+def audit_open_closed_mismatch(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    grouped = _grouped(tradelines, context)
     for records in grouped.values():
         statuses = [str(r.get("account_status") or "").lower() for r in records if r.get("account_status")]
         if statuses and any("closed" in status for status in statuses) and any("open" in status for status in statuses):
@@ -865,8 +1227,11 @@ def audit_open_closed_mismatch(tradelines: Iterable[MutableMapping[str, Any]]) -
                 )
 
 
-def audit_missing_bureau(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    grouped = group_by_creditor(tradelines)
+@group_rule
+def audit_missing_bureau(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    grouped = _grouped(tradelines, context)
     for records in grouped.values():
         bureaus = sorted({r.get("bureau") for r in records if r.get("bureau")})
         if len(bureaus) and len(bureaus) < 3:
@@ -879,23 +1244,27 @@ def audit_missing_bureau(tradelines: Iterable[MutableMapping[str, Any]]) -> None
                 )
 
 
-def audit_stale_data(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        dt_str = record.get("last_reported") or record.get("date_last_reported")
-        if not dt_str:
-            continue
-        try:
-            dt = datetime.strptime(dt_str.strip(), "%m/%d/%Y")
-        except Exception:
-            continue
-        if (datetime.now() - dt).days > 365:
-            _attach_violation(record, "STALE_DATA", "Account not updated in over 12 months")
+@per_record_rule
+def audit_stale_data(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    dt_str = record.get("last_reported") or record.get("date_last_reported")
+    if not dt_str:
+        return
+    try:
+        dt = datetime.strptime(dt_str.strip(), "%m/%d/%Y")
+    except Exception:
+        return
+    if (datetime.now() - dt).days > 365:
+        _attach_violation(record, "STALE_DATA", "Account not updated in over 12 months")
 
 
-def audit_duplicate_accounts(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@group_rule
+def audit_duplicate_accounts(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
     seen: Dict[tuple, Mapping[str, Any]] = {}
     for record in tradelines:
-        key = (record.get("bureau"), _normalized_account_number(record))
+        view = _view(record, context)
+        key = (record.get("bureau"), view.account_number)
         if key in seen and key[1]:
             _attach_violation(
                 record,
@@ -906,25 +1275,28 @@ def audit_duplicate_accounts(tradelines: Iterable[MutableMapping[str, Any]]) ->
             seen[key] = record
 
 
-def audit_reaged_accounts(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        last_payment_ref = record.get("date_of_last_payment")
-        if not last_payment_ref:
-            continue
-        try:
-            dt = datetime.strptime(last_payment_ref.strip(), "%m/%d/%Y")
-        except Exception:
-            continue
-        if (datetime.now() - dt).days < 180:
-            _attach_violation(
-                record,
-                "RECENT_LAST_PAYMENT_WITHOUT_PROOF",
-                "Date of Last Payment is less than 6 months ago — possible re-aging",
-            )
+@per_record_rule
+def audit_reaged_accounts(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    last_payment_ref = record.get("date_of_last_payment")
+    if not last_payment_ref:
+        return
+    try:
+        dt = datetime.strptime(last_payment_ref.strip(), "%m/%d/%Y")
+    except Exception:
+        return
+    if (datetime.now() - dt).days < 180:
+        _attach_violation(
+            record,
+            "RECENT_LAST_PAYMENT_WITHOUT_PROOF",
+            "Date of Last Payment is less than 6 months ago — possible re-aging",
+        )
 
 
-def audit_account_type_mismatch(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    grouped = group_by_creditor(tradelines)
+@group_rule
+def audit_account_type_mismatch(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
+    grouped = _grouped(tradelines, context)
     for records in grouped.values():
         types = {str(r.get("account_type") or "").strip().lower() for r in records if r.get("account_type")}
         if len(types) > 1:
@@ -936,292 +1308,308 @@ def audit_account_type_mismatch(tradelines: Iterable[MutableMapping[str, Any]])
                 )
 
 
-def audit_high_utilization(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        balance = clean_amount(record.get("balance"))
-        limit = clean_amount(record.get("credit_limit"))
-        if limit > 0 and (balance / limit) > 0.9:
-            _attach_violation(
-                record,
-                "HIGH_UTILIZATION",
-                "Account balance exceeds 90% of limit",
-            )
+@per_record_rule
+def audit_high_utilization(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    balance = view.balance
+    limit = view.credit_limit
+    if limit > 0 and (balance / limit) > 0.9:
+        _attach_violation(
+            record,
+            "HIGH_UTILIZATION",
+            "Account balance exceeds 90% of limit",
+        )
 
 
-def audit_stale_disputes(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        comment = str(record.get("comments") or "").lower()
-        if "dispute" in comment and "resolved" not in comment:
-            _attach_violation(
-                record,
-                "DISPUTE_PENDING_TOO_LONG",
-                "Dispute notation present without resolution",
-            )
+@per_record_rule
+def audit_stale_disputes(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    comment = str(record.get("comments") or "").lower()
+    if "dispute" in comment and "resolved" not in comment:
+        _attach_violation(
+            record,
+            "DISPUTE_PENDING_TOO_LONG",
+            "Dispute notation present without resolution",
+        )
 
 
-def audit_last_payment_integrity(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@per_record_rule
+def audit_last_payment_integrity(record: MutableMapping[str, Any], view: TradelineView) -> None:
     delinquency_keywords = ("late", "collection", "charge", "derog")
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        payment_status = _normalize_status(record.get("payment_status"))
-        last_payment_ref = _get_last_payment_reference(record)
-        past_due_date = _get_past_due_date(record)
+    status = view.status
+    payment_status = view.payment_status
+    last_payment_ref = view.last_payment_ref
+    past_due_date = view.past_due_date
+
+    bucket = view.bucket or ""
+    is_delinquent = (
+        any(keyword in status for keyword in delinquency_keywords)
+        or any(keyword in payment_status for keyword in delinquency_keywords)
+        or bucket == "collection"
+    )
 
-        bucket = _account_type_bucket(record) or ""
-        is_delinquent = (
-            any(keyword in status for keyword in delinquency_keywords)
-            or any(keyword in payment_status for keyword in delinquency_keywords)
-            or bucket == "collection"
+    if is_delinquent and not last_payment_ref:
+        _attach_violation(
+            record,
+            "missing_last_payment_date",
+            "Missing Date of Last Payment on derogatory account",
+        )
+        return
+
+    if last_payment_ref and past_due_date and last_payment_ref > past_due_date:
+        _attach_violation(
+            record,
+            "fcra_last_payment_invalid",
+            "Date of Last Payment occurs after the first reported delinquency date",
         )
+        return
 
-        if is_delinquent and not last_payment_ref:
+    grid = _payment_grid(record)
+    if last_payment_ref and grid is not None:
+        first_delinquency = grid.first_delinquency_month(DEROGATORY)
+        if first_delinquency and (last_payment_ref.year, last_payment_ref.month) > (
+            first_delinquency.year,
+            first_delinquency.month,
+        ):
             _attach_violation(
                 record,
-                "missing_last_payment_date",
-                "Missing Date of Last Payment on derogatory account",
+                "fcra_last_payment_invalid",
+                "Date of Last Payment post-dates the first delinquency in payment history",
             )
-            continue
-
-        if last_payment_ref and past_due_date and last_payment_ref > past_due_date:
+    elif last_payment_ref:
+        delinquency_dates = []
+        for entry in _payment_history_entries(record):
+            hist_status = _normalize_status(entry.get("status"))
+            if any(keyword in hist_status for keyword in delinquency_keywords):
+                hist_date = parse_date(entry.get("date"))
+                if hist_date:
+                    delinquency_dates.append(hist_date)
+        if delinquency_dates and last_payment_ref > min(delinquency_dates):
             _attach_violation(
                 record,
                 "fcra_last_payment_invalid",
-                "Date of Last Payment occurs after the first reported delinquency date",
+                "Date of Last Payment post-dates the first delinquency in payment history",
             )
-            continue
 
-        if last_payment_ref:
-            delinquency_dates = []
-            for entry in _payment_history_entries(record):
-                hist_status = _normalize_status(entry.get("status"))
-                if any(keyword in hist_status for keyword in delinquency_keywords):
-                    hist_date = parse_date(entry.get("date"))
-                    if hist_date:
-                        delinquency_dates.append(hist_date)
-            if delinquency_dates and last_payment_ref > min(delinquency_dates):
-                _attach_violation(
-                    record,
-                    "fcra_last_payment_invalid",
-                    "Date of Last Payment post-dates the first delinquency in payment history",
-                )
 
+@per_record_rule
+def audit_collection_status_inconsistent(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    bucket = view.bucket
+    balance = view.balance
 
-def audit_collection_status_inconsistent(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        bucket = _account_type_bucket(record)
-        balance = clean_amount(record.get("balance"))
+    if bucket == "collection" and "open" in status and balance > 0:
+        _attach_violation(
+            record,
+            "collection_status_inconsistent",
+            "Collection account reported as open with an active balance",
+        )
 
-        if bucket == "collection" and "open" in status and balance > 0:
-            _attach_violation(
-                record,
-                "collection_status_inconsistent",
-                "Collection account reported as open with an active balance",
-            )
 
+@per_record_rule
+def audit_balance_status_conflict(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    payment_status = view.payment_status
+    balance = view.balance
 
-def audit_balance_status_conflict(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        payment_status = _normalize_status(record.get("payment_status"))
-        balance = clean_amount(record.get("balance"))
+    derogatory = any(keyword in status for keyword in ("late", "collection", "charge", "delin"))
+    derogatory = derogatory or any(keyword in payment_status for keyword in ("late", "collection", "charge", "delin"))
+
+    paid_or_closed = any(keyword in status for keyword in ("paid", "closed", "settled", "paid in full"))
+    paid_or_closed = paid_or_closed or any(keyword in payment_status for keyword in ("paid", "closed", "settled"))
+
+    if balance == 0 and derogatory:
+        _attach_violation(
+            record,
+            "balance_status_conflict",
+            "Zero balance conflicts with delinquent status",
+        )
 
-        derogatory = any(keyword in status for keyword in ("late", "collection", "charge", "delin"))
-        derogatory = derogatory or any(keyword in payment_status for keyword in ("late", "collection", "charge", "delin"))
+    if balance > 0 and paid_or_closed:
+        _attach_violation(
+            record,
+            "balance_status_conflict",
+            "Positive balance reported alongside a paid/closed status",
+        )
 
-        paid_or_closed = any(keyword in status for keyword in ("paid", "closed", "settled", "paid in full"))
-        paid_or_closed = paid_or_closed or any(keyword in payment_status for keyword in ("paid", "closed", "settled"))
 
-        if balance == 0 and derogatory:
+@per_record_rule
+def audit_factual_disputes(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = _normalize_status(record.get("account_status"))
+    payment_status = _normalize_status(record.get("payment_status"))
+    balance = clean_amount(record.get("balance"))
+    chargeoff_date = _get_chargeoff_date(record)
+    last_payment = _get_last_payment_date(record)
+    last_payment_ref = _get_last_payment_reference(record)
+    date_opened = parse_date(record.get("date_opened"))
+    last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
+    dispute_date = _get_dispute_date(record)
+
+    if chargeoff_date and balance > 0 and ("charge" in status or "charge" in payment_status):
+        post_chargeoff_activity = []
+        for entry in _payment_history_entries(record):
+            hist_date = parse_date(entry.get("date"))
+            if hist_date and hist_date > chargeoff_date:
+                post_chargeoff_activity.append(hist_date)
+        has_post_chargeoff_payment = last_payment and last_payment > chargeoff_date
+        if not post_chargeoff_activity and not has_post_chargeoff_payment:
             _attach_violation(
                 record,
-                "balance_status_conflict",
-                "Zero balance conflicts with delinquent status",
+                "balance_reporting_without_post_chargeoff_activity",
+                "Balance reported after charge-off without post-charge-off activity",
             )
 
-        if balance > 0 and paid_or_closed:
+    if "open" in status and (
+        any(keyword in payment_status for keyword in ("collection", "charge"))
+        or "collection" in status
+        or _account_type_bucket(record) == "collection"
+    ):
+        _attach_violation(
+            record,
+            "open_account_reported_in_collection",
+            "Account reported as open while also marked for collection/charge-off",
+        )
+
+    if last_payment_ref and date_opened and last_payment_ref < date_opened:
+        if not _has_violation(record, "DATE_ORDER_SANITY"):
             _attach_violation(
                 record,
-                "balance_status_conflict",
-                "Positive balance reported alongside a paid/closed status",
+                "last_payment_precedes_date_opened",
+                "Date of Last Payment precedes Date Opened",
             )
 
+    if _payment_history_has_late(record) and (
+        "current" in status or "current" in payment_status
+    ):
+        _attach_violation(
+            record,
+            "payment_history_status_conflict",
+            "Payment history shows late activity while account is reported current",
+        )
 
-def audit_factual_disputes(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        payment_status = _normalize_status(record.get("payment_status"))
-        balance = clean_amount(record.get("balance"))
-        chargeoff_date = _get_chargeoff_date(record)
-        last_payment = _get_last_payment_date(record)
-        last_payment_ref = _get_last_payment_reference(record)
-        date_opened = parse_date(record.get("date_opened"))
-        last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
-        dispute_date = _get_dispute_date(record)
-
-        if chargeoff_date and balance > 0 and ("charge" in status or "charge" in payment_status):
-            post_chargeoff_activity = []
-            for entry in _payment_history_entries(record):
-                hist_date = parse_date(entry.get("date"))
-                if hist_date and hist_date > chargeoff_date:
-                    post_chargeoff_activity.append(hist_date)
-            has_post_chargeoff_payment = last_payment and last_payment > chargeoff_date
-            if not post_chargeoff_activity and not has_post_chargeoff_payment:
-                _attach_violation(
-                    record,
-                    "balance_reporting_without_post_chargeoff_activity",
-                    "Balance reported after charge-off without post-charge-off activity",
-                )
-
-        if "open" in status and (
-            any(keyword in payment_status for keyword in ("collection", "charge"))
+    if _has_prior_dispute(record) and dispute_date and last_reported and last_reported > dispute_date:
+        material_fields_changed = record.get("material_fields_changed")
+        if material_fields_changed is None:
+            material_fields_changed = record.get("material_fields_change") or record.get("material_fields_updated")
+        if _falseyish(material_fields_changed):
+            _attach_violation(
+                record,
+                "post_dispute_update_no_correction",
+                "Account updated after dispute with no material corrections noted",
+            )
+
+    reaging_flag = None
+    for key in (
+        "date_of_last_payment_changed",
+        "date_last_payment_changed",
+        "last_payment_changed",
+        "date_of_first_delinquency_changed",
+        "date_first_delinquency_changed",
+        "dofd_changed",
+        "changed_after_collection",
+    ):
+        if key in record:
+            reaging_flag = record.get(key)
+            break
+    if reaging_flag is not None and _boolish(reaging_flag):
+        bucket = _account_type_bucket(record)
+        if (
+            bucket == "collection"
             or "collection" in status
-            or _account_type_bucket(record) == "collection"
+            or any(keyword in payment_status for keyword in ("collection", "charge"))
         ):
             _attach_violation(
                 record,
-                "open_account_reported_in_collection",
-                "Account reported as open while also marked for collection/charge-off",
+                "collection_reaging_detected",
+                "Collection account indicates a changed Date of Last Payment after entering collection",
             )
 
-        if last_payment_ref and date_opened and last_payment_ref < date_opened:
-            if not _has_violation(record, "DATE_ORDER_SANITY"):
-                _attach_violation(
-                    record,
-                    "last_payment_precedes_date_opened",
-                    "Date of Last Payment precedes Date Opened",
-                )
-
-        if _payment_history_has_late(record) and (
-            "current" in status or "current" in payment_status
-        ):
+    consumer_assertion = _normalize_status(record.get("consumer_assertion") or record.get("consumer_assertions"))
+    if consumer_assertion in {"not_mine", "not my account", "not my", "notmine"}:
+        ownership_proof = (
+            record.get("ownership_proof")
+            or record.get("ownership_verification")
+            or record.get("ownership_documents")
+        )
+        if not ownership_proof:
             _attach_violation(
                 record,
-                "payment_history_status_conflict",
-                "Payment history shows late activity while account is reported current",
+                "consumer_denies_account_ownership",
+                "Consumer disputes ownership without supporting verification",
             )
 
-        if _has_prior_dispute(record) and dispute_date and last_reported and last_reported > dispute_date:
-            material_fields_changed = record.get("material_fields_changed")
-            if material_fields_changed is None:
-                material_fields_changed = record.get("material_fields_change") or record.get("material_fields_updated")
-            if _falseyish(material_fields_changed):
-                _attach_violation(
-                    record,
-                    "post_dispute_update_no_correction",
-                    "Account updated after dispute with no material corrections noted",
-                )
 
-        reaging_flag = None
-        for key in (
-            "date_of_last_payment_changed",
-            "date_last_payment_changed",
-            "last_payment_changed",
-            "date_of_first_delinquency_changed",
-            "date_first_delinquency_changed",
-            "dofd_changed",
-            "changed_after_collection",
-        ):
-            if key in record:
-                reaging_flag = record.get(key)
-                break
-        if reaging_flag is not None and _boolish(reaging_flag):
-            bucket = _account_type_bucket(record)
-            if (
-                bucket == "collection"
-                or "collection" in status
-                or any(keyword in payment_status for keyword in ("collection", "charge"))
-            ):
-                _attach_violation(
-                    record,
-                    "collection_reaging_detected",
-                    "Collection account indicates a changed Date of Last Payment after entering collection",
-                )
+@per_record_rule
+def audit_comment_field_conflict(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    comment = _normalize_status(record.get("comments") or record.get("special_comment"))
+    if not comment:
+        return
 
-        consumer_assertion = _normalize_status(record.get("consumer_assertion") or record.get("consumer_assertions"))
-        if consumer_assertion in {"not_mine", "not my account", "not my", "notmine"}:
-            ownership_proof = (
-                record.get("ownership_proof")
-                or record.get("ownership_verification")
-                or record.get("ownership_documents")
-            )
-            if not ownership_proof:
-                _attach_violation(
-                    record,
-                    "consumer_denies_account_ownership",
-                    "Consumer disputes ownership without supporting verification",
-                )
+    bucket = view.bucket
+    balance = view.balance
 
+    if "collection" in comment and bucket != "collection":
+        _attach_violation(
+            record,
+            "comment_field_conflict",
+            "Comments indicate collection activity but account type is not collection",
+        )
 
-def audit_comment_field_conflict(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        comment = _normalize_status(record.get("comments") or record.get("special_comment"))
-        if not comment:
-            continue
+    paid_match = re.search(r'(?<![a-z])paid', comment) or "paid in full" in comment or "settled" in comment
+    if paid_match and balance > 0:
+        _attach_violation(
+            record,
+            "comment_field_conflict",
+            "Comments indicate paid status while balance remains outstanding",
+        )
 
-        bucket = _account_type_bucket(record)
-        balance = clean_amount(record.get("balance"))
 
-        if "collection" in comment and bucket != "collection":
-            _attach_violation(
-                record,
-                "comment_field_conflict",
-                "Comments indicate collection activity but account type is not collection",
-            )
+@per_record_rule
+def audit_collection_high_credit(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    bucket = view.bucket
+    if bucket != "collection":
+        return
+    balance = view.balance
+    high_credit = view.high_credit
+    if balance > 0 and high_credit > 0 and abs(high_credit - balance) < 0.01:
+        _attach_violation(
+            record,
+            "high_credit_equals_balance",
+            "Collection account reports High Credit equal to current balance",
+        )
 
-        paid_match = re.search(r'(?<![a-z])paid', comment) or "paid in full" in comment or "settled" in comment
-        if paid_match and balance > 0:
-            _attach_violation(
-                record,
-                "comment_field_conflict",
-                "Comments indicate paid status while balance remains outstanding",
-            )
 
+@per_record_rule
+def audit_chargeoff_continues_reporting(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    payment_status = view.payment_status
+    if "charge" not in status and "charge" not in payment_status:
+        return
 
-def audit_collection_high_credit(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        bucket = _account_type_bucket(record)
-        if bucket != "collection":
-            continue
-        balance = clean_amount(record.get("balance"))
-        high_credit = clean_amount(record.get("high_credit"))
-        if balance > 0 and high_credit > 0 and abs(high_credit - balance) < 0.01:
-            _attach_violation(
-                record,
-                "high_credit_equals_balance",
-                "Collection account reports High Credit equal to current balance",
-            )
+    chargeoff_date = _get_chargeoff_date(record)
+    if not chargeoff_date:
+        return
 
+    post_charge_history = []
+    for entry in _payment_history_entries(record):
+        hist_date = parse_date(entry.get("date"))
+        if hist_date and hist_date > chargeoff_date:
+            post_charge_history.append(hist_date)
 
-def audit_chargeoff_continues_reporting(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        payment_status = _normalize_status(record.get("payment_status"))
-        if "charge" not in status and "charge" not in payment_status:
-            continue
-
-        chargeoff_date = _get_chargeoff_date(record)
-        if not chargeoff_date:
-            continue
-
-        post_charge_history = []
-        for entry in _payment_history_entries(record):
-            hist_date = parse_date(entry.get("date"))
-            if hist_date and hist_date > chargeoff_date:
-                post_charge_history.append(hist_date)
-
-        if len(post_charge_history) >= 2:
-            _attach_violation(
-                record,
-                "chargeoff_continues_reporting",
-                "Charge-off continues to update after charge-off date",
-            )
+    if len(post_charge_history) >= 2:
+        _attach_violation(
+            record,
+            "chargeoff_continues_reporting",
+            "Charge-off continues to update after charge-off date",
+        )
 
 
-def audit_duplicate_collection_accounts(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@group_rule
+def audit_duplicate_collection_accounts(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
     grouped: Dict[tuple, List[MutableMapping[str, Any]]] = defaultdict(list)
     for record in tradelines:
-        if _account_type_bucket(record) != "collection":
+        view = _view(record, context)
+        if view.bucket != "collection":
             continue
 
         original_creditor = (
@@ -1233,7 +1621,7 @@ def audit_duplicate_collection_accounts(tradelines: Iterable[MutableMapping[str,
         if not original_creditor:
             continue
 
-        balance = clean_amount(record.get("balance"))
+        balance = view.balance
         if balance <= 0:
             continue
 
@@ -1255,10 +1643,14 @@ def audit_duplicate_collection_accounts(tradelines: Iterable[MutableMapping[str,
                 )
 
 
-def audit_furnisher_identity_unclear(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@group_rule
+def audit_furnisher_identity_unclear(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
     grouped: Dict[str, List[MutableMapping[str, Any]]] = defaultdict(list)
     for record in tradelines:
-        account_number = _normalized_account_number(record)
+        view = _view(record, context)
+        account_number = view.account_number
         if not account_number:
             continue
         grouped[account_number].append(record)
@@ -1278,261 +1670,256 @@ def audit_furnisher_identity_unclear(tradelines: Iterable[MutableMapping[str, An
                 )
 
 
-def audit_missing_payment_date(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        payment_status = _normalize_status(record.get("payment_status"))
-        status = _normalize_status(record.get("account_status"))
-        comments = _normalize_status(record.get("comments"))
+@per_record_rule
+def audit_missing_payment_date(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    payment_status = view.payment_status
+    status = view.status
+    comments = _normalize_status(record.get("comments"))
 
-        last_payment = _get_last_payment_date(record)
+    last_payment = view.last_payment
 
-        date_opened = parse_date(record.get("date_opened"))
-        date_closed = parse_date(record.get("date_closed") or record.get("date_of_closing"))
-        chargeoff_date = _get_chargeoff_date(record)
-        last_payment_ref = _get_last_payment_reference(record)
-        payoff_date = _get_payoff_date(record)
-        last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
-        past_due_date = _get_past_due_date(record)
+    date_opened = view.date_opened
+    date_closed = parse_date(record.get("date_closed") or record.get("date_of_closing"))
+    chargeoff_date = _get_chargeoff_date(record)
+    last_payment_ref = view.last_payment_ref
+    payoff_date = _get_payoff_date(record)
+    last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
+    past_due_date = view.past_due_date
 
-        balance = clean_amount(record.get("balance"))
-        past_due = clean_amount(record.get("past_due") or record.get("amount_past_due"))
+    balance = view.balance
+    past_due = clean_amount(record.get("past_due") or record.get("amount_past_due"))
 
-        delinquency_markers = ("late", "collection", "charge", "delin", "repos", "derog")
-        is_delinquent = any(marker in status for marker in delinquency_markers) or any(
-            marker in payment_status for marker in delinquency_markers
+    delinquency_markers = ("late", "collection", "charge", "delin", "repos", "derog")
+    is_delinquent = any(marker in status for marker in delinquency_markers) or any(
+        marker in payment_status for marker in delinquency_markers
+    )
+    is_delinquent = is_delinquent or any(marker in comments for marker in delinquency_markers)
+    if is_delinquent and not last_payment and not _has_violation(record, "missing_last_payment_date"):
+        _attach_violation(
+            record,
+            "missing_last_payment_date",
+            "Delinquent account missing a Date of Last Payment",
         )
-        is_delinquent = is_delinquent or any(marker in comments for marker in delinquency_markers)
-        if is_delinquent and not last_payment and not _has_violation(record, "missing_last_payment_date"):
-            _attach_violation(
-                record,
-                "missing_last_payment_date",
-                "Delinquent account missing a Date of Last Payment",
-            )
-
-        # Existing guard: Charged-off accounts should carry a payment date to validate charge-off timing.
-        if "charge" in payment_status and not last_payment and not _has_violation(record, "missing_last_payment_date"):
-            _attach_violation(
-                record,
-                "MISSING_LAST_PAYMENT_DATE",
-                "Charged-off account missing last payment date",
-            )
 
-        # Baseline reporting integrity for Last Reported date.
-        last_reported_raw = record.get("last_reported") or record.get("date_last_reported")
-        if not last_reported_raw:
-            _attach_violation(
-                record,
-                "REPORT_DATE_MISSING_OR_INVALID",
-                "Missing Last Reported date",
-            )
-        elif last_reported and last_reported > today():
-            _attach_violation(
-                record,
-                "REPORT_DATE_MISSING_OR_INVALID",
-                "Last Reported date cannot be in the future",
-            )
-        elif last_reported_raw and not last_reported:
-            _attach_violation(
-                record,
-                "REPORT_DATE_MISSING_OR_INVALID",
-                "Last Reported date is invalid",
-            )
+    # Existing guard: Charged-off accounts should carry a payment date to validate charge-off timing.
+    if "charge" in payment_status and not last_payment and not _has_violation(record, "missing_last_payment_date"):
+        _attach_violation(
+            record,
+            "MISSING_LAST_PAYMENT_DATE",
+            "Charged-off account missing last payment date",
+        )
 
-        # A. Payment cannot precede the account being opened.
-        if last_payment and date_opened and last_payment < date_opened:
-            if not _has_violation(record, "last_payment_precedes_date_opened") and not _has_violation(record, "DATE_ORDER_SANITY"):
-                _attach_violation(
-                    record,
-                    "ACCOUNT_OPENED_AFTER_LAST_PAYMENT_DATE",
-                    "Last payment predates Date Opened",
-                )
+    # Baseline reporting integrity for Last Reported date.
+    last_reported_raw = record.get("last_reported") or record.get("date_last_reported")
+    if not last_reported_raw:
+        _attach_violation(
+            record,
+            "REPORT_DATE_MISSING_OR_INVALID",
+            "Missing Last Reported date",
+        )
+    elif last_reported and last_reported > today():
+        _attach_violation(
+            record,
+            "REPORT_DATE_MISSING_OR_INVALID",
+            "Last Reported date cannot be in the future",
+        )
+    elif last_reported_raw and not last_reported:
+        _attach_violation(
+            record,
+            "REPORT_DATE_MISSING_OR_INVALID",
+            "Last Reported date is invalid",
+        )
 
-        # B. Payment cannot occur after closure (unless supported by re-open data).
-        if last_payment and date_closed and last_payment > date_closed:
+    # A. Payment cannot precede the account being opened.
+    if last_payment and date_opened and last_payment < date_opened:
+        if not _has_violation(record, "last_payment_precedes_date_opened") and not _has_violation(record, "DATE_ORDER_SANITY"):
             _attach_violation(
                 record,
-                "PAYMENT_REPORTED_AFTER_CLOSURE",
-                "Payment reported after the account was closed",
+                "ACCOUNT_OPENED_AFTER_LAST_PAYMENT_DATE",
+                "Last payment predates Date Opened",
             )
 
-        # C. Payment date cannot be in the future.
-        if last_payment and last_payment > today():
-            _attach_violation(
-                record,
-                "INACCURATE_LAST_PAYMENT_DATE",
-                "Last payment date is in the future",
-            )
+    # B. Payment cannot occur after closure (unless supported by re-open data).
+    if last_payment and date_closed and last_payment > date_closed:
+        _attach_violation(
+            record,
+            "PAYMENT_REPORTED_AFTER_CLOSURE",
+            "Payment reported after the account was closed",
+        )
 
-        # D. Charged-off or collection accounts should not have new payments after charge-off.
-        if last_payment and chargeoff_date and ("charge" in status or "collection" in status):
-            if last_payment > chargeoff_date:
-                _attach_violation(
-                    record,
-                    "LAST_PAYMENT_AFTER_CHARGEOFF_DATE",
-                    "Payment activity reported after charge-off date",
-                )
+    # C. Payment date cannot be in the future.
+    if last_payment and last_payment > today():
+        _attach_violation(
+            record,
+            "INACCURATE_LAST_PAYMENT_DATE",
+            "Last payment date is in the future",
+        )
 
-        # E. Accounts reported as "Current" but have no last payment date at all.
-        if "current" in status and not last_payment:
+    # D. Charged-off or collection accounts should not have new payments after charge-off.
+    if last_payment and chargeoff_date and ("charge" in status or "collection" in status):
+        if last_payment > chargeoff_date:
             _attach_violation(
                 record,
-                "CURRENT_NO_LAST_PAYMENT_DATE",
-                "Current status lacks a Date of Last Payment",
+                "LAST_PAYMENT_AFTER_CHARGEOFF_DATE",
+                "Payment activity reported after charge-off date",
             )
 
-        # F. Accounts marked "Paid/Closed/Settled" should include a final payment date.
-        if not last_payment and any(keyword in status for keyword in ("paid", "closed", "settled")):
-            if not _has_violation(record, "MISSING_LAST_PAYMENT_DATE"):
-                _attach_violation(
-                    record,
-                    "MISSING_LAST_PAYMENT_DATE_FOR_PAID",
-                    "Closed/paid account missing last payment date",
-                )
+    # E. Accounts reported as "Current" but have no last payment date at all.
+    if "current" in status and not last_payment:
+        _attach_violation(
+            record,
+            "CURRENT_NO_LAST_PAYMENT_DATE",
+            "Current status lacks a Date of Last Payment",
+        )
 
-        # G. Non-zero balance but ancient or missing last payment.
-        if balance > 0 and (not last_payment or (last_payment and is_stale(last_payment, years=3))):
+    # F. Accounts marked "Paid/Closed/Settled" should include a final payment date.
+    if not last_payment and any(keyword in status for keyword in ("paid", "closed", "settled")):
+        if not _has_violation(record, "MISSING_LAST_PAYMENT_DATE"):
             _attach_violation(
                 record,
-                "STALE_ACTIVE_REPORTING",
-                "Active balance without recent payment activity",
+                "MISSING_LAST_PAYMENT_DATE_FOR_PAID",
+                "Closed/paid account missing last payment date",
             )
 
-        # H. Past-due amount exists but last payment date missing.
-        if past_due > 0 and not last_payment:
-            _attach_violation(
-                record,
-                "PASTDUE_NO_LAST_PAYMENT_DATE",
-                "Past-due balance reported without a last payment date",
-            )
+    # G. Non-zero balance but ancient or missing last payment.
+    if balance > 0 and (not last_payment or (last_payment and is_stale(last_payment, years=3))):
+        _attach_violation(
+            record,
+            "STALE_ACTIVE_REPORTING",
+            "Active balance without recent payment activity",
+        )
 
-        # I. Payment after balance already zeroed (requires payoff date signal).
-        if balance == 0 and payoff_date and last_payment and last_payment > payoff_date:
-            _attach_violation(
-                record,
-                "PAYMENT_AFTER_PAYOFF_DATE",
-                "Payment reported after payoff date",
-            )
+    # H. Past-due amount exists but last payment date missing.
+    if past_due > 0 and not last_payment:
+        _attach_violation(
+            record,
+            "PASTDUE_NO_LAST_PAYMENT_DATE",
+            "Past-due balance reported without a last payment date",
+        )
 
-        # J. Last payment cannot be after the Date of Last Payment reference on charge-offs.
-        if last_payment and last_payment_ref and ("charge" in status or "collection" in status):
-            if last_payment > last_payment_ref:
-                _attach_violation(
-                    record,
-                    "LAST_PAYMENT_AFTER_DATE_OF_LAST_PAYMENT",
-                    "Last payment date conflicts with Date of Last Payment",
-                )
+    # I. Payment after balance already zeroed (requires payoff date signal).
+    if balance == 0 and payoff_date and last_payment and last_payment > payoff_date:
+        _attach_violation(
+            record,
+            "PAYMENT_AFTER_PAYOFF_DATE",
+            "Payment reported after payoff date",
+        )
 
-        # K. Last payment should not post after the Last Reported date.
-        if last_payment and last_reported and last_payment > last_reported and not _has_violation(
-            record, "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY"
-        ):
+    # J. Last payment cannot be after the Date of Last Payment reference on charge-offs.
+    if last_payment and last_payment_ref and ("charge" in status or "collection" in status):
+        if last_payment > last_payment_ref:
             _attach_violation(
                 record,
-                "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
-                "Payment reported after Last Reported date",
+                "LAST_PAYMENT_AFTER_DATE_OF_LAST_PAYMENT",
+                "Last payment date conflicts with Date of Last Payment",
             )
 
-        if date_closed and last_reported and date_closed > last_reported and not _has_violation(
-            record, "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY"
-        ):
-            _attach_violation(
-                record,
-                "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
-                "Closure date reported after last update",
-            )
+    # K. Last payment should not post after the Last Reported date.
+    if last_payment and last_reported and last_payment > last_reported:
+        _attach_violation(
+            record,
+            "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
+            "Payment reported after Last Reported date",
+            unique=True,
+        )
 
-        if chargeoff_date and last_reported and chargeoff_date > last_reported and not _has_violation(
-            record, "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY"
-        ):
-            _attach_violation(
-                record,
-                "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
-                "Charge-off date occurs after last reported timestamp",
-            )
+    if date_closed and last_reported and date_closed > last_reported:
+        _attach_violation(
+            record,
+            "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
+            "Closure date reported after last update",
+            unique=True,
+        )
 
-        # L. If payment posts after the Date of Last Payment reference, the account should have cured the delinquency.
-        if (
-            last_payment
-            and last_payment_ref
-            and last_payment > last_payment_ref
-            and not _has_violation(record, "LAST_PAYMENT_AFTER_DATE_OF_LAST_PAYMENT")
-        ):
-            _attach_violation(
-                record,
-                "PAYMENT_AFTER_LAST_PAYMENT_REFERENCE_IMPLIES_CURE",
-                "Last payment posted after Date of Last Payment but delinquency persists",
-            )
+    if chargeoff_date and last_reported and chargeoff_date > last_reported:
+        _attach_violation(
+            record,
+            "MISMATCH_LAST_REPORTED_BEFORE_ACTIVITY",
+            "Charge-off date occurs after last reported timestamp",
+            unique=True,
+        )
 
-        # M. No payment activity for 5+ years but status still active.
-        if last_payment and any(keyword in status for keyword in ("current", "late")):
-            if is_stale(last_payment, years=5):
-                _attach_violation(
-                    record,
-                    "STAGNANT_ACCOUNT_NOT_UPDATED",
-                    "Account active with no payment for 5+ years",
-                )
+    # L. If payment posts after the Date of Last Payment reference, the account should have cured the delinquency.
+    if (
+        last_payment
+        and last_payment_ref
+        and last_payment > last_payment_ref
+        and not _has_violation(record, "LAST_PAYMENT_AFTER_DATE_OF_LAST_PAYMENT")
+    ):
+        _attach_violation(
+            record,
+            "PAYMENT_AFTER_LAST_PAYMENT_REFERENCE_IMPLIES_CURE",
+            "Last payment posted after Date of Last Payment but delinquency persists",
+        )
 
-        # N. Current status but last payment older than 120 days.
-        if last_payment and "current" in status and days_since(last_payment) > 120:
+    # M. No payment activity for 5+ years but status still active.
+    if last_payment and any(keyword in status for keyword in ("current", "late")):
+        if is_stale(last_payment, years=5):
             _attach_violation(
                 record,
-                "PAYMENT_STALENESS_INCONSISTENT_WITH_STATUS",
-                "Current account with stale last payment date",
+                "STAGNANT_ACCOUNT_NOT_UPDATED",
+                "Account active with no payment for 5+ years",
             )
 
-        if last_payment and any(keyword in status for keyword in ("open", "current", "active")):
-            if is_stale(last_payment, years=3):
-                _attach_violation(
-                    record,
-                    "NO_ACTIVITY_TOO_LONG_ACTIVE",
-                    "Active account shows no payment activity for 36+ months",
-                )
+    # N. Current status but last payment older than 120 days.
+    if last_payment and "current" in status and days_since(last_payment) > 120:
+        _attach_violation(
+            record,
+            "PAYMENT_STALENESS_INCONSISTENT_WITH_STATUS",
+            "Current account with stale last payment date",
+        )
 
-        if past_due_date and date_closed and past_due_date > date_closed:
+    if last_payment and any(keyword in status for keyword in ("open", "current", "active")):
+        if is_stale(last_payment, years=3):
             _attach_violation(
                 record,
-                "PAST_DUE_AFTER_CLOSURE_DATE",
-                "Past-due timestamp extends beyond closure",
+                "NO_ACTIVITY_TOO_LONG_ACTIVE",
+                "Active account shows no payment activity for 36+ months",
             )
 
-        if chargeoff_date and date_opened and date_opened > chargeoff_date:
-            _attach_violation(
-                record,
-                "DATE_OPENED_AFTER_CHARGEOFF",
-                "Date Opened occurs after charge-off date",
-            )
+    if past_due_date and date_closed and past_due_date > date_closed:
+        _attach_violation(
+            record,
+            "PAST_DUE_AFTER_CLOSURE_DATE",
+            "Past-due timestamp extends beyond closure",
+        )
 
-        if date_closed and last_payment_ref and date_closed == last_payment_ref:
-            _attach_violation(
-                record,
-                "CLOSURE_DATE_EQUALS_LAST_PAYMENT",
-                "Closure date matches Date of Last Payment, which is illogical",
-            )
+    if chargeoff_date and date_opened and date_opened > chargeoff_date:
+        _attach_violation(
+            record,
+            "DATE_OPENED_AFTER_CHARGEOFF",
+            "Date Opened occurs after charge-off date",
+        )
 
-        if last_payment_ref and last_payment and last_payment_ref > last_payment and not _has_violation(
-            record, "DATE_OF_LAST_PAYMENT_AFTER_LAST_PAYMENT"
-        ):
-            _attach_violation(
-                record,
-                "DATE_OF_LAST_PAYMENT_AFTER_LAST_PAYMENT",
-                "Date of Last Payment occurs after the last payment date",
-            )
+    if date_closed and last_payment_ref and date_closed == last_payment_ref:
+        _attach_violation(
+            record,
+            "CLOSURE_DATE_EQUALS_LAST_PAYMENT",
+            "Closure date matches Date of Last Payment, which is illogical",
+        )
 
-        if payoff_date and last_payment and last_payment > payoff_date and not _has_violation(
-            record, "PAYMENT_AFTER_PAYOFF_DATE"
-        ):
-            _attach_violation(
-                record,
-                "PAYMENT_AFTER_PAYOFF_DATE",
-                "Payment reported after payoff milestone",
-            )
+    if last_payment_ref and last_payment and last_payment_ref > last_payment:
+        _attach_violation(
+            record,
+            "DATE_OF_LAST_PAYMENT_AFTER_LAST_PAYMENT",
+            "Date of Last Payment occurs after the last payment date",
+            unique=True,
+        )
 
-        if past_due > 0 and "current" in status:
-            _attach_violation(
-                record,
-                "LATE_DATE_BUT_STATUS_CURRENT",
-                "Past-due balance conflicts with Current status",
-            )
+    if payoff_date and last_payment and last_payment > payoff_date:
+        _attach_violation(
+            record,
+            "PAYMENT_AFTER_PAYOFF_DATE",
+            "Payment reported after payoff milestone",
+            unique=True,
+        )
+
+    if past_due > 0 and "current" in status:
+        _attach_violation(
+            record,
+            "LATE_DATE_BUT_STATUS_CURRENT",
+            "Past-due balance conflicts with Current status",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -1540,116 +1927,116 @@ def audit_missing_payment_date(tradelines: Iterable[MutableMapping[str, Any]]) -
 # ---------------------------------------------------------------------------
 
 
-def audit_closed_account_integrity(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        balance = clean_amount(record.get("balance"))
-        past_due = clean_amount(record.get("past_due") or record.get("amount_past_due"))
-        date_closed = parse_date(record.get("date_closed") or record.get("date_of_closing"))
-        payment_rating_raw = record.get("payment_rating") or record.get("worst_payment_status") or record.get("worst_payment_rating")
-        payment_rating_text = _normalize_status(payment_rating_raw)
-        comment = _normalize_status(record.get("special_comment") or record.get("comments"))
-        payment_status_text = _normalize_status(record.get("payment_status"))
-        scheduled_payment = _get_scheduled_payment_amount(record)
-
-        closed_keywords = {"closed", "paid", "settled", "paid in full", "charge-off", "collection"}
-        is_closed = any(keyword in status for keyword in closed_keywords)
-
-        if "reopen" in status and not (
-            record.get("new_open_date")
-            or record.get("date_reopened")
-            or record.get("reopen_date")
-        ):
+@per_record_rule
+def audit_closed_account_integrity(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    balance = view.balance
+    past_due = clean_amount(record.get("past_due") or record.get("amount_past_due"))
+    date_closed = parse_date(record.get("date_closed") or record.get("date_of_closing"))
+    payment_rating_raw = record.get("payment_rating") or record.get("worst_payment_status") or record.get("worst_payment_rating")
+    payment_rating_text = _normalize_status(payment_rating_raw)
+    comment = _normalize_status(record.get("special_comment") or record.get("comments"))
+    payment_status_text = _normalize_status(record.get("payment_status"))
+    scheduled_payment = _get_scheduled_payment_amount(record)
+
+    closed_keywords = {"closed", "paid", "settled", "paid in full", "charge-off", "collection"}
+    is_closed = any(keyword in status for keyword in closed_keywords)
+
+    if "reopen" in status and not (
+        record.get("new_open_date")
+        or record.get("date_reopened")
+        or record.get("reopen_date")
+    ):
+        _attach_violation(
+            record,
+            "REOPENED_ACCOUNT_NO_NEW_OPEN_DATE",
+            "Reopened account missing refreshed open date",
+        )
+
+    if date_closed and any(keyword in status for keyword in ("open", "current", "active")):
+        _attach_violation(
+            record,
+            "INCONSISTENT_ACCOUNT_STATUS_ON_CLOSED",
+            "Account lists a closure date but status still shows open/current",
+        )
+
+    if is_closed or (date_closed and balance == 0):
+        if balance > 0 or past_due > 0:
             _attach_violation(
                 record,
-                "REOPENED_ACCOUNT_NO_NEW_OPEN_DATE",
-                "Reopened account missing refreshed open date",
+                "MISMATCH_BALANCE_ON_CLOSED",
+                "Closed or paid account should report zero balance and past due",
             )
 
-        if date_closed and any(keyword in status for keyword in ("open", "current", "active")):
+        payment_markers = {"late", "delin", "past due", "charge", "repos", "30", "60", "90", "120"}
+        payment_flag = False
+        if payment_status_text and any(marker in payment_status_text for marker in payment_markers):
+            payment_flag = True
+        if scheduled_payment > 0:
+            payment_flag = True
+
+        if payment_flag:
+            extra: Dict[str, Any] | None = None
+            extra_payload: Dict[str, Any] = {}
+            if scheduled_payment > 0:
+                extra_payload["scheduled_payment_amount"] = scheduled_payment
+            if record.get("payment_status"):
+                extra_payload["reported_payment_status"] = record.get("payment_status")
+            if extra_payload:
+                extra = extra_payload
             _attach_violation(
                 record,
-                "INCONSISTENT_ACCOUNT_STATUS_ON_CLOSED",
-                "Account lists a closure date but status still shows open/current",
+                "CLOSED_ACCOUNT_STILL_REPORTING_PAYMENT",
+                "Closed account continues to report payment obligation or delinquency",
+                extra,
             )
 
-        if is_closed or (date_closed and balance == 0):
-            if balance > 0 or past_due > 0:
-                _attach_violation(
-                    record,
-                    "MISMATCH_BALANCE_ON_CLOSED",
-                    "Closed or paid account should report zero balance and past due",
-                )
+        rating_value = None
+        if payment_rating_raw is not None:
+            try:
+                rating_value = int(str(payment_rating_raw).strip())
+            except Exception:
+                rating_value = None
 
-            payment_markers = {"late", "delin", "past due", "charge", "repos", "30", "60", "90", "120"}
-            payment_flag = False
-            if payment_status_text and any(marker in payment_status_text for marker in payment_markers):
-                payment_flag = True
-            if scheduled_payment > 0:
-                payment_flag = True
-
-            if payment_flag:
-                extra: Dict[str, Any] | None = None
-                extra_payload: Dict[str, Any] = {}
-                if scheduled_payment > 0:
-                    extra_payload["scheduled_payment_amount"] = scheduled_payment
-                if record.get("payment_status"):
-                    extra_payload["reported_payment_status"] = record.get("payment_status")
-                if extra_payload:
-                    extra = extra_payload
-                _attach_violation(
-                    record,
-                    "CLOSED_ACCOUNT_STILL_REPORTING_PAYMENT",
-                    "Closed account continues to report payment obligation or delinquency",
-                    extra,
-                )
-
-            rating_value = None
-            if payment_rating_raw is not None:
-                try:
-                    rating_value = int(str(payment_rating_raw).strip())
-                except Exception:
-                    rating_value = None
+        if (rating_value is not None and rating_value > 0) or any(
+            keyword in payment_rating_text for keyword in ("late", "delin", "charge", "repos")
+        ):
+            _attach_violation(
+                record,
+                "INCONSISTENT_PAYMENT_RATING_ON_CLOSE",
+                "Closed account still shows delinquent payment rating",
+            )
 
-            if (rating_value is not None and rating_value > 0) or any(
-                keyword in payment_rating_text for keyword in ("late", "delin", "charge", "repos")
-            ):
-                _attach_violation(
-                    record,
-                    "INCONSISTENT_PAYMENT_RATING_ON_CLOSE",
-                    "Closed account still shows delinquent payment rating",
-                )
+        if "settled" in status and not any(
+            keyword in comment for keyword in ("settled", "partial", "less than full", "acuerdo")
+        ):
+            _attach_violation(
+                record,
+                "INCONSISTENT_SPECIAL_COMMENT_ON_SETTLEMENT",
+                "Settled account missing settlement-specific comment",
+            )
 
-            if "settled" in status and not any(
-                keyword in comment for keyword in ("settled", "partial", "less than full", "acuerdo")
-            ):
+        for entry in _payment_history_entries(record):
+            hist_date = parse_date(entry.get("date"))
+            if date_closed and hist_date and hist_date > date_closed:
                 _attach_violation(
                     record,
-                    "INCONSISTENT_SPECIAL_COMMENT_ON_SETTLEMENT",
-                    "Settled account missing settlement-specific comment",
+                    "INCORRECT_PAYMENT_HISTORY_AFTER_CLOSURE",
+                    "Payment history shows activity after closure",
                 )
+                break
 
-            for entry in _payment_history_entries(record):
-                hist_date = parse_date(entry.get("date"))
-                if date_closed and hist_date and hist_date > date_closed:
-                    _attach_violation(
-                        record,
-                        "INCORRECT_PAYMENT_HISTORY_AFTER_CLOSURE",
-                        "Payment history shows activity after closure",
-                    )
-                    break
-
-        delinquency_days_raw = record.get("days_past_due") or record.get("max_delinquency_days")
-        try:
-            delinquency_days = int(float(str(delinquency_days_raw))) if delinquency_days_raw not in (None, "") else 0
-        except Exception:
-            delinquency_days = 0
-        if delinquency_days > 180:
-            _attach_violation(
-                record,
-                "EXTENDED_DELINQUENCY_BEYOND_MAX",
-                "Delinquency exceeds 180 days but still reported as incremental late codes",
-            )
+    delinquency_days_raw = record.get("days_past_due") or record.get("max_delinquency_days")
+    try:
+        delinquency_days = int(float(str(delinquency_days_raw))) if delinquency_days_raw not in (None, "") else 0
+    except Exception:
+        delinquency_days = 0
+    if delinquency_days > 180:
+        _attach_violation(
+            record,
+            "EXTENDED_DELINQUENCY_BEYOND_MAX",
+            "Delinquency exceeds 180 days but still reported as incremental late codes",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -1657,37 +2044,37 @@ def audit_closed_account_integrity(tradelines: Iterable[MutableMapping[str, Any]
 # ---------------------------------------------------------------------------
 
 
-def audit_dispute_compliance(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        dispute_flag = record.get("dispute_flag") or record.get("dispute_status") or record.get("account_in_dispute")
-        compliance_code = str(record.get("compliance_condition_code") or record.get("compliance_code") or "").strip().upper()
-        status = _normalize_status(record.get("account_status"))
-        comment = _normalize_status(record.get("comments") or record.get("special_comment"))
+@per_record_rule
+def audit_dispute_compliance(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    dispute_flag = record.get("dispute_flag") or record.get("dispute_status") or record.get("account_in_dispute")
+    compliance_code = str(record.get("compliance_condition_code") or record.get("compliance_code") or "").strip().upper()
+    status = view.status
+    comment = _normalize_status(record.get("comments") or record.get("special_comment"))
 
-        if not _boolish(dispute_flag):
-            continue
+    if not _boolish(dispute_flag):
+        return
 
-        if compliance_code not in COMPLIANCE_CODES:
-            _attach_violation(
-                record,
-                "COMPLIANCE_CONDITION_CODE_MISSING_ON_DISPUTE",
-                "Dispute flagged without Metro-2 compliance condition code",
-            )
+    if compliance_code not in COMPLIANCE_CODES:
+        _attach_violation(
+            record,
+            "COMPLIANCE_CONDITION_CODE_MISSING_ON_DISPUTE",
+            "Dispute flagged without Metro-2 compliance condition code",
+        )
 
-        last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
-        if last_reported and days_since(last_reported) > 30:
-            _attach_violation(
-                record,
-                "failure_to_correct_after_dispute",
-                "Dispute notation present without updates after 30+ days",
-            )
+    last_reported = parse_date(record.get("last_reported") or record.get("date_last_reported"))
+    if last_reported and days_since(last_reported) > 30:
+        _attach_violation(
+            record,
+            "failure_to_correct_after_dispute",
+            "Dispute notation present without updates after 30+ days",
+        )
 
-        if any(keyword in status for keyword in ("paid", "resolved", "closed", "settled")) or "resolved" in comment:
-            _attach_violation(
-                record,
-                "DISPUTE_FLAG_NOT_CLEARED_AFTER_RESOLUTION",
-                "Dispute flag remains even though the account reflects a resolution",
-            )
+    if any(keyword in status for keyword in ("paid", "resolved", "closed", "settled")) or "resolved" in comment:
+        _attach_violation(
+            record,
+            "DISPUTE_FLAG_NOT_CLEARED_AFTER_RESOLUTION",
+            "Dispute flag remains even though the account reflects a resolution",
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -1695,82 +2082,82 @@ def audit_dispute_compliance(tradelines: Iterable[MutableMapping[str, Any]]) ->
 # ---------------------------------------------------------------------------
 
 
-def audit_portfolio_alignment(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        portfolio = _normalize_status(record.get("portfolio_type"))
-        account_type = _normalize_status(record.get("account_type"))
-        ownership = _normalize_status(
-            record.get("ownership_code") or record.get("ecoa_code") or record.get("ecoa_designator")
-        )
-        relationship = _normalize_status(
-            record.get("account_designator") or record.get("responsibility") or record.get("relationship")
+@per_record_rule
+def audit_portfolio_alignment(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    portfolio = _normalize_status(record.get("portfolio_type"))
+    account_type = _normalize_status(record.get("account_type"))
+    ownership = _normalize_status(
+        record.get("ownership_code") or record.get("ecoa_code") or record.get("ecoa_designator")
+    )
+    relationship = _normalize_status(
+        record.get("account_designator") or record.get("responsibility") or record.get("relationship")
+    )
+    secured_indicator = _normalize_status(record.get("secured_indicator") or record.get("collateral_indicator"))
+    collateral = _normalize_status(record.get("collateral") or record.get("collateral_description"))
+    balance = view.balance
+    high_credit = view.high_credit
+    credit_limit = view.credit_limit
+
+    if ("authorized" in relationship or "authorized" in ownership) and any(
+        keyword in ownership for keyword in ("individual", "primary", "joint")
+    ):
+        _attach_violation(
+            record,
+            "INCORRECT_ECOA_CODE_FOR_AUTHORIZED_USER",
+            "Authorized user account coded as primary/individual",
         )
-        secured_indicator = _normalize_status(record.get("secured_indicator") or record.get("collateral_indicator"))
-        collateral = _normalize_status(record.get("collateral") or record.get("collateral_description"))
-        balance = clean_amount(record.get("balance"))
-        high_credit = clean_amount(record.get("high_credit"))
-        credit_limit = clean_amount(record.get("credit_limit"))
-
-        if ("authorized" in relationship or "authorized" in ownership) and any(
-            keyword in ownership for keyword in ("individual", "primary", "joint")
-        ):
-            _attach_violation(
-                record,
-                "INCORRECT_ECOA_CODE_FOR_AUTHORIZED_USER",
-                "Authorized user account coded as primary/individual",
-            )
 
-        portfolio_key = None
-        if "revol" in portfolio:
-            portfolio_key = "revolving"
-        elif "install" in portfolio:
-            portfolio_key = "installment"
-        elif "open" in portfolio:
-            portfolio_key = "open"
-
-        account_key = None
-        if "revol" in account_type:
-            account_key = "revolving"
-        elif "install" in account_type:
-            account_key = "installment"
-        elif "open" in account_type:
-            account_key = "open"
-
-        if portfolio_key and account_key and portfolio_key != account_key:
-            _attach_violation(
-                record,
-                "MISMATCH_PORTFOLIO_TYPE_VS_ACCOUNT_TYPE",
-                "Portfolio type conflicts with account type coding",
-            )
+    portfolio_key = None
+    if "revol" in portfolio:
+        portfolio_key = "revolving"
+    elif "install" in portfolio:
+        portfolio_key = "installment"
+    elif "open" in portfolio:
+        portfolio_key = "open"
+
+    account_key = None
+    if "revol" in account_type:
+        account_key = "revolving"
+    elif "install" in account_type:
+        account_key = "installment"
+    elif "open" in account_type:
+        account_key = "open"
+
+    if portfolio_key and account_key and portfolio_key != account_key:
+        _attach_violation(
+            record,
+            "MISMATCH_PORTFOLIO_TYPE_VS_ACCOUNT_TYPE",
+            "Portfolio type conflicts with account type coding",
+        )
 
-        if secured_indicator in {"y", "yes", "secured", "true"} and not collateral:
-            _attach_violation(
-                record,
-                "MISMATCH_COLLATERAL_INDICATOR",
-                "Secured flag present without collateral details",
-            )
-        if collateral and secured_indicator in {"n", "no", "unsecured", "false"}:
-            _attach_violation(
-                record,
-                "MISMATCH_COLLATERAL_INDICATOR",
-                "Collateral listed but account flagged unsecured",
-            )
+    if secured_indicator in {"y", "yes", "secured", "true"} and not collateral:
+        _attach_violation(
+            record,
+            "MISMATCH_COLLATERAL_INDICATOR",
+            "Secured flag present without collateral details",
+        )
+    if collateral and secured_indicator in {"n", "no", "unsecured", "false"}:
+        _attach_violation(
+            record,
+            "MISMATCH_COLLATERAL_INDICATOR",
+            "Collateral listed but account flagged unsecured",
+        )
 
-        if credit_limit > 0 and high_credit > credit_limit + 0.01:
-            _attach_violation(
-                record,
-                "HIGH_CREDIT_EXCEEDS_LIMIT",
-                "High Credit exceeds the reported Credit Limit",
-            )
+    if credit_limit > 0 and high_credit > credit_limit + 0.01:
+        _attach_violation(
+            record,
+            "HIGH_CREDIT_EXCEEDS_LIMIT",
+            "High Credit exceeds the reported Credit Limit",
+        )
 
-        revolving_like = {"revolving", "open"}
-        high_credit_value = max(high_credit, credit_limit)
-        if balance > 0 and high_credit_value == 0 and (portfolio_key in revolving_like or account_key in revolving_like):
-            _attach_violation(
-                record,
-                "NON_ZERO_BALANCE_WITH_ZERO_HI_CREDIT",
-                "Revolving/open account shows balance but zero limit/high credit",
-            )
+    revolving_like = {"revolving", "open"}
+    high_credit_value = max(high_credit, credit_limit)
+    if balance > 0 and high_credit_value == 0 and (portfolio_key in revolving_like or account_key in revolving_like):
+        _attach_violation(
+            record,
+            "NON_ZERO_BALANCE_WITH_ZERO_HI_CREDIT",
+            "Revolving/open account shows balance but zero limit/high credit",
+        )
 # ---------------------------------------------------------------------------
 # Inquiry & personal info rules
 # ---------------------------------------------------------------------------
@@ -1843,293 +2230,306 @@ def audit_personal_info(info: Mapping[str, Mapping[str, Any]]) -> List[Dict[str,
 # ---------------------------------------------------------------------------
 
 
-def audit_current_with_past_due(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        past_due = clean_amount(record.get("past_due"))
-        if past_due <= 0:
-            continue
-        if any(k in status for k in ("current", "pays as agreed", "paid as agreed", "ok")):
-            _attach_violation(
-                record,
-                "CURRENT_STATUS_WITH_PAST_DUE",
-                "Account marked current while reporting past due balance",
-            )
+@per_record_rule
+def audit_current_with_past_due(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    past_due = view.past_due
+    if past_due <= 0:
+        return
+    if any(k in status for k in ("current", "pays as agreed", "paid as agreed", "ok")):
+        _attach_violation(
+            record,
+            "CURRENT_STATUS_WITH_PAST_DUE",
+            "Account marked current while reporting past due balance",
+        )
 
 
-def audit_zero_balance_with_past_due(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        balance = clean_amount(record.get("balance"))
-        past_due = clean_amount(record.get("past_due"))
-        if balance <= 1 and past_due > 0:
-            _attach_violation(
-                record,
-                "ZERO_BALANCE_WITH_PAST_DUE",
-                "Balance is zero but past due amount reported",
-            )
+@per_record_rule
+def audit_zero_balance_with_past_due(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    balance = view.balance
+    past_due = view.past_due
+    if balance <= 1 and past_due > 0:
+        _attach_violation(
+            record,
+            "ZERO_BALANCE_WITH_PAST_DUE",
+            "Balance is zero but past due amount reported",
+        )
 
 
-def audit_late_status_no_past_due(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@per_record_rule
+def audit_late_status_no_past_due(record: MutableMapping[str, Any], view: TradelineView) -> None:
     late_kw = ("late", "delinquent", "past due", "charge", "collection", "derog", "30", "60", "90")
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        past_due = clean_amount(record.get("past_due"))
-        if past_due > 0:
-            continue
-        if _has_keywords(status, late_kw):
-            _attach_violation(
-                record,
-                "LATE_STATUS_NO_PAST_DUE",
-                "Delinquent status without supporting past due amount",
-            )
+    status = view.status
+    past_due = view.past_due
+    if past_due > 0:
+        return
+    if _has_keywords(status, late_kw):
+        _attach_violation(
+            record,
+            "LATE_STATUS_NO_PAST_DUE",
+            "Delinquent status without supporting past due amount",
+        )
 
 
-def audit_open_zero_balance(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        balance = clean_amount(record.get("balance"))
-        if "open" in status and balance <= 0:
-            _attach_violation(
-                record,
-                "OPEN_ZERO_BALANCE",
-                "Open account reporting $0 balance",
-            )
+@per_record_rule
+def audit_open_zero_balance(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    balance = view.balance
+    if "open" in status and balance <= 0:
+        _attach_violation(
+            record,
+            "OPEN_ZERO_BALANCE",
+            "Open account reporting $0 balance",
+        )
 
 
-def audit_revolving_zero_limit_comment(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        if not _is_revolving(record):
-            continue
-        status = _normalize_status(record.get("account_status"))
-        if "closed" in status:
-            continue
-        limit = clean_amount(record.get("credit_limit"))
-        high_credit = clean_amount(record.get("high_credit"))
-        comments = _normalize_status(_get_comments(record))
-        if limit == 0 and high_credit > 0 and "high credit" in comments:
-            _attach_violation(
-                record,
-                "REVOLVING_ZERO_LIMIT_COMMENT",
-                "Open revolving account has $0 limit while comments cite high credit as proxy",
-            )
+@per_record_rule
+def audit_revolving_zero_limit_comment(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    if not view.is_revolving:
+        return
+    status = view.status
+    if "closed" in status:
+        return
+    limit = view.credit_limit
+    high_credit = view.high_credit
+    comments = view.comments
+    if limit == 0 and high_credit > 0 and "high credit" in comments:
+        _attach_violation(
+            record,
+            "REVOLVING_ZERO_LIMIT_COMMENT",
+            "Open revolving account has $0 limit while comments cite high credit as proxy",
+        )
 
 
-def audit_high_credit_exceeds_limit(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        if _has_violation(record, "HIGH_CREDIT_EXCEEDS_LIMIT"):
-            continue
-        limit = clean_amount(record.get("credit_limit"))
-        high_credit = clean_amount(record.get("high_credit"))
-        if limit > 0 and high_credit > limit:
-            _attach_violation(
-                record,
-                "HIGH_CREDIT_GT_LIMIT",
-                "High Credit exceeds reported Credit Limit",
-            )
+@per_record_rule
+def audit_high_credit_exceeds_limit(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    if _has_violation(record, "HIGH_CREDIT_EXCEEDS_LIMIT"):
+        return
+    limit = view.credit_limit
+    high_credit = view.high_credit
+    if limit > 0 and high_credit > limit:
+        _attach_violation(
+            record,
+            "HIGH_CREDIT_GT_LIMIT",
+            "High Credit exceeds reported Credit Limit",
+        )
 
 
-def audit_revolving_with_terms(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@per_record_rule
+def audit_revolving_with_terms(record: MutableMapping[str, Any], view: TradelineView) -> None:
     term_fields = ("terms", "term", "loan_term", "months_terms", "scheduled_payment_term")
-    for record in tradelines:
-        if not _is_revolving(record):
-            continue
-        for field in term_fields:
-            value = record.get(field)
-            if value and re.search(r"\d", str(value)):
-                _attach_violation(
-                    record,
-                    "REVOLVING_WITH_TERMS",
-                    "Revolving account should not include installment-style term length",
-                )
-                break
-
-
-def audit_revolving_missing_limit(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        if not _is_revolving(record):
-            continue
-        status = _normalize_status(record.get("account_status"))
-        if any(k in status for k in ("closed", "paid")):
-            continue
-        limit = clean_amount(record.get("credit_limit"))
-        high_credit = clean_amount(record.get("high_credit"))
-        if limit <= 0 and high_credit <= 0:
+    if not view.is_revolving:
+        return
+    for field in term_fields:
+        value = record.get(field)
+        if value and re.search(r"\d", str(value)):
             _attach_violation(
                 record,
-                "REVOLVING_MISSING_LIMIT",
-                "Open revolving tradeline missing both Credit Limit and High Credit",
+                "REVOLVING_WITH_TERMS",
+                "Revolving account should not include installment-style term length",
             )
+            break
 
 
-def audit_installment_has_limit(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        if not _is_installment(record):
-            continue
-        limit = clean_amount(record.get("credit_limit"))
-        if limit > 0:
-            _attach_violation(
-                record,
-                "INSTALLMENT_HAS_LIMIT",
-                "Installment account should not report a revolving-style credit limit",
-            )
+@per_record_rule
+def audit_revolving_missing_limit(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    if not view.is_revolving:
+        return
+    status = view.status
+    if any(k in status for k in ("closed", "paid")):
+        return
+    limit = view.credit_limit
+    high_credit = view.high_credit
+    if limit <= 0 and high_credit <= 0:
+        _attach_violation(
+            record,
+            "REVOLVING_MISSING_LIMIT",
+            "Open revolving tradeline missing both Credit Limit and High Credit",
+        )
 
 
-def audit_co_collection_past_due(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        past_due = clean_amount(record.get("past_due"))
-        if past_due <= 0:
-            continue
-        if any(k in status for k in ("charge", "collection", "chargeoff")):
-            _attach_violation(
-                record,
-                "CO_COLLECTION_PAST_DUE",
-                "Charge-off/Collection should report $0 past due",
-            )
+@per_record_rule
+def audit_installment_has_limit(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    if not view.is_installment:
+        return
+    limit = view.credit_limit
+    if limit > 0:
+        _attach_violation(
+            record,
+            "INSTALLMENT_HAS_LIMIT",
+            "Installment account should not report a revolving-style credit limit",
+        )
 
 
-def audit_au_comment_ecoa_conflict(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    valid_ecoa = {"a", "au", "authorized user", "u"}
-    for record in tradelines:
-        comments = _normalize_status(_get_comments(record))
-        if not _has_keywords(comments, ("authorized user", "usuario autorizado")):
-            continue
-        ecoa = _get_ecoa(record)
-        if ecoa and ecoa in valid_ecoa:
-            continue
+@per_record_rule
+def audit_co_collection_past_due(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    past_due = view.past_due
+    if past_due <= 0:
+        return
+    if any(k in status for k in ("charge", "collection", "chargeoff")):
         _attach_violation(
             record,
-            "AU_COMMENT_ECOA_CONFLICT",
-            "Authorized user comment present without matching ECOA designator",
+            "CO_COLLECTION_PAST_DUE",
+            "Charge-off/Collection should report $0 past due",
         )
 
 
-def audit_derog_rating_but_current(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    derog_tokens = ("30", "60", "90", "120", "derog", "charge", "collection")
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        past_due = clean_amount(record.get("past_due"))
-        if past_due > 0 or not any(k in status for k in ("current", "pays as agreed", "ok")):
-            continue
-        history = _normalize_status(record.get("payment_history"))
-        rating = _normalize_status(record.get("payment_rating"))
-        if any(t in history for t in derog_tokens) or any(t in rating for t in derog_tokens):
-            _attach_violation(
-                record,
-                "DEROG_RATING_BUT_CURRENT",
-                "Derogatory history present while account marked current with $0 past due",
-            )
+@per_record_rule
+def audit_au_comment_ecoa_conflict(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    valid_ecoa = {"a", "au", "authorized user", "u"}
+    comments = view.comments
+    if not _has_keywords(comments, ("authorized user", "usuario autorizado")):
+        return
+    ecoa = _get_ecoa(record)
+    if ecoa and ecoa in valid_ecoa:
+        return
+    _attach_violation(
+        record,
+        "AU_COMMENT_ECOA_CONFLICT",
+        "Authorized user comment present without matching ECOA designator",
+    )
 
 
-def audit_dispute_comment_needs_xb(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        comments = _normalize_status(_get_comments(record))
-        if not _has_keywords(comments, ("dispute", "investigation", "en disputa")):
-            continue
-        code = _get_compliance_code(record)
-        if code == "xb":
-            continue
+@per_record_rule
+def audit_derog_rating_but_current(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    derog_tokens = ("30", "60", "90", "120", "derog", "charge", "collection")
+    status = view.status
+    past_due = view.past_due
+    if past_due > 0 or not any(k in status for k in ("current", "pays as agreed", "ok")):
+        return
+    grid = _payment_grid(record)
+    if grid is not None:
+        derog_history = grid.has_late()
+    else:
+        history = _normalize_status(record.get("payment_history"))
+        derog_history = any(t in history for t in derog_tokens)
+    rating = _normalize_status(record.get("payment_rating"))
+    if derog_history or any(t in rating for t in derog_tokens):
         _attach_violation(
             record,
-            "DISPUTE_COMMENT_NEEDS_XB",
-            "Dispute language in comments requires XB compliance condition code",
+            "DEROG_RATING_BUT_CURRENT",
+            "Derogatory history present while account marked current with $0 past due",
         )
 
 
-def audit_closed_account_monthly_payment(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        if not _has_keywords(status, ("closed", "paid", "charge", "collection")):
-            continue
-        payment = clean_amount(record.get("monthly_payment"))
-        if payment > 0:
-            _attach_violation(
-                record,
-                "CLOSED_ACCOUNT_MONTHLY_PAYMENT",
-                "Closed account still reporting a monthly payment",
-            )
+@per_record_rule
+def audit_dispute_comment_needs_xb(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    comments = view.comments
+    if not _has_keywords(comments, ("dispute", "investigation", "en disputa")):
+        return
+    code = _get_compliance_code(record)
+    if code == "xb":
+        return
+    _attach_violation(
+        record,
+        "DISPUTE_COMMENT_NEEDS_XB",
+        "Dispute language in comments requires XB compliance condition code",
+    )
 
 
-def audit_stale_active_reporting(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        if not any(k in status for k in ("open", "current", "pays as agreed", "ok")):
-            continue
-        last_rep = parse_date(record.get("last_reported") or record.get("date_last_active"))
-        if not last_rep:
-            continue
-        if (today() - last_rep).days > 180:
-            _attach_violation(
-                record,
-                "STALE_ACTIVE_REPORTING",
-                "Open/current account has not been updated in over 6 months",
-            )
+@per_record_rule
+def audit_closed_account_monthly_payment(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    if not _has_keywords(status, ("closed", "paid", "charge", "collection")):
+        return
+    payment = view.monthly_payment
+    if payment > 0:
+        _attach_violation(
+            record,
+            "CLOSED_ACCOUNT_MONTHLY_PAYMENT",
+            "Closed account still reporting a monthly payment",
+        )
 
 
-def audit_metro2_code_3_conflict(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        closed_date = parse_date(record.get("date_closed"))
-        status = _normalize_status(record.get("account_status"))
-        if closed_date and any(k in status for k in ("open", "current", "pays as agreed", "ok")):
-            _attach_violation(
-                record,
-                "METRO2_CODE_3_CONFLICT",
-                "Tradeline shows Date Closed but status still reads open/current",
-            )
+@per_record_rule
+def audit_stale_active_reporting(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    if not any(k in status for k in ("open", "current", "pays as agreed", "ok")):
+        return
+    last_rep = view.last_active
+    if not last_rep:
+        return
+    if (today() - last_rep).days > 180:
+        _attach_violation(
+            record,
+            "STALE_ACTIVE_REPORTING",
+            "Open/current account has not been updated in over 6 months",
+        )
 
 
-def audit_metro2_code_9_missing_oc(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        status = _normalize_status(record.get("account_status"))
-        if "collection" not in status:
-            continue
-        if record.get("original_creditor"):
-            continue
+@per_record_rule
+def audit_metro2_code_3_conflict(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    closed_date = view.date_closed
+    status = view.status
+    if closed_date and any(k in status for k in ("open", "current", "pays as agreed", "ok")):
         _attach_violation(
             record,
-            "METRO2_CODE_9_MISSING_OC",
-            "Collection account missing Original Creditor",
+            "METRO2_CODE_3_CONFLICT",
+            "Tradeline shows Date Closed but status still reads open/current",
         )
 
 
-def audit_student_loan_deferment(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
-    for record in tradelines:
-        acct_type = _normalize_status(record.get("account_type"))
-        comments = _normalize_status(_get_comments(record))
-        if not any(k in acct_type for k in ("student", "education")):
-            continue
-        if not _has_keywords(comments, ("defer", "forbear")):
-            continue
+@per_record_rule
+def audit_metro2_code_9_missing_oc(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    status = view.status
+    if "collection" not in status:
+        return
+    if record.get("original_creditor"):
+        return
+    _attach_violation(
+        record,
+        "METRO2_CODE_9_MISSING_OC",
+        "Collection account missing Original Creditor",
+    )
+
+
+@per_record_rule
+def audit_student_loan_deferment(record: MutableMapping[str, Any], view: TradelineView) -> None:
+    acct_type = _normalize_status(record.get("account_type"))
+    comments = view.comments
+    if not any(k in acct_type for k in ("student", "education")):
+        return
+    if not _has_keywords(comments, ("defer", "forbear")):
+        return
+    grid = _payment_grid(record)
+    if grid is not None:
+        has_lates = any(grid.late_counts().values())
+    else:
         history = _normalize_status(record.get("payment_history"))
-        if any(t in history for t in ("30", "60", "90", "120", "late")):
-            _attach_violation(
-                record,
-                "SL_DEFERMENT_HAS_LATES",
-                "Student loan in deferment/forbearance shows late payment history",
-            )
+        has_lates = any(t in history for t in ("30", "60", "90", "120", "late"))
+    if has_lates:
+        _attach_violation(
+            record,
+            "SL_DEFERMENT_HAS_LATES",
+            "Student loan in deferment/forbearance shows late payment history",
+        )
 
 
-def audit_date_order_sanity(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@per_record_rule
+def audit_date_order_sanity(record: MutableMapping[str, Any], view: TradelineView) -> None:
     check_fields = ("last_reported", "date_last_active", "date_closed")
-    for record in tradelines:
-        opened = parse_date(record.get("date_opened"))
-        if not opened:
-            continue
-        bad_fields: List[str] = []
-        for field in check_fields:
-            dt = parse_date(record.get(field))
-            if dt and dt < opened:
-                bad_fields.append(field)
-        if bad_fields:
-            joined = ", ".join(sorted(bad_fields))
-            _attach_violation(
-                record,
-                "DATE_ORDER_SANITY",
-                f"Dates {joined} occur before Date Opened",
-            )
+    opened = view.date_opened
+    if not opened:
+        return
+    bad_fields: List[str] = []
+    for field in check_fields:
+        dt = getattr(view, field)
+        if dt and dt < opened:
+            bad_fields.append(field)
+    if bad_fields:
+        joined = ", ".join(sorted(bad_fields))
+        _attach_violation(
+            record,
+            "DATE_ORDER_SANITY",
+            f"Dates {joined} occur before Date Opened",
+        )
 
 
-def audit_cross_bureau_utilization_gap(tradelines: Iterable[MutableMapping[str, Any]]) -> None:
+@group_rule
+def audit_cross_bureau_utilization_gap(
+    tradelines: Iterable[MutableMapping[str, Any]], context: AuditContext | None = None
+) -> None:
     def _utilization(record: Mapping[str, Any]) -> float | None:
         balance = clean_amount(record.get("balance"))
         limit = clean_amount(record.get("credit_limit"))
@@ -2137,7 +2537,7 @@ def audit_cross_bureau_utilization_gap(tradelines: Iterable[MutableMapping[str,
         base = limit if limit > 0 else high if high > 0 else 0
         return None if base <= 0 else balance / base
 
-    groups = group_by_creditor(list(tradelines))
+    groups = _grouped(tradelines, context)
     for group in groups.values():
         utils = [(r, _utilization(r)) for r in group]
         valid = [(r, u) for r, u in utils if u is not None]
@@ -2146,12 +2546,12 @@ def audit_cross_bureau_utilization_gap(tradelines: Iterable[MutableMapping[str,
         values = [u for _, u in valid]
         if max(values) - min(values) > 0.25:
             for record, _ in valid:
-                if not _has_violation(record, "CROSS_BUREAU_UTILIZATION_GAP"):
-                    _attach_violation(
-                        record,
-                        "CROSS_BUREAU_UTILIZATION_GAP",
-                        "Utilization rate differs by more than 25 percentage points across bureaus",
-                    )
+                _attach_violation(
+                    record,
+                    "CROSS_BUREAU_UTILIZATION_GAP",
+                    "Utilization rate differs by more than 25 percentage points across bureaus",
+                    unique=True,
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -2208,22 +2608,176 @@ AUDIT_FUNCTIONS = [
 ]
 
 
-def run_all_audits(parsed_data: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
-    tradelines = parsed_data.get("accounts", [])
-    inquiries = parsed_data.get("inquiries", [])
-    personal_info = parsed_data.get("personal_information", {})
+def _engine_version() -> str:
+    try:
+        source = Path(__file__).read_bytes()
+    except OSError:
+        return "unknown"
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+# Fingerprint of the rule engine source; changes whenever a rule is edited.
+AUDIT_ENGINE_VERSION = _engine_version()
+
+
+AUDIT_STAMP_KEY = "audit_stamp"
 
-    active_tradelines = [record for record in tradelines if record.get("present", True) is not False]
 
-    for record in active_tradelines:
-        normalize_tradeline(record)
+def audit_stamp(parsed_data: Mapping[str, Any]) -> str:
+    """Fingerprint of the engine version, as-of date and payload contents.
 
+    The content digest leaves out the ``violations`` the rules attach, so it
+    is computed once the audit has run (and normalized the records) and then
+    matches for as long as nobody edits a tradeline, inquiry or the personal
+    information.
+    """
+
+    return ":".join(
+        (
+            AUDIT_ENGINE_VERSION,
+            today().isoformat(),
+            str(len(parsed_data.get("accounts", []) or [])),
+            str(len(parsed_data.get("inquiries", []) or [])),
+            _payload_digest(parsed_data),
+        )
+    )
+
+
+def _payload_digest(parsed_data: Mapping[str, Any]) -> str:
+    accounts = [
+        {key: value for key, value in record.items() if key != "violations"}
+        if isinstance(record, Mapping)
+        else record
+        for record in parsed_data.get("accounts", []) or []
+    ]
+    content = (accounts, parsed_data.get("inquiries") or [], parsed_data.get("personal_information") or {})
+    encoded = json.dumps(content, sort_keys=True, default=str, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _dedupe_violations(record: MutableMapping[str, Any]) -> None:
+    violations = record.get("violations")
+    if not violations:
+        return
+    seen = set()
+    unique = []
+    for violation in violations:
+        key: Any = (violation.get("id") or violation.get("code"), violation.get("title"))
+        if key == (None, None):
+            # Nothing to identify the rule by: only exact copies are duplicates.
+            key = json.dumps(violation, sort_keys=True, default=str)
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(violation)
+    if len(unique) != len(violations):
+        record["violations"] = unique
+
+
+def _run_rules(
+    tradelines: Sequence[MutableMapping[str, Any]],
+    context: AuditContext,
+    candidates: Mapping[Callable[..., None], Sequence[int]] | None = None,
+) -> None:
+    """Run ``AUDIT_FUNCTIONS`` in order, dispatching on each rule's scope.
+
+    Per-record rules get their ``check`` called with the views built by
+    :func:`normalize_tradeline`; group rules get the shared ``context``.  A
+    rule registered with neither decorator is called as ``fn(tradelines)``.
+    ``candidates`` may narrow a per-record rule to the listed positions.
+    """
+
+    pairs = [(record, context.view(record)) for record in tradelines]
     for fn in AUDIT_FUNCTIONS:
-        fn(active_tradelines)
+        scope = getattr(fn, "scope", None)
+        if scope == "record":
+            check = fn.check
+            rows = candidates.get(fn) if candidates else None
+            for record, view in pairs if rows is None else (pairs[i] for i in rows):
+                check(record, view)
+        elif scope == "group":
+            fn(tradelines, context=context)
+        else:
+            fn(tradelines)
+
+
+# ``prefilter(records, views)`` -> {per-record rule: sorted candidate positions}
+Prefilter = Callable[
+    [Sequence[MutableMapping[str, Any]], Sequence[TradelineView]],
+    Mapping[Callable[..., None], Sequence[int]],
+]
+
+
+def run_batch_audits(
+    payloads: Sequence[MutableMapping[str, Any]],
+    force: bool = False,
+    prefilter: Prefilter | None = None,
+) -> Sequence[MutableMapping[str, Any]]:
+    """:func:`run_all_audits` over several payloads, with an optional shared prefilter.
+
+    ``prefilter`` is called once with the active tradelines of every payload
+    that needs auditing, concatenated, and their views.  For each per-record
+    rule it may return the positions of the only records that rule could
+    flag; the rule's own check still decides, so a prefilter only has to
+    over-approximate.  Rules it leaves out run on every record.
+    """
+
+    pending = []
+    for parsed_data in payloads:
+        stamped = parsed_data.get(AUDIT_STAMP_KEY)
+        if not force and stamped is not None and stamped == audit_stamp(parsed_data):
+            continue
+        tradelines = parsed_data.get("accounts", [])
+        active_tradelines = [record for record in tradelines if record.get("present", True) is not False]
+        context = AuditContext(
+            active_tradelines, {id(record): normalize_tradeline(record) for record in active_tradelines}
+        )
+        pending.append((parsed_data, active_tradelines, context))
+
+    rows: Mapping[Callable[..., None], Sequence[int]] = {}
+    if prefilter is not None and pending:
+        records: List[MutableMapping[str, Any]] = []
+        views: List[TradelineView] = []
+        for _, active_tradelines, context in pending:
+            records.extend(active_tradelines)
+            views.extend(context.view(record) for record in active_tradelines)
+        rows = prefilter(records, views)
+
+    start = 0
+    for parsed_data, active_tradelines, context in pending:
+        stop = start + len(active_tradelines)
+        candidates = {
+            fn: [i - start for i in positions[bisect_left(positions, start) : bisect_left(positions, stop)]]
+            for fn, positions in rows.items()
+        }
+        token = _VIOLATION_INDEX.set({})
+        try:
+            _run_rules(active_tradelines, context, candidates)
+        finally:
+            _VIOLATION_INDEX.reset(token)
+        start = stop
+
+        for record in active_tradelines:
+            _dedupe_violations(record)
+
+        parsed_data["inquiry_violations"] = audit_inquiries(parsed_data.get("inquiries", []), active_tradelines)
+        parsed_data["personal_info_violations"] = audit_personal_info(parsed_data.get("personal_information", {}))
+        parsed_data[AUDIT_STAMP_KEY] = audit_stamp(parsed_data)
+
+    return payloads
+
+
+def run_all_audits(
+    parsed_data: MutableMapping[str, Any], force: bool = False
+) -> MutableMapping[str, Any]:
+    """Attach violations to ``parsed_data`` in place and return it.
 
-    parsed_data["inquiry_violations"] = audit_inquiries(inquiries, active_tradelines)
-    parsed_data["personal_info_violations"] = audit_personal_info(personal_info)
+    The payload is stamped with :func:`audit_stamp`; a second call on an
+    already-audited payload is a no-op unless ``force`` is set.  Re-audits
+    never stack duplicate ``(rule id, title)`` violations on a tradeline.
+    """
 
+    run_batch_audits([parsed_data], force=force)
     return parsed_data
 
 
@@ -2301,4 +2855,4 @@ def _format_violation_line(violation: Mapping[str, Any], prefix: str = "") -> st
     return f"{prefix}{color}{symbol} {label}: {details}{CLIColor.RESET}"
 
 
-__all__ = ["run_all_audits", "build_cli_report"]
+__all__ = ["run_all_audits", "run_batch_audits", "audit_stamp", "build_cli_report"]
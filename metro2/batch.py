@@ -0,0 +1,280 @@
+"""Parse many reports in parallel worker processes.
+
+Each worker imports the parser, the audit rule tables and the report adapters
+once in its initializer, then handles chunks of reports.  Failures are
+captured per report so one bad upload does not abort the whole batch; a
+worker that dies takes the pool down with it, so the batch moves to a fresh
+pool and retries the affected reports one at a time before reporting them
+as failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_CHUNKSIZE = 1
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """Outcome of one report: either ``payload`` or ``error`` is set."""
+
+    index: int
+    source: str
+    payload: Optional[Dict[str, Any]]
+    error: Optional[str]
+    seconds: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    reports: int
+    errors: int
+    seconds: float
+    workers: int
+
+    @property
+    def reports_per_second(self) -> float:
+        return self.reports / self.seconds if self.seconds > 0 else 0.0
+
+    def describe(self) -> str:
+        return (
+            f"Parsed {self.reports} reports ({self.errors} failed) in {self.seconds:.2f}s "
+            f"with {self.workers} worker(s): {self.reports_per_second:.1f} reports/sec"
+        )
+
+
+def _describe_source(source: Any) -> str:
+    if isinstance(source, Path):
+        return str(source)
+    if isinstance(source, str) and not ("<" in source and ">" in source):
+        return source
+    return "<markup>"
+
+
+def _init_worker() -> None:
+    # Pay the import and rule-table setup cost once per process, not per report.
+    from . import audit_rules, parser  # noqa: F401
+
+
+def _parse_one(index: int, source: Any, include_personal: bool) -> BatchResult:
+    from .parser import parse_client_portal_data, parse_negative_item_cards
+
+    parse = parse_client_portal_data if include_personal else parse_negative_item_cards
+    started = time.perf_counter()
+    payload: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    try:
+        payload = parse(source)
+    except Exception as exc:
+        error = _describe_error(exc)
+    return BatchResult(
+        index=index,
+        source=_describe_source(source),
+        payload=payload,
+        error=error,
+        seconds=time.perf_counter() - started,
+    )
+
+
+def _parse_chunk(chunk: Sequence[Tuple[int, Any]], include_personal: bool) -> List[BatchResult]:
+    return [_parse_one(index, source, include_personal) for index, source in chunk]
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    chunk: List[Tuple[int, Any]] = []
+    for index, item in enumerate(items):
+        chunk.append((index, item))
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def parse_reports_many(
+    sources: Iterable[Any],
+    workers: Optional[int] = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    ordered: bool = True,
+    include_personal: bool = True,
+    on_summary: Optional[Callable[[BatchSummary], None]] = None,
+) -> Iterator[BatchResult]:
+    """Parse ``sources`` across ``workers`` processes, yielding :class:`BatchResult`.
+
+    Results come back in input order when ``ordered`` is true, otherwise as
+    soon as each chunk of ``chunksize`` reports finishes.  ``workers`` defaults
+    to the CPU count; ``0`` or ``1`` parses in the calling process.  At most
+    ``2 * workers`` chunks are in flight, so ``sources`` may be a lazy
+    iterable.  When the batch is exhausted ``on_summary`` receives the
+    throughput figures.
+    """
+
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    started = time.perf_counter()
+    count = errors = 0
+    for result in _run_batch(sources, workers, chunksize, ordered, include_personal):
+        count += 1
+        errors += 0 if result.ok else 1
+        yield result
+
+    if on_summary is not None:
+        on_summary(
+            BatchSummary(
+                reports=count,
+                errors=errors,
+                seconds=time.perf_counter() - started,
+                workers=max(workers, 1),
+            )
+        )
+
+
+def _run_batch(
+    sources: Iterable[Any],
+    workers: int,
+    chunksize: int,
+    ordered: bool,
+    include_personal: bool,
+) -> Iterator[BatchResult]:
+    if workers <= 1:
+        _init_worker()
+        for chunk in _chunks(sources, chunksize):
+            yield from _parse_chunk(chunk, include_personal)
+        return
+
+    chunks = _chunks(sources, chunksize)
+    buffered: Dict[int, BatchResult] = {}
+    next_index = 0
+    # Reports whose worker died, to be parsed again one per task.
+    retries: Deque[List[Tuple[int, Any]]] = deque()
+    executor = _new_executor(workers)
+    try:
+        in_flight: Dict[Future, Tuple[ProcessPoolExecutor, List[Tuple[int, Any]], bool]] = {}
+        exhausted = False
+        while in_flight or retries or not exhausted:
+            if retries:
+                # Retries run alone, so a report that kills its worker again
+                # cannot take other reports down with it.
+                if not in_flight:
+                    chunk = retries.popleft()
+                    future = executor.submit(_parse_chunk, chunk, include_personal)
+                    in_flight[future] = (executor, chunk, True)
+            # Results held back for ordering count against the in-flight budget.
+            while (
+                not retries
+                and not exhausted
+                and len(in_flight) + len(buffered) // chunksize < workers * 2
+            ):
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                future = executor.submit(_parse_chunk, chunk, include_personal)
+                in_flight[future] = (executor, chunk, False)
+            if not in_flight:
+                break
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                owner, chunk, retried = in_flight.pop(future)
+                try:
+                    results = future.result()
+                except Exception as exc:
+                    # A worker crash (e.g. OOM-killed) breaks the whole pool:
+                    # start a fresh one and give each report of the chunk one
+                    # more try on its own before reporting it as failed.
+                    if isinstance(exc, BrokenProcessPool) and owner is executor:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = _new_executor(workers)
+                    if not retried:
+                        retries.extend([item] for item in chunk)
+                        continue
+                    results = [_failed(index, source, exc) for index, source in chunk]
+                for result in results:
+                    if not ordered:
+                        yield result
+                        continue
+                    buffered[result.index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _new_executor(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+
+def _failed(index: int, source: Any, exc: BaseException) -> BatchResult:
+    return BatchResult(
+        index=index,
+        source=_describe_source(source),
+        payload=None,
+        error=_describe_error(exc),
+        seconds=0.0,
+    )
+
+
+def _describe_error(exc: BaseException) -> str:
+    return "".join(traceback.format_exception_only(type(exc), exc)).strip()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Parse and audit many Metro 2 reports.")
+    parser.add_argument("reports", nargs="+", type=Path, help="HTML or PDF report paths")
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE)
+    parser.add_argument("--unordered", action="store_true", help="Emit results as they finish")
+    parser.add_argument("--negative-only", action="store_true", help="Skip personal information")
+    args = parser.parse_args(argv)
+
+    summaries: List[BatchSummary] = []
+    for result in parse_reports_many(
+        args.reports,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        ordered=not args.unordered,
+        include_personal=not args.negative_only,
+        on_summary=summaries.append,
+    ):
+        record = {"source": result.source, "seconds": round(result.seconds, 4)}
+        if result.ok:
+            record["payload"] = result.payload
+        else:
+            record["error"] = result.error
+        print(json.dumps(record, ensure_ascii=False))
+
+    for summary in summaries:
+        print(summary.describe(), file=sys.stderr)
+    return 1 if any(summary.errors for summary in summaries) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+__all__ = [
+    "BatchResult",
+    "BatchSummary",
+    "parse_reports_many",
+    "main",
+]
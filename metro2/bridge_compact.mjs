@@ -0,0 +1,96 @@
+// Compact columnar encoding of the bridge's tradelines (``--compact``).
+//
+// The nested ``tradelines`` array (meta + per_bureau objects + a shared
+// violations list) is replaced by:
+//   fields    interned field names, shared by every bureau
+//   creditors meta.creditor per tradeline (null when absent)
+//   bureaus   one block per bureau: ``rows`` (tradeline index per record),
+//             ``columns`` as [fieldIndex, values[]] pairs (null = field
+//             absent), ``nulls`` for cells that really are null, and
+//             ``violations`` already filtered to that bureau (null = none)
+//   sequence  bureau block index of every record in original order
+// metro2/parser.py decodes this straight into flat per-bureau tradelines.
+export const COMPACT_FORMAT = 'metro2-compact/1';
+
+function isPlainObject(value){
+  return Boolean(value) && typeof value === 'object' && !Array.isArray(value);
+}
+
+export function compactPayload(result){
+  if(!isPlainObject(result) || !Array.isArray(result.tradelines) || !result.tradelines.length){
+    return result;
+  }
+
+  const fields = [];
+  const fieldIndex = new Map();
+  const intern = (name) => {
+    let index = fieldIndex.get(name);
+    if(index === undefined){
+      index = fields.length;
+      fields.push(name);
+      fieldIndex.set(name, index);
+    }
+    return index;
+  };
+
+  const blocks = [];
+  const blockIndex = new Map();
+  const creditors = [];
+  const sequence = [];
+
+  result.tradelines.forEach((entry, row) => {
+    if(!isPlainObject(entry)){
+      creditors.push(null);
+      return;
+    }
+    const meta = isPlainObject(entry.meta) ? entry.meta : {};
+    creditors.push(meta.creditor ?? null);
+    const violations = Array.isArray(entry.violations) ? entry.violations : [];
+    const perBureau = isPlainObject(entry.per_bureau) ? entry.per_bureau : {};
+    for(const [bureau, data] of Object.entries(perBureau)){
+      if(!isPlainObject(data)) continue;
+      let index = blockIndex.get(bureau);
+      if(index === undefined){
+        index = blocks.length;
+        blocks.push({ name: bureau, rows: [], columns: new Map(), nulls: [], violations: [] });
+        blockIndex.set(bureau, index);
+      }
+      const block = blocks[index];
+      const position = block.rows.length;
+      block.rows.push(row);
+      for(const [name, value] of Object.entries(data)){
+        const field = intern(name);
+        let column = block.columns.get(field);
+        if(!column){
+          column = new Array(position).fill(null);
+          block.columns.set(field, column);
+        }
+        column[position] = value ?? null;
+        if(value === null) block.nulls.push([position, field]);
+      }
+      for(const column of block.columns.values()){
+        if(column.length <= position) column.push(null);
+      }
+      const own = violations.filter((v) => isPlainObject(v) && v.bureau === bureau);
+      block.violations.push(own.length ? own : null);
+      sequence.push(index);
+    }
+  });
+
+  return {
+    ...result,
+    format: COMPACT_FORMAT,
+    tradelines: {
+      fields,
+      creditors,
+      sequence,
+      bureaus: blocks.map((block) => ({
+        name: block.name,
+        rows: block.rows,
+        columns: [...block.columns.entries()],
+        nulls: block.nulls,
+        violations: block.violations,
+      })),
+    },
+  };
+}
@@ -0,0 +1,373 @@
+"""Warm pool of Node parser-bridge workers.
+
+Spawning ``node node_parser_bridge.mjs`` per report re-loads cheerio and the
+CRM parser before a single byte is parsed.  The pool keeps a few bridge
+processes running in ``--serve`` mode and talks to them with length-prefixed
+frames: each request is a 4-byte big-endian length followed by the UTF-8
+report markup, and each reply is a 4-byte length followed by the JSON payload.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import selectors
+import struct
+import subprocess
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Sequence
+
+NODE_BRIDGE = Path(__file__).with_name("node_parser_bridge.mjs")
+FRAME_HEADER = struct.Struct(">I")
+WRITE_CHUNK_BYTES = 1 << 16
+# How often an in-flight request re-checks its cancel event.
+CANCEL_POLL_SECONDS = 0.05
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 60.0
+DEFAULT_MAX_REQUESTS = 500
+
+
+class BridgeError(RuntimeError):
+    """Raised when a bridge worker fails to answer a request."""
+
+
+class BridgeTimeout(BridgeError):
+    """Raised when a bridge worker does not answer before its deadline."""
+
+
+class BridgeCancelled(BridgeError):
+    """Raised when the caller abandons an in-flight request."""
+
+
+def bridge_output_flags() -> List[str]:
+    """Extra bridge CLI flags; ``METRO2_BRIDGE_COMPACT`` selects the columnar payload."""
+
+    raw = (os.getenv("METRO2_BRIDGE_COMPACT") or "").strip().lower()
+    return [] if raw in ("", "0", "false", "no", "off") else ["--compact"]
+
+
+def default_bridge_command() -> List[str]:
+    return ["node", str(NODE_BRIDGE), "--serve", *bridge_output_flags()]
+
+
+class BridgeWorker:
+    """One long-lived bridge process handling requests sequentially."""
+
+    def __init__(self, command: Sequence[str]) -> None:
+        try:
+            self.process = subprocess.Popen(
+                list(command),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as exc:
+            raise BridgeError(f"Unable to start parser bridge: {exc}") from exc
+        assert self.process.stdin is not None and self.process.stdout is not None
+        self._stdin_fd = self.process.stdin.fileno()
+        self._stdout_fd = self.process.stdout.fileno()
+        os.set_blocking(self._stdin_fd, False)
+        os.set_blocking(self._stdout_fd, False)
+        self.requests_served = 0
+        self.last_reply_bytes = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def request(
+        self,
+        body: bytes,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """Send one framed request and return the decoded JSON reply.
+
+        Setting ``cancel`` from another thread aborts the request with
+        :class:`BridgeCancelled`; the worker is then killed because its
+        reply stream is out of sync.
+        """
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            self._write_all(FRAME_HEADER.pack(len(body)), deadline, cancel)
+            self._write_all(body, deadline, cancel)
+            header = self._read_exact(FRAME_HEADER.size, deadline, cancel)
+            (size,) = FRAME_HEADER.unpack(header)
+            raw = self._read_exact(size, deadline, cancel)
+        except BridgeError:
+            self.close()
+            raise
+        except OSError as exc:
+            self.close()
+            raise BridgeError(f"Parser bridge I/O failed: {exc}") from exc
+
+        self.requests_served += 1
+        self.last_reply_bytes = size
+        try:
+            payload = json.loads(raw.decode("utf-8") or "{}")
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return {}
+        return payload if isinstance(payload, dict) else {}
+
+    def close(self) -> None:
+        if self.alive:
+            self.process.kill()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                if stream is not None:
+                    stream.close()
+            except OSError:
+                pass
+
+    def _wait(
+        self,
+        selector: selectors.BaseSelector,
+        deadline: Optional[float],
+        cancel: Optional[threading.Event],
+    ) -> bool:
+        """Block until the fd is ready; ``False`` means poll again."""
+
+        if cancel is not None and cancel.is_set():
+            raise BridgeCancelled("Parser bridge request cancelled")
+        remaining = None if deadline is None else deadline - time.monotonic()
+        if remaining is not None and remaining <= 0:
+            raise BridgeTimeout("Parser bridge request timed out")
+        if cancel is not None:
+            remaining = min(remaining or CANCEL_POLL_SECONDS, CANCEL_POLL_SECONDS)
+        return bool(selector.select(remaining))
+
+    def _write_all(
+        self, data: bytes, deadline: Optional[float], cancel: Optional[threading.Event] = None
+    ) -> None:
+        view = memoryview(data)
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._stdin_fd, selectors.EVENT_WRITE)
+            while view:
+                if not self._wait(selector, deadline, cancel):
+                    continue
+                try:
+                    written = os.write(self._stdin_fd, view[:WRITE_CHUNK_BYTES])
+                except BlockingIOError:
+                    continue
+                except BrokenPipeError as exc:
+                    raise BridgeError("Parser bridge exited while receiving input") from exc
+                view = view[written:]
+
+    def _read_exact(
+        self, size: int, deadline: Optional[float], cancel: Optional[threading.Event] = None
+    ) -> bytes:
+        buffer = bytearray()
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._stdout_fd, selectors.EVENT_READ)
+            while len(buffer) < size:
+                if not self._wait(selector, deadline, cancel):
+                    continue
+                try:
+                    chunk = os.read(self._stdout_fd, size - len(buffer))
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    raise BridgeError("Parser bridge exited before replying")
+                buffer.extend(chunk)
+        return bytes(buffer)
+
+
+class BridgePool:
+    """Bounded pool of warm :class:`BridgeWorker` processes.
+
+    Workers are spawned lazily, replaced when they crash or time out, and
+    recycled after ``max_requests`` replies to cap long-lived Node heaps.
+    """
+
+    def __init__(
+        self,
+        command: Optional[Sequence[str]] = None,
+        size: int = DEFAULT_WORKERS,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        max_requests: int = DEFAULT_MAX_REQUESTS,
+    ) -> None:
+        if size < 1:
+            raise ValueError("BridgePool size must be at least 1")
+        self.command = list(command or default_bridge_command())
+        self.size = size
+        self.timeout = timeout
+        self.max_requests = max_requests
+        self.pid = os.getpid()
+        self._idle: Deque[BridgeWorker] = deque()
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._closed = False
+        self.counters: Dict[str, int] = {
+            "spawned": 0,
+            "requests": 0,
+            "recycled": 0,
+            "crashed": 0,
+            "timeouts": 0,
+            "cancelled": 0,
+        }
+
+    @contextmanager
+    def borrow(self) -> Iterator[BridgeWorker]:
+        """Yield a live worker, returning it to the pool when healthy."""
+
+        if self._closed:
+            raise BridgeError("Parser bridge pool is closed")
+        self._slots.acquire()
+        worker: Optional[BridgeWorker] = None
+        healthy = False
+        try:
+            worker = self._acquire()
+            yield worker
+            healthy = True
+        except BridgeTimeout:
+            self._count("timeouts")
+            raise
+        except BridgeCancelled:
+            self._count("cancelled")
+            raise
+        except BridgeError:
+            self._count("crashed")
+            raise
+        finally:
+            if worker is not None:
+                self._release(worker, healthy)
+            self._slots.release()
+
+    def parse(
+        self,
+        body: bytes,
+        sizes: Optional[Dict[str, int]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """Parse ``body`` on a pooled worker; ``sizes`` receives ``reply_bytes``."""
+
+        with self.borrow() as worker:
+            self._count("requests")
+            payload = worker.request(body, self.timeout, cancel)
+            if sizes is not None:
+                sizes["reply_bytes"] = worker.last_reply_bytes
+            return payload
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            snapshot = dict(self.counters)
+            snapshot["idle"] = len(self._idle)
+        return snapshot
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers = list(self._idle)
+            self._idle.clear()
+        for worker in workers:
+            worker.close()
+
+    def _acquire(self) -> BridgeWorker:
+        while True:
+            with self._lock:
+                worker = self._idle.pop() if self._idle else None
+            if worker is None:
+                worker = BridgeWorker(self.command)
+                self._count("spawned")
+                return worker
+            if worker.alive:
+                return worker
+            worker.close()
+            self._count("crashed")
+
+    def _release(self, worker: BridgeWorker, healthy: bool) -> None:
+        if not healthy or not worker.alive or self._closed:
+            worker.close()
+            return
+        if self.max_requests and worker.requests_served >= self.max_requests:
+            worker.close()
+            self._count("recycled")
+            return
+        with self._lock:
+            self._idle.append(worker)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] += 1
+
+
+_DEFAULT_POOL: Optional[BridgePool] = None
+_DEFAULT_POOL_LOCK = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw in (None, ""):
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def default_bridge_timeout() -> Optional[float]:
+    """Per-request deadline from ``METRO2_BRIDGE_TIMEOUT`` (``0`` disables it)."""
+
+    timeout = _env_number("METRO2_BRIDGE_TIMEOUT", DEFAULT_TIMEOUT)
+    return timeout if timeout > 0 else None
+
+
+def get_default_pool() -> Optional[BridgePool]:
+    """Return the process-wide bridge pool, or ``None`` when disabled.
+
+    Sized by ``METRO2_BRIDGE_WORKERS`` (``0`` disables pooling), with
+    ``METRO2_BRIDGE_TIMEOUT`` seconds per request and recycling after
+    ``METRO2_BRIDGE_MAX_REQUESTS`` replies.
+    """
+
+    global _DEFAULT_POOL
+    size = int(_env_number("METRO2_BRIDGE_WORKERS", DEFAULT_WORKERS))
+    if size < 1:
+        return None
+    with _DEFAULT_POOL_LOCK:
+        # Pipes inherited through fork() belong to the parent; start fresh.
+        if _DEFAULT_POOL is not None and _DEFAULT_POOL.pid != os.getpid():
+            _DEFAULT_POOL = None
+        if _DEFAULT_POOL is None:
+            _DEFAULT_POOL = BridgePool(
+                size=size,
+                timeout=default_bridge_timeout(),
+                max_requests=int(_env_number("METRO2_BRIDGE_MAX_REQUESTS", DEFAULT_MAX_REQUESTS)),
+            )
+        return _DEFAULT_POOL
+
+
+def shutdown_default_pool() -> None:
+    global _DEFAULT_POOL
+    with _DEFAULT_POOL_LOCK:
+        pool, _DEFAULT_POOL = _DEFAULT_POOL, None
+    if pool is not None and pool.pid == os.getpid():
+        pool.close()
+
+
+atexit.register(shutdown_default_pool)
+
+
+__all__ = [
+    "BridgeCancelled",
+    "BridgeError",
+    "BridgePool",
+    "BridgeTimeout",
+    "BridgeWorker",
+    "bridge_output_flags",
+    "default_bridge_command",
+    "default_bridge_timeout",
+    "get_default_pool",
+    "shutdown_default_pool",
+]
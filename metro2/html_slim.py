@@ -0,0 +1,104 @@
+"""Byte-level pre-filter that slims report markup before it is parsed.
+
+Exported IdentityIQ pages carry inline ``<script>``/``<style>`` blocks, SVG
+charts, base64 ``data:`` URIs and deep indentation, none of which the Node
+bridge or the DOM fallback read.  :func:`slim_html` drops them with a couple
+of regex passes over the raw buffer (bytes or text), which is far cheaper
+than letting the tree builder materialize them.  Set ``METRO2_HTML_SLIM=0``
+to parse the markup untouched.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Any, Dict, List, Tuple
+
+# Opening tags of the blocks dropped whole.  The block scan below finds each
+# closing tag with one forward search and stops at the first block that is
+# never closed, so an unclosed <script> costs one pass over the tail rather
+# than one per later opening tag (as a lazy ``.*?</\1>`` would).
+_BLOCK_NAMES = ("script", "style", "svg")
+_BLOCK_OPEN = r"<(script|style|svg)\b"
+
+# (pattern, replacement) pairs.  Each pattern leads with a literal so the
+# regex engine can skip ahead with a fast substring search; folding them into
+# one alternation is several times slower on real reports.
+_RULES = (
+    (r"data:(?<=[\"'(]data:)[^\"')]*", "", 0),
+    # Indentation: whitespace runs that contain a line break and touch a tag
+    # boundary become one newline, so every text node keeps its stripped
+    # content and whitespace-only nodes stay whitespace-only.
+    (r">[ \t\f\r]*\n[ \t\f\r\n]*", ">\n", 0),
+    (r"\n[ \t\f\r\n]+<", "\n<", 0),
+)
+_TEXT_PATTERNS = tuple((re.compile(pattern, flags), repl) for pattern, repl, flags in _RULES)
+_BYTE_PATTERNS = tuple(
+    (re.compile(pattern.encode(), flags), repl.encode()) for pattern, repl, flags in _RULES
+)
+_TEXT_BLOCKS = (
+    re.compile(_BLOCK_OPEN, re.IGNORECASE),
+    re.compile(">"),
+    {name: re.compile(rf"</{name}\s*>", re.IGNORECASE) for name in _BLOCK_NAMES},
+)
+_BYTE_BLOCKS = (
+    re.compile(_BLOCK_OPEN.encode(), re.IGNORECASE),
+    re.compile(b">"),
+    {name.encode(): re.compile(rf"</{name}\s*>".encode(), re.IGNORECASE) for name in _BLOCK_NAMES},
+)
+
+
+def slim_enabled() -> bool:
+    raw = (os.getenv("METRO2_HTML_SLIM") or "").strip().lower()
+    return raw not in ("0", "false", "no", "off")
+
+
+def slim_html(markup: Any) -> Tuple[Any, int]:
+    """Return ``(slimmed, removed)`` for ``markup`` (text or a bytes-like buffer).
+
+    Text comes back as ``str`` and buffers as ``bytes``; ``removed`` is the
+    size difference in the input's own units.
+    """
+
+    if isinstance(markup, str):
+        slimmed = _strip_blocks(markup, _TEXT_BLOCKS)
+        patterns = _TEXT_PATTERNS
+    else:
+        slimmed = _strip_blocks(markup, _BYTE_BLOCKS)
+        patterns = _BYTE_PATTERNS
+    for pattern, replacement in patterns:
+        slimmed = pattern.sub(replacement, slimmed)
+    return slimmed, len(markup) - len(slimmed)
+
+
+def _strip_blocks(markup: Any, blocks: Tuple[Any, Any, Dict[Any, Any]]) -> Any:
+    """Drop ``<script>``/``<style>``/``<svg>`` elements, self-closing or not."""
+
+    open_re, tag_end_re, close_res = blocks
+    pieces: List[Any] = []
+    pos = 0
+    while True:
+        opened = open_re.search(markup, pos)
+        if opened is None:
+            break
+        tag_end = tag_end_re.search(markup, opened.end())
+        if tag_end is None:
+            break
+        end = tag_end.end()
+        if markup[end - 2 : end - 1] not in (b"/", "/"):
+            closed = close_res[opened.group(1).lower()].search(markup, end)
+            if closed is None:
+                break
+            end = closed.end()
+        pieces.append(markup[pos : opened.start()])
+        pos = end
+    if not pieces:
+        return markup
+    pieces.append(markup[pos:])
+    return ("" if isinstance(markup, str) else b"").join(pieces)
+
+
+__all__ = [
+    "slim_enabled",
+    "slim_html",
+]
@@ -3,6 +3,13 @@ import fs from 'fs';
 import path from 'path';
 import { fileURLToPath } from 'url';
 import { createRequire } from 'module';
+import { compactPayload } from './bridge_compact.mjs';
+
+const FRAME_HEADER_BYTES = 4;
+const flags = new Set(process.argv.slice(2).filter((arg) => arg.startsWith('--')));
+const inputArg = process.argv.slice(2).find((arg) => !arg.startsWith('--'));
+// --compact swaps the nested tradelines for the columnar layout in bridge_compact.mjs.
+const encode = flags.has('--compact') ? compactPayload : (payload) => payload;
 
 async function readStdin(){
   const chunks = [];
@@ -12,14 +19,55 @@ async function readStdin(){
   return Buffer.concat(chunks).toString('utf-8');
 }
 
-async function main(){
+async function loadParser(){
   const __dirname = path.dirname(fileURLToPath(import.meta.url));
   const crmDir = path.resolve(__dirname, '../metro2 (copy 1)/crm');
   const requireFromCrm = createRequire(path.join(crmDir, 'package.json'));
   const cheerio = requireFromCrm('cheerio');
   const { parseCreditReportHTML } = await import(path.join(crmDir, 'parser.js'));
+  return (html) => {
+    const $ = cheerio.load(html || '', { decodeEntities: false });
+    return parseCreditReportHTML($) || {};
+  };
+}
 
-  const inputArg = process.argv[2];
+function writeFrame(payload){
+  const body = Buffer.from(JSON.stringify(payload), 'utf-8');
+  const header = Buffer.alloc(FRAME_HEADER_BYTES);
+  header.writeUInt32BE(body.length, 0);
+  process.stdout.write(Buffer.concat([header, body]));
+}
+
+// Long-lived worker mode used by metro2/bridge_pool.py. Each request is a
+// 4-byte big-endian length followed by the UTF-8 report markup; each reply is
+// a 4-byte length followed by the JSON payload. Frames are handled in order.
+async function serve(){
+  const parse = await loadParser();
+  let pending = Buffer.alloc(0);
+  for await (const chunk of process.stdin){
+    pending = Buffer.concat([pending, Buffer.isBuffer(chunk) ? chunk : Buffer.from(chunk)]);
+    while(pending.length >= FRAME_HEADER_BYTES){
+      const size = pending.readUInt32BE(0);
+      if(pending.length < FRAME_HEADER_BYTES + size) break;
+      const html = pending.subarray(FRAME_HEADER_BYTES, FRAME_HEADER_BYTES + size).toString('utf-8');
+      pending = pending.subarray(FRAME_HEADER_BYTES + size);
+      try {
+        writeFrame(encode(parse(html)));
+      } catch (error) {
+        console.error('[metro2-parser-bridge] %s', error && error.stack ? error.stack : error);
+        writeFrame({});
+      }
+    }
+  }
+}
+
+async function main(){
+  if(flags.has('--serve')){
+    await serve();
+    return;
+  }
+
+  const parse = await loadParser();
   let html = '';
   if(inputArg && inputArg !== '-'){
     html = await fs.promises.readFile(inputArg, 'utf-8');
@@ -27,12 +75,13 @@ async function main(){
     html = await readStdin();
   }
 
-  const $ = cheerio.load(html || '', { decodeEntities: false });
-  const parsed = parseCreditReportHTML($) || {};
-  process.stdout.write(JSON.stringify(parsed));
+  process.stdout.write(JSON.stringify(encode(parse(html))));
 }
 
 main().catch((error) => {
   console.error('[metro2-parser-bridge] %s', error && error.stack ? error.stack : error);
+  if(flags.has('--serve')){
+    process.exit(1);
+  }
   process.stdout.write('{}');
 });
@@ -0,0 +1,238 @@
+"""Content-addressed on-disk cache for parsed + audited reports.
+
+Entries are keyed on the SHA-256 of the raw report bytes together with the
+``include_personal`` flag, the HTML tree builder, the DOM build mode, the
+HTML slimming and compact bridge settings, a digest of the pipeline's own
+source files, the audit engine version and the audit "as of" date, so a
+re-uploaded report skips the bridge parse, the fallback parse and
+``run_all_audits`` entirely.  Storage is a single SQLite file whose total
+payload size is bounded with least-recently-used eviction.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from . import audit_rules
+from .bridge_pool import bridge_output_flags
+from .html_slim import slim_enabled
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+HASH_CHUNK_BYTES = 1 << 20
+# Every package file with one of these suffixes feeds the pipeline version.
+PIPELINE_SUFFIXES = (".py", ".mjs", ".json")
+
+
+def _pipeline_version() -> str:
+    digest = hashlib.sha256()
+    here = Path(__file__).resolve().parent
+    for candidate in sorted(here.iterdir()):
+        if candidate.suffix in PIPELINE_SUFFIXES and candidate.is_file():
+            digest.update(candidate.name.encode("utf-8"))
+            digest.update(candidate.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+PIPELINE_VERSION = _pipeline_version()
+
+
+def hash_report_source(doc: Any) -> Optional[str]:
+    """Return the SHA-256 of the raw report bytes, or ``None`` if unreadable."""
+
+    digest = hashlib.sha256()
+    path: Optional[Path] = None
+    if isinstance(doc, Path):
+        path = doc
+    elif isinstance(doc, str):
+        stripped = doc.strip()
+        if not ("<" in stripped and ">" in stripped) and not stripped.startswith("%PDF"):
+            candidate = Path(stripped)
+            if candidate.is_file():
+                path = candidate
+
+    if path is not None:
+        try:
+            with path.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+                    digest.update(chunk)
+        except OSError:
+            return None
+    elif isinstance(doc, (bytes, bytearray, memoryview, mmap.mmap)):
+        digest.update(doc)
+    elif doc is None:
+        return None
+    else:
+        digest.update(str(doc).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """SQLite-backed, size-bounded LRU store of parse results."""
+
+    def __init__(self, path: Union[str, Path], max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        import sqlite3  # only processes that actually enable the cache pay for it
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS parse_cache ("
+            " key TEXT PRIMARY KEY,"
+            " payload BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS parse_cache_last_access ON parse_cache (last_access)"
+        )
+        self._conn.commit()
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def key_for(
+        self,
+        doc: Any,
+        include_personal: bool,
+        backend: str = "html.parser",
+        dom_build: str = "full",
+    ) -> Optional[str]:
+        content_hash = hash_report_source(doc)
+        if content_hash is None:
+            return None
+        parts = (
+            content_hash,
+            "personal" if include_personal else "negative",
+            backend,
+            dom_build,
+            "slim" if slim_enabled() else "raw",
+            "compact" if bridge_output_flags() else "rows",
+            audit_rules.AUDIT_ENGINE_VERSION,
+            PIPELINE_VERSION,
+            audit_rules.today().isoformat(),
+        )
+        return ":".join(parts)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM parse_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            self._conn.execute(
+                "UPDATE parse_cache SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+            self.counters["hits"] += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        try:
+            payload = json.dumps(result, ensure_ascii=False).encode("utf-8")
+        except (TypeError, ValueError):
+            return
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO parse_cache (key, payload, size, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self.counters["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parse_cache"
+            ).fetchone()
+            snapshot = dict(self.counters)
+        snapshot.update({"entries": entries, "bytes": total})
+        return snapshot
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM parse_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> None:
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM parse_cache ORDER BY last_access ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM parse_cache WHERE key = ?", (key,))
+            total -= size
+            self.counters["evictions"] += 1
+
+
+_PARSE_CACHE: Optional[ParseCache] = None
+_PARSE_CACHE_CONFIGURED = False
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def configure_parse_cache(
+    path: Union[str, Path, None], max_bytes: int = DEFAULT_MAX_BYTES
+) -> Optional[ParseCache]:
+    """Install (or with ``path=None`` disable) the process-wide parse cache."""
+
+    global _PARSE_CACHE, _PARSE_CACHE_CONFIGURED
+    with _PARSE_CACHE_LOCK:
+        if _PARSE_CACHE is not None:
+            _PARSE_CACHE.close()
+        _PARSE_CACHE = ParseCache(path, max_bytes=max_bytes) if path else None
+        _PARSE_CACHE_CONFIGURED = True
+        return _PARSE_CACHE
+
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """Return the active cache, creating it from ``METRO2_PARSE_CACHE`` on first use."""
+
+    global _PARSE_CACHE, _PARSE_CACHE_CONFIGURED
+    if _PARSE_CACHE_CONFIGURED and (_PARSE_CACHE is None or _PARSE_CACHE.pid == os.getpid()):
+        return _PARSE_CACHE
+    with _PARSE_CACHE_LOCK:
+        # A SQLite connection inherited through fork() belongs to the parent;
+        # reopen the same file.
+        cache = _PARSE_CACHE
+        if cache is not None and cache.pid != os.getpid():
+            _PARSE_CACHE = ParseCache(cache.path, max_bytes=cache.max_bytes)
+        if not _PARSE_CACHE_CONFIGURED:
+            path = os.getenv("METRO2_PARSE_CACHE")
+            if path:
+                try:
+                    max_mb = float(os.getenv("METRO2_PARSE_CACHE_MAX_MB") or 0)
+                except ValueError:
+                    max_mb = 0
+                max_bytes = int(max_mb * 1024 * 1024) if max_mb > 0 else DEFAULT_MAX_BYTES
+                _PARSE_CACHE = ParseCache(path, max_bytes=max_bytes)
+            _PARSE_CACHE_CONFIGURED = True
+    return _PARSE_CACHE
+
+
+__all__ = [
+    "ParseCache",
+    "configure_parse_cache",
+    "get_parse_cache",
+    "hash_report_source",
+]
@@ -4,23 +4,65 @@
 
 from __future__ import annotations
 
+import codecs
 import json
+import mmap
+import os
+import queue
 import re
 import subprocess
 import sys
+import threading
+from dataclasses import dataclass
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Any, Callable, Dict, List, MutableMapping, Optional, Sequence, Tuple, Union
-
-from bs4 import BeautifulSoup, Tag
-
-from .audit_rules import build_cli_report, run_all_audits
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    IO,
+    FrozenSet,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, Tag
+from bs4.builder import builder_registry
+
+from .audit_rules import assign_account_group, build_cli_report, run_all_audits
+from .bridge_pool import (
+    CANCEL_POLL_SECONDS,
+    NODE_BRIDGE,
+    BridgeError,
+    bridge_output_flags,
+    get_default_pool,
+)
+from .html_slim import slim_enabled, slim_html
+from .parse_cache import get_parse_cache
+from .payment_history import is_grid_rows, parse_grid_rows
 from .pdf_parser import parse_credit_report_pdf
-from .report_adapters import ReportAdapterFactory
+from .report_adapters import ReportAdapterFactory, is_pdf_source
+from .timings import DISABLED, ParseTimings, TimingsCallback, timings_mode
 
 ALL_BUREAUS: Tuple[str, ...] = ("TransUnion", "Experian", "Equifax")
-NODE_BRIDGE = Path(__file__).with_name("node_parser_bridge.mjs")
 NON_CREDITOR_HEADERS = {"risk factors", "risk factor", "key factors", "score factors"}
 NON_CREDITOR_HEADER_PATTERNS = ("credit report", "reference #")
+# Tree builders in "auto" preference order; html.parser ships with Python.
+HTML_BACKENDS: Tuple[str, ...] = ("lxml", "html5lib", "html.parser")
+DEFAULT_HTML_BACKEND = "html.parser"
+DEFAULT_HEDGE_SMALL_BYTES = 64 * 1024
+# "restricted" builds only the nodes the fallback parsers read (see SectionStrainer).
+DOM_BUILD_MODES: Tuple[str, ...] = ("full", "restricted")
+DEFAULT_DOM_BUILD = "full"
+ReportSource = Union[str, Path, bytes, bytearray, memoryview, BeautifulSoup, Tag, None]
+# Report files this large are memory-mapped instead of read into memory.
+MMAP_THRESHOLD_BYTES = 1 << 20
 
 
 # ───────────── Shared helper utilities ─────────────
@@ -28,48 +70,221 @@ def text(cell: Optional[Any]) -> str:
     return cell.get_text(" ", strip=True) if cell is not None else ""
 
 
-def _coerce_html_inputs(
-    doc: Union[str, Path, BeautifulSoup, Tag, None]
-) -> Tuple[str, Callable[[], BeautifulSoup]]:
+def resolve_html_backend(backend: Optional[str] = None) -> str:
+    """Pick the BeautifulSoup tree builder for fallback parsing.
+
+    ``backend`` (or ``METRO2_HTML_BACKEND``) may be ``lxml``, ``html5lib``,
+    ``html.parser`` or ``auto``. ``auto`` takes the fastest installed builder;
+    an explicit choice that is not installed degrades to ``html.parser``.
+    """
+
+    requested = backend or os.getenv("METRO2_HTML_BACKEND") or DEFAULT_HTML_BACKEND
+    requested = requested.strip().lower()
+    if requested == "auto":
+        candidates: Tuple[str, ...] = HTML_BACKENDS
+    elif requested in HTML_BACKENDS:
+        candidates = (requested, DEFAULT_HTML_BACKEND)
+    else:
+        raise ValueError(
+            f"Unknown HTML backend {requested!r}; expected one of {HTML_BACKENDS} or 'auto'"
+        )
+    for name in candidates:
+        if builder_registry.lookup(name) is not None:
+            return name
+    return DEFAULT_HTML_BACKEND
+
+
+def available_html_backends() -> List[str]:
+    return [name for name in HTML_BACKENDS if builder_registry.lookup(name) is not None]
+
+
+def resolve_dom_build(mode: Optional[str] = None) -> str:
+    """Pick ``full`` or ``restricted`` DOM construction (``METRO2_DOM_BUILD``).
+
+    ``restricted`` needs the bs4 4.13+ ``parse_only`` filter hooks; on older
+    releases it degrades to ``full``.
+    """
+
+    requested = (mode or os.getenv("METRO2_DOM_BUILD") or DEFAULT_DOM_BUILD).strip().lower()
+    if requested not in DOM_BUILD_MODES:
+        raise ValueError(f"Unknown DOM build mode {requested!r}; expected one of {DOM_BUILD_MODES}")
+    if requested == "restricted" and not hasattr(SoupStrainer, "allow_tag_creation"):
+        return "full"
+    return requested
+
+
+class _ReportMarkup:
+    """Report markup kept as raw bytes until a Python parser needs text.
+
+    Files at or above ``MMAP_THRESHOLD_BYTES`` are memory-mapped rather than
+    read, and the raw buffer goes to the Node bridge untouched. UTF-8 decoding
+    (and the tree build) only happens if the DOM fallback actually runs.
+    """
+
+    __slots__ = ("raw", "features", "dom_build", "_text", "_soup")
+
+    def __init__(
+        self,
+        features: str,
+        raw: Any = None,
+        text: Optional[str] = None,
+        soup: Optional[BeautifulSoup] = None,
+        dom_build: str = DEFAULT_DOM_BUILD,
+    ) -> None:
+        self.raw = raw
+        self.features = features
+        self.dom_build = dom_build
+        self._text = text
+        self._soup = soup
+
+    @property
+    def body(self) -> Any:
+        return self.raw if self.raw is not None else self._text or ""
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    def slim(self) -> int:
+        """Run :func:`~metro2.html_slim.slim_html` over the markup; returns units removed.
+
+        Memory-mapped files are left as they are: slimming would copy the whole
+        mapping into a new ``bytes`` object, which is what mapping avoids.
+        """
+
+        if self._soup is not None or isinstance(self.raw, mmap.mmap):
+            return 0
+        if self.raw is None:
+            self._text, removed = slim_html(self._text or "")
+            return removed
+        slimmed, removed = slim_html(self.raw)
+        self.close()
+        self.raw, self._text = slimmed, None
+        return removed
+
+    def text(self) -> str:
+        if self._text is None:
+            # Match Path.read_text(): strict UTF-8 with universal newlines.
+            decoded = str(self.raw, "utf-8")
+            self._text = decoded.replace("\r\n", "\n").replace("\r", "\n") if "\r" in decoded else decoded
+        return self._text
+
+    def soup(self) -> BeautifulSoup:
+        if self._soup is not None:
+            return self._soup
+        if self.dom_build == "restricted":
+            return BeautifulSoup(self.text(), self.features, parse_only=SectionStrainer())
+        return BeautifulSoup(self.text(), self.features)
+
+    def close(self) -> None:
+        if isinstance(self.raw, mmap.mmap):
+            try:
+                self.raw.close()
+            except BufferError:
+                pass  # a view is still alive; the mapping closes when it is collected
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        raw = bytes(self.raw) if self.raw is not None and not isinstance(self.raw, bytes) else self.raw
+        return raw, self.features, self.dom_build, self._text
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        self.raw, self.features, self.dom_build, self._text = state
+        self._soup = None
+
+
+def _resolve_source(doc: Any) -> Any:
+    """Turn a string naming an existing file into a ``Path`` (one stat, once)."""
+
+    if isinstance(doc, str):
+        stripped = doc.strip()
+        if stripped and not ("<" in stripped and ">" in stripped) and not stripped.startswith("%PDF"):
+            candidate = Path(stripped)
+            if candidate.is_file():
+                return candidate
+    return doc
+
+
+def _read_report_bytes(path: Path) -> Any:
+    with path.open("rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= MMAP_THRESHOLD_BYTES:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return handle.read()
+
+
+def _load_markup(
+    doc: Any, backend: Optional[str] = None, dom_build: Optional[str] = None
+) -> _ReportMarkup:
+    if isinstance(doc, _ReportMarkup):
+        return doc
+    features = resolve_html_backend(backend)
+    mode = resolve_dom_build(dom_build)
     if isinstance(doc, BeautifulSoup):
-        html = str(doc)
-        return html, lambda: doc
+        return _ReportMarkup(features, text=str(doc), soup=doc)
     if isinstance(doc, Tag):
-        markup = str(doc)
-        return markup, lambda: BeautifulSoup(markup, "html.parser")
+        return _ReportMarkup(features, text=str(doc), dom_build=mode)
+    if isinstance(doc, (bytes, bytearray, memoryview)):
+        return _ReportMarkup(features, raw=doc, dom_build=mode)
+    doc = _resolve_source(doc)
     if isinstance(doc, Path):
-        html = doc.read_text(encoding="utf-8")
-        return html, lambda: BeautifulSoup(html, "html.parser")
-    if isinstance(doc, str):
-        stripped = doc.strip()
-        if "<" in stripped and ">" in stripped:
-            return doc, lambda: BeautifulSoup(doc, "html.parser")
-        candidate = Path(doc)
-        if candidate.exists():
-            html = candidate.read_text(encoding="utf-8")
-            return html, lambda: BeautifulSoup(html, "html.parser")
-        return doc, lambda: BeautifulSoup(doc, "html.parser")
-    html = "" if doc is None else str(doc)
-    return html, lambda: BeautifulSoup(html, "html.parser")
+        return _ReportMarkup(features, raw=_read_report_bytes(doc), dom_build=mode)
+    return _ReportMarkup(features, text="" if doc is None else str(doc), dom_build=mode)
 
 
-def _call_js_parser(html: str) -> Dict[str, Any]:
+def _call_js_parser(
+    html: Any, timings: Any = DISABLED, cancel: Optional[threading.Event] = None
+) -> Dict[str, Any]:
+    """Send ``html`` (text or any bytes-like buffer) to the Node bridge."""
+
     if not html or not NODE_BRIDGE.exists():
         return {}
 
+    body = html.encode("utf-8") if isinstance(html, str) else html
+    timings.count("bridge_request_bytes", len(body))
+    pool = get_default_pool()
+    if pool is None:
+        return _call_js_parser_once(body, timings, cancel)
+    sizes: Optional[Dict[str, int]] = {} if timings.enabled else None
     try:
-        completed = subprocess.run(
-            ["node", str(NODE_BRIDGE)],
-            input=html.encode("utf-8"),
+        payload = pool.parse(body, sizes, cancel)
+    except BridgeError:
+        return {}
+    if sizes:
+        timings.count("bridge_response_bytes", sizes["reply_bytes"])
+    return payload
+
+
+def _call_js_parser_once(
+    body: Any, timings: Any = DISABLED, cancel: Optional[threading.Event] = None
+) -> Dict[str, Any]:
+    try:
+        process = subprocess.Popen(
+            ["node", str(NODE_BRIDGE), *bridge_output_flags()],
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            check=True,
         )
-    except (OSError, subprocess.CalledProcessError):
+    except OSError:
+        return {}
+    pending: Optional[bytes] = body
+    while True:
+        try:
+            stdout, _ = process.communicate(
+                pending, timeout=None if cancel is None else CANCEL_POLL_SECONDS
+            )
+            break
+        except subprocess.TimeoutExpired:
+            pending = None
+            if cancel is not None and cancel.is_set():
+                process.kill()
+                process.communicate()
+                return {}
+    if process.returncode != 0:
         return {}
+    timings.count("bridge_response_bytes", len(stdout))
 
     try:
-        payload = json.loads(completed.stdout.decode("utf-8") or "{}")
+        payload = json.loads(stdout.decode("utf-8") or "{}")
         return payload if isinstance(payload, dict) else {}
     except json.JSONDecodeError:
         return {}
@@ -91,47 +306,93 @@ def _payload_has_data(payload: Dict[str, Any]) -> bool:
     )
 
 
-def _flatten_tradelines(tradelines: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+def _flatten_tradelines(tradelines: Any) -> List[Dict[str, Any]]:
+    if isinstance(tradelines, dict):
+        return _flatten_compact_tradelines(tradelines)
     flattened: List[Dict[str, Any]] = []
-    for entry in tradelines or []:
+    for row, entry in enumerate(tradelines or []):
         if not isinstance(entry, dict):
             continue
         per_bureau = entry.get("per_bureau") or {}
         meta = entry.get("meta") or {}
+        records: List[Dict[str, Any]] = []
         for bureau, data in per_bureau.items():
             if not isinstance(data, dict):
                 continue
-            record = {k: v for k, v in data.items()}
-            record["bureau"] = bureau
-            creditor = (
-                record.get("creditor_name")
-                or record.get("creditor")
-                or meta.get("creditor")
-            )
-            if creditor:
-                record["creditor_name"] = creditor
-            account_number = record.get("account_number") or record.get("accountNumber")
-            if account_number:
-                record["account_number"] = account_number
-                record.setdefault("account_#", account_number)
-            if "date_last_payment" in record and "date_of_last_payment" not in record:
-                record["date_of_last_payment"] = record["date_last_payment"]
-            if (
-                "date_first_delinquency" in record
-                and "date_of_first_delinquency" not in record
-            ):
-                record["date_of_first_delinquency"] = record["date_first_delinquency"]
             violations = [
                 dict(v)
                 for v in entry.get("violations", [])
                 if isinstance(v, dict) and v.get("bureau") == bureau
             ]
-            if violations:
-                record["violations"] = violations
-            flattened.append(record)
+            records.append(_finish_tradeline(dict(data), bureau, meta.get("creditor"), violations))
+        assign_account_group(records, _group_id(row))
+        flattened.extend(records)
     return flattened
 
 
+def _group_id(ordinal: int) -> str:
+    return f"tl-{ordinal}"
+
+
+def _flatten_compact_tradelines(compact: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Decode the bridge's ``--compact`` columnar tradelines (see bridge_compact.mjs)."""
+
+    fields: List[str] = compact.get("fields") or []
+    creditors: List[Any] = compact.get("creditors") or []
+    blocks: List[Tuple[str, List[Dict[str, Any]], List[Any], List[Any]]] = []
+    for block in compact.get("bureaus") or []:
+        rows = block.get("rows") or []
+        records: List[Dict[str, Any]] = [{} for _ in rows]
+        for field, values in block.get("columns") or []:
+            name = fields[field]
+            for record, value in zip(records, values):
+                if value is not None:
+                    record[name] = value
+        for position, field in block.get("nulls") or []:
+            records[position][fields[field]] = None
+        blocks.append((block.get("name"), records, rows, block.get("violations") or []))
+
+    flattened: List[Dict[str, Any]] = []
+    by_row: Dict[int, List[Dict[str, Any]]] = {}
+    cursors = [0] * len(blocks)
+    for index in compact.get("sequence") or []:
+        bureau, records, rows, violations = blocks[index]
+        position = cursors[index]
+        cursors[index] += 1
+        row = rows[position]
+        creditor = creditors[row] if row < len(creditors) else None
+        own = violations[position] if position < len(violations) else None
+        record = _finish_tradeline(records[position], bureau, creditor, own or [])
+        by_row.setdefault(row, []).append(record)
+        flattened.append(record)
+    for row, records in by_row.items():
+        assign_account_group(records, _group_id(row))
+    return flattened
+
+
+def _finish_tradeline(
+    record: Dict[str, Any],
+    bureau: str,
+    meta_creditor: Any,
+    violations: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    record["bureau"] = bureau
+    creditor = record.get("creditor_name") or record.get("creditor") or meta_creditor
+    if creditor:
+        record["creditor_name"] = creditor
+    account_number = record.get("account_number") or record.get("accountNumber")
+    if account_number:
+        record["account_number"] = account_number
+        record.setdefault("account_#", account_number)
+    if "date_last_payment" in record and "date_of_last_payment" not in record:
+        record["date_of_last_payment"] = record["date_last_payment"]
+    if "date_first_delinquency" in record and "date_of_first_delinquency" not in record:
+        record["date_of_first_delinquency"] = record["date_first_delinquency"]
+    if violations:
+        record["violations"] = violations
+    return record
+
+
 def _normalize_inquiries(payload: Dict[str, Any]) -> List[Dict[str, str]]:
     details = payload.get("inquiry_details")
     normalized: List[Dict[str, str]] = []
@@ -180,88 +441,384 @@ def _normalize_personal_info(payload: Dict[str, Any]) -> Dict[str, Dict[str, Any
 
 
 def _parse_with_bridge(
-    doc: Union[str, Path, BeautifulSoup, Tag, None],
+    doc: ReportSource,
     include_personal: bool = False,
+    backend: Optional[str] = None,
+    timings: Any = DISABLED,
 ) -> Dict[str, Any]:
-    html, soup_factory = _coerce_html_inputs(doc)
-    payload = _call_js_parser(html)
-    soup: Optional[BeautifulSoup] = None
+    with timings.stage("read"):
+        markup = _load_markup(doc, backend)
+    if slim_enabled():
+        with timings.stage("slim"):
+            timings.count("slim_removed", markup.slim())
+    delay = _hedge_delay(markup.size)
+    if delay is not None:
+        return _parse_hedged(markup.body, markup.soup, include_personal, delay, timings)
+    with timings.stage("bridge"):
+        payload = _call_js_parser(markup.body, timings)
+    return _assemble_report(payload, markup.soup, include_personal, timings)
+
+
+def _assemble_report(
+    payload: Dict[str, Any],
+    soup_factory: Callable[[], BeautifulSoup],
+    include_personal: bool,
+    timings: Any = DISABLED,
+) -> Dict[str, Any]:
+    """Normalize a bridge payload (falling back to the DOM parsers) and audit it."""
+
+    sections: Optional[SectionIndex] = None
+
+    def section_index() -> SectionIndex:
+        nonlocal sections
+        if sections is None:
+            with timings.stage("dom_build"):
+                sections = SectionIndex.build(soup_factory())
+        return sections
 
     if _payload_has_data(payload):
-        accounts = _flatten_tradelines(payload.get("tradelines"))
+        timings.count("engine", "bridge")
+        with timings.stage("normalize"):
+            accounts = _flatten_tradelines(payload.get("tradelines"))
+            inquiries = _normalize_inquiries(payload)
+            personal = _normalize_personal_info(payload) if include_personal else {}
         if not accounts:
-            soup = soup_factory()
-            accounts = _fallback_parse_account_history(soup)
-
-        inquiries = _normalize_inquiries(payload)
+            index = section_index()
+            with timings.stage("fallback"):
+                accounts = _fallback_parse_account_history(index)
         if not inquiries:
-            soup = soup or soup_factory()
-            inquiries = _fallback_parse_inquiries(soup)
+            index = section_index()
+            with timings.stage("fallback"):
+                inquiries = _fallback_parse_inquiries(index)
 
         result: Dict[str, Any] = {
             "accounts": accounts,
             "inquiries": inquiries,
         }
         if include_personal:
-            personal = _normalize_personal_info(payload)
             if not personal:
-                soup = soup or soup_factory()
-                personal = _fallback_parse_personal_info(soup)
+                index = section_index()
+                with timings.stage("fallback"):
+                    personal = _fallback_parse_personal_info(index)
             if personal:
                 result["personal_information"] = personal
             personal_cards = payload.get("personalInfo")
             if isinstance(personal_cards, dict) and personal_cards:
                 result["personalInfo"] = personal_cards
+        with timings.stage("audit"):
+            return run_all_audits(result)
+
+    timings.count("engine", "fallback")
+    index = section_index()
+    with timings.stage("fallback"):
+        result = _fallback_report(index, include_personal)
+    with timings.stage("audit"):
         return run_all_audits(result)
 
-    soup = soup_factory()
-    result = {
-        "accounts": _fallback_parse_account_history(soup),
-        "inquiries": _fallback_parse_inquiries(soup),
-    }
+
+def _fallback_report(
+    index: SectionIndex, include_personal: bool, cancel: Optional[threading.Event] = None
+) -> Optional[Dict[str, Any]]:
+    """Run every DOM fallback parser; ``None`` if ``cancel`` fires in between."""
+
+    steps: List[Tuple[str, Callable[[SectionIndex], Any]]] = [
+        ("accounts", _fallback_parse_account_history),
+        ("inquiries", _fallback_parse_inquiries),
+    ]
     if include_personal:
-        result["personal_information"] = _fallback_parse_personal_info(soup)
-    return run_all_audits(result)
+        steps.append(("personal_information", _fallback_parse_personal_info))
+    result: Dict[str, Any] = {}
+    for key, parse in steps:
+        if cancel is not None and cancel.is_set():
+            return None
+        result[key] = parse(index)
+    return result
+
+
+def _fallback_has_data(result: Optional[Dict[str, Any]]) -> bool:
+    if not result:
+        return False
+    personal = result.get("personal_information") or {}
+    return bool(
+        result.get("accounts") or result.get("inquiries") or any(personal.values())
+    )
+
+
+# ───────────── Hedged parsing ─────────────
+def _hedge_delay(size: int) -> Optional[float]:
+    """Seconds to give the bridge a head start, or ``None`` when hedging is off.
+
+    Enabled by ``METRO2_HEDGE_DELAY``; reports smaller than
+    ``METRO2_HEDGE_SMALL_BYTES`` start the fallback immediately.
+    """
+
+    raw = os.getenv("METRO2_HEDGE_DELAY")
+    if raw in (None, ""):
+        return None
+    try:
+        delay = float(raw)
+    except ValueError:
+        return None
+    if delay < 0:
+        return None
+    try:
+        small = int(os.getenv("METRO2_HEDGE_SMALL_BYTES") or DEFAULT_HEDGE_SMALL_BYTES)
+    except ValueError:
+        small = DEFAULT_HEDGE_SMALL_BYTES
+    return 0.0 if size < small else delay
+
+
+# Hedged races won per engine since import, kept whether or not timings are on.
+_HEDGE_WINS: Dict[str, int] = {"bridge": 0, "fallback": 0}
+_HEDGE_WINS_LOCK = threading.Lock()
+
+
+def hedge_stats() -> Dict[str, int]:
+    """How many hedged parses each engine (``bridge``/``fallback``) has won."""
+
+    with _HEDGE_WINS_LOCK:
+        return dict(_HEDGE_WINS)
+
+
+def _record_hedge_winner(engine: str, timings: Any) -> None:
+    with _HEDGE_WINS_LOCK:
+        _HEDGE_WINS[engine] += 1
+    timings.count("hedge_winner", engine)
+
+
+def _parse_hedged(
+    html: Any,
+    soup_factory: Callable[[], BeautifulSoup],
+    include_personal: bool,
+    delay: float,
+    timings: Any = DISABLED,
+) -> Dict[str, Any]:
+    """Race the Node bridge against the DOM fallback; first usable payload wins.
+
+    The bridge starts at once and the fallback after ``delay`` seconds (or as
+    soon as the bridge comes back empty). The loser is cancelled: the bridge
+    worker is killed, the fallback stops at its next step.
+    """
+
+    results: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    cancel_bridge = threading.Event()
+    cancel_fallback = threading.Event()
+
+    def run_bridge() -> None:
+        try:
+            results.put(("bridge", _call_js_parser(html, cancel=cancel_bridge)))
+        except Exception:
+            results.put(("bridge", {}))
+
+    def run_fallback() -> None:
+        try:
+            index = SectionIndex.build(soup_factory())
+            results.put(("fallback", _fallback_report(index, include_personal, cancel_fallback)))
+        except Exception as exc:
+            results.put(("fallback", exc))
+
+    def start(target: Callable[[], None], name: str) -> None:
+        threading.Thread(target=target, name=f"metro2-hedge-{name}", daemon=True).start()
+
+    start(run_bridge, "bridge")
+    running = {"bridge"}
+    fallback_started = False
+    fallback_result: Any = None
+    while running:
+        try:
+            engine, value = results.get(timeout=None if fallback_started else delay)
+        except queue.Empty:
+            engine, value = "head-start-elapsed", None
+        if engine == "fallback":
+            running.discard(engine)
+            fallback_result = value
+            # A failed fallback leaves the race to the bridge; its error is
+            # only raised if the bridge comes back empty too.
+            if not isinstance(value, BaseException) and _fallback_has_data(value):
+                cancel_bridge.set()
+                break
+            continue
+        if engine == "bridge":
+            running.discard(engine)
+            if _payload_has_data(value):
+                cancel_fallback.set()
+                _record_hedge_winner("bridge", timings)
+                return _assemble_report(value, soup_factory, include_personal, timings)
+        if not fallback_started:
+            start(run_fallback, "fallback")
+            fallback_started = True
+            running.add("fallback")
+
+    if isinstance(fallback_result, BaseException):
+        raise fallback_result
+    timings.count("engine", "fallback")
+    _record_hedge_winner("fallback", timings)
+    with timings.stage("audit"):
+        return run_all_audits(fallback_result or {"accounts": [], "inquiries": []})
+
+
+# ───────────── Section index ─────────────
+SECTION_PATTERNS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("personal_information", re.compile(r"Personal Information", re.I)),
+    ("account_history", re.compile(r"Account History", re.I)),
+    ("inquiries", re.compile(r"Inquiries", re.I)),
+)
+HEADER_TAGS = frozenset({"h2", "h3", "h4"})
+HEADER_CLASSES = frozenset({"sub_header", "section_header", "section-title", "section_header_title"})
+
+
+@dataclass(frozen=True)
+class TableContext:
+    """A table plus the section headings and creditor header that precede it."""
+
+    table: Tag
+    sections: FrozenSet[str]
+    header: Optional[Tag]
+
+
+@dataclass(frozen=True)
+class SectionIndex:
+    """Per-table section/header annotations built in one forward document walk.
+
+    A table belongs to every section whose heading text appears anywhere before
+    it, mirroring ``table.find_previous(string=...)``. Its header is the closest
+    preceding ``h2``-``h4``/section-header sibling of the table or one of its
+    ancestors, mirroring :func:`_find_nearest_header`.
+    """
+
+    soup: BeautifulSoup
+    tables: Tuple[TableContext, ...]
+
+    @classmethod
+    def build(cls, soup: BeautifulSoup) -> "SectionIndex":
+        seen: Set[str] = set()
+        pending = list(SECTION_PATTERNS)
+        tables: List[TableContext] = []
+        # One "closest header so far" slot per open element on the walk stack.
+        headers: List[Optional[Tag]] = [None]
+        stack: List[Tuple[Tag, Iterator[Any]]] = [(soup, iter(soup.contents))]
+        while stack:
+            element, children = stack[-1]
+            node = next(children, None)
+            if node is None:
+                stack.pop()
+                headers.pop()
+                if stack and _is_header_tag(element):
+                    headers[-1] = element
+                continue
+            if isinstance(node, NavigableString):
+                if pending:
+                    for name, pattern in list(pending):
+                        if pattern.search(node):
+                            seen.add(name)
+                            pending.remove((name, pattern))
+                continue
+            if not isinstance(node, Tag):
+                continue
+            if node.name == "table":
+                header = next((h for h in reversed(headers) if h is not None), None)
+                tables.append(TableContext(node, frozenset(seen), header))
+            stack.append((node, iter(node.contents)))
+            headers.append(None)
+        return cls(soup=soup, tables=tuple(tables))
+
+    def tables_in(self, section: str) -> Iterator[TableContext]:
+        return (ctx for ctx in self.tables if section in ctx.sections)
+
+
+def _is_header_tag(tag: Tag) -> bool:
+    if tag.name in HEADER_TAGS:
+        return True
+    if tag.name == "div":
+        return bool(set(tag.get("class") or []) & HEADER_CLASSES)
+    return False
+
+
+class SectionStrainer(SoupStrainer):
+    """``parse_only`` filter that builds just what :class:`SectionIndex` reads.
+
+    Tables (with their whole subtree), ``h2``-``h4`` and section-header divs
+    are kept, plus any stray string that names a section, so section
+    membership is unchanged. Everything else (wrappers, spans, Angular
+    directives) is never materialized; kept elements hang off the root, which
+    makes each table's header the closest header before it in document order.
+    """
+
+    def allow_tag_creation(self, nsprefix: Optional[str], name: str, attrs: Any) -> bool:
+        if name == "table" or name in HEADER_TAGS:
+            return True
+        if name == "div" and attrs:
+            classes = attrs.get("class") or ""
+            if isinstance(classes, str):
+                classes = classes.split()
+            return bool(set(classes) & HEADER_CLASSES)
+        return False
+
+    def allow_string_creation(self, string: str) -> bool:
+        return any(pattern.search(string) for _, pattern in SECTION_PATTERNS)
+
+
+def _section_index(source: Union[BeautifulSoup, SectionIndex]) -> SectionIndex:
+    if isinstance(source, SectionIndex):
+        return source
+    return SectionIndex.build(source)
 
 
 # ───────────── Fallback BeautifulSoup parsers ─────────────
-def _fallback_parse_personal_info(soup: BeautifulSoup) -> Dict[str, Dict[str, str]]:
+def _fallback_parse_personal_info(
+    soup: Union[BeautifulSoup, SectionIndex]
+) -> Dict[str, Dict[str, str]]:
     info: Dict[str, Dict[str, str]] = {bureau: {} for bureau in ALL_BUREAUS}
 
-    for table in soup.find_all("table"):
-        header = table.find_previous(string=re.compile(r"Personal Information", re.I))
-        if not header:
-            continue
+    for ctx in _section_index(soup).tables_in("personal_information"):
+        table = ctx.table
         for row in table.find_all("tr"):
             cells = row.find_all("td")
             if len(cells) < 4:
                 continue
-            label = text(cells[0])
-            normalized = re.sub(r"[^a-z0-9]+", "_", label.strip().lower()).strip("_")
-            for bureau, cell in zip(ALL_BUREAUS, cells[1:4]):
-                value = text(cell)
-                if not value:
-                    continue
-                info[bureau][normalized] = value
-                lowered = normalized.lower()
-                if "name" in lowered:
-                    info[bureau].setdefault("name", value)
-                if "address" in lowered:
-                    info[bureau].setdefault("address", value)
+            _merge_personal_row(info, text(cells[0]), [text(c) for c in cells[1:4]])
     return info
 
 
-def _fallback_parse_account_history(soup: BeautifulSoup) -> List[Dict[str, Any]]:
-    tradelines: List[Dict[str, Any]] = []
-    for table in soup.find_all("table"):
-        header = table.find_previous(string=re.compile(r"Account History", re.I))
-        if not header:
+def _merge_personal_row(
+    info: Dict[str, Dict[str, str]], label: str, values: Sequence[str]
+) -> None:
+    normalized = re.sub(r"[^a-z0-9]+", "_", label.strip().lower()).strip("_")
+    for bureau, value in zip(ALL_BUREAUS, values):
+        if not value:
             continue
+        info[bureau][normalized] = value
+        lowered = normalized.lower()
+        if "name" in lowered:
+            info[bureau].setdefault("name", value)
+        if "address" in lowered:
+            info[bureau].setdefault("address", value)
+
+
+def _fallback_parse_account_history(
+    soup: Union[BeautifulSoup, SectionIndex]
+) -> List[Dict[str, Any]]:
+    tradelines: List[Dict[str, Any]] = []
+    # Tradelines a following payment history grid applies to: those parsed
+    # since the previous grid inside the same top-level table.
+    pending: List[Dict[str, Any]] = []
+    pending_scope: Optional[Tag] = None
+    account_tables = 0
+    for ctx in _section_index(soup).tables_in("account_history"):
+        table = ctx.table
         rows = table.find_all("tr")
         if len(rows) < 3:
             continue
 
-        creditor = extract_creditor_name(table)
+        scope = _top_level_table(table)
+        if scope is not pending_scope:
+            pending, pending_scope = [], scope
+        if _is_payment_grid(rows):
+            _attach_payment_grids(pending, [[text(c) for c in row.find_all("td")] for row in rows])
+            pending = []
+            continue
+
+        creditor = _creditor_name_from_header(table, ctx.header)
         field_map: Dict[str, Dict[str, str]] = {}
         for row in rows:
             cells = row.find_all("td")
@@ -275,35 +832,80 @@ def _fallback_parse_account_history(soup: BeautifulSoup) -> List[Dict[str, Any]]
                 "Equifax": eqf,
             }
 
-        for bureau in ALL_BUREAUS:
-            bureau_creditor = creditor or _infer_creditor_from_fields(field_map, bureau)
-            tl: Dict[str, Any] = {"bureau": bureau}
-            if bureau_creditor:
-                tl["creditor_name"] = bureau_creditor
-            for field, values in field_map.items():
-                key = field.lower().replace(" ", "_").replace(":", "")
-                tl[key] = values.get(bureau)
-            if "account_number" in tl:
-                tl.setdefault("account_#", tl.get("account_number"))
-            if "date_last_payment" in tl and "date_of_last_payment" not in tl:
-                tl["date_of_last_payment"] = tl["date_last_payment"]
-            if "date_of_first_delinquency" not in tl and "date_first_delinquency" in tl:
-                tl["date_of_first_delinquency"] = tl["date_first_delinquency"]
-            tradelines.append(tl)
+        found = _tradelines_from_field_map(field_map, creditor, _group_id(account_tables))
+        account_tables += 1
+        tradelines.extend(found)
+        pending.extend(found)
+    return tradelines
+
+
+def _top_level_table(table: Tag) -> Tag:
+    outer = table.find_parents("table")
+    return outer[-1] if outer else table
+
+
+def _is_payment_grid(rows: Sequence[Tag]) -> bool:
+    return is_grid_rows([[text(row.find("td"))] for row in rows[:2]])
+
+
+def _attach_payment_grids(tradelines: Sequence[Dict[str, Any]], rows: Sequence[Sequence[str]]) -> None:
+    """Store each bureau's :class:`PaymentGrid` under ``payment_history``."""
+
+    grids = parse_grid_rows(rows, ALL_BUREAUS)
+    for tradeline in tradelines:
+        grid = grids.get(tradeline.get("bureau"))
+        if grid is not None:
+            tradeline["payment_history"] = grid
+
+
+def _tradelines_from_field_map(
+    field_map: Dict[str, Dict[str, str]], creditor: Optional[str], group_id: str
+) -> List[Dict[str, Any]]:
+    tradelines: List[Dict[str, Any]] = []
+    for bureau in ALL_BUREAUS:
+        bureau_creditor = creditor or _infer_creditor_from_fields(field_map, bureau)
+        tl: Dict[str, Any] = {"bureau": bureau}
+        if bureau_creditor:
+            tl["creditor_name"] = bureau_creditor
+        for field, values in field_map.items():
+            key = field.lower().replace(" ", "_").replace(":", "")
+            tl[key] = values.get(bureau)
+        if "account_number" in tl:
+            tl.setdefault("account_#", tl.get("account_number"))
+        if "date_last_payment" in tl and "date_of_last_payment" not in tl:
+            tl["date_of_last_payment"] = tl["date_last_payment"]
+        if "date_of_first_delinquency" not in tl and "date_first_delinquency" in tl:
+            tl["date_of_first_delinquency"] = tl["date_first_delinquency"]
+        tradelines.append(tl)
+    # Bureau columns without an account number (the bureau does not carry the
+    # account) stay ungrouped and are left to the audit engine's matching.
+    assign_account_group(
+        [tl for tl in tradelines if (tl.get("account_#") or "-") not in ("-", "--")], group_id
+    )
     return tradelines
 
 
 def extract_creditor_name(table: Any) -> Optional[str]:
     if not isinstance(table, Tag):
         return None
+    return _creditor_name_from_header(table, _find_nearest_header(table))
+
 
-    header = _find_nearest_header(table)
-    if header:
-        candidate = _sanitize_creditor(text(header))
+def _creditor_name_from_header(table: Tag, header: Optional[Tag]) -> Optional[str]:
+    return _creditor_name_from_text(
+        text(header) if header else None, lambda: table.get_text(" ", strip=True)
+    )
+
+
+def _creditor_name_from_text(
+    header_text: Optional[str], table_text: Callable[[], str]
+) -> Optional[str]:
+    if header_text:
+        candidate = _sanitize_creditor(header_text)
         if candidate and not _is_non_creditor_header(candidate):
             return candidate
 
-    text_block = table.get_text(" ", strip=True)
+    text_block = table_text()
     match = re.search(r"([A-Z0-9\s&.\-]+?)\s+(TransUnion|Experian|Equifax)\b", text_block)
     if match:
         candidate = _sanitize_creditor(match.group(1))
@@ -313,19 +915,12 @@ def extract_creditor_name(table: Any) -> Optional[str]:
 
 
 def _find_nearest_header(table: Tag) -> Optional[Tag]:
-    header_classes = {"sub_header", "section_header", "section-title", "section_header_title"}
-    header_tags = {"h2", "h3", "h4"}
     current: Optional[Tag] = table
     while current:
         sibling = current.previous_sibling
         while sibling:
-            if isinstance(sibling, Tag):
-                if sibling.name in header_tags:
-                    return sibling
-                if sibling.name == "div":
-                    classes = set(sibling.get("class") or [])
-                    if classes & header_classes:
-                        return sibling
+            if isinstance(sibling, Tag) and _is_header_tag(sibling):
+                return sibling
             sibling = sibling.previous_sibling
         current = current.parent if isinstance(current.parent, Tag) else None
     return None
@@ -364,12 +959,10 @@ def _infer_creditor_from_fields(
     return None
 
 
-def _fallback_parse_inquiries(soup: BeautifulSoup) -> List[Dict[str, str]]:
+def _fallback_parse_inquiries(soup: Union[BeautifulSoup, SectionIndex]) -> List[Dict[str, str]]:
     inquiries: List[Dict[str, str]] = []
-    for table in soup.find_all("table"):
-        header = table.find_previous(string=re.compile(r"Inquiries", re.I))
-        if not header:
-            continue
+    for ctx in _section_index(soup).tables_in("inquiries"):
+        table = ctx.table
         rows = table.find_all("tr")
         if len(rows) < 2:
             continue
@@ -382,50 +975,433 @@ def _fallback_parse_inquiries(soup: BeautifulSoup) -> List[Dict[str, str]]:
             cells = row.find_all("td")
             if len(cells) < 4:
                 continue
-            inquiries.append(
-                {
-                    "creditor_name": text(cells[0]),
-                    "type_of_business": text(cells[1]),
-                    "date_of_inquiry": text(cells[2]),
-                    "credit_bureau": text(cells[3]),
-                }
-            )
+            inquiries.append(_inquiry_from_cells([text(c) for c in cells[:4]]))
     return inquiries
 
 
+def _inquiry_from_cells(values: Sequence[str]) -> Dict[str, str]:
+    return {
+        "creditor_name": values[0],
+        "type_of_business": values[1],
+        "date_of_inquiry": values[2],
+        "credit_bureau": values[3],
+    }
+
+
+# ───────────── Streaming parser ─────────────
+STREAM_CHUNK_BYTES = 1 << 16
+# Elements html.parser's tree builder never pushes onto the open-element stack.
+VOID_TAGS = frozenset(
+    {
+        "area", "base", "basefont", "bgsound", "br", "col", "command", "embed",
+        "frame", "hr", "image", "img", "input", "isindex", "keygen", "link",
+        "menuitem", "meta", "nextid", "param", "source", "spacer", "track", "wbr",
+    }
+)
+# Raw-text elements whose contents never show up in ``get_text``.
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+ReportEvent = Tuple[str, Dict[str, Any]]
+
+
+class _StreamTable:
+    __slots__ = ("order", "sections", "header", "rows", "strings")
+
+    def __init__(self, order: int, sections: FrozenSet[str], header: Optional[str]) -> None:
+        self.order = order
+        self.sections = sections
+        self.header = header
+        self.rows: List[List[Tuple[str, List[str]]]] = []
+        self.strings: List[str] = []
+
+
+class _StreamFrame:
+    __slots__ = ("tag", "header", "capture", "table", "row", "cell")
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        self.header: Optional[str] = None
+        self.capture: Optional[List[str]] = None
+        self.table: Optional[_StreamTable] = None
+        self.row: Optional[List[Tuple[str, List[str]]]] = None
+        self.cell: Optional[Tuple[str, List[str]]] = None
+
+
+class _ReportStreamParser(HTMLParser):
+    """Incremental tokenizer that mirrors the fallback parsers table by table.
+
+    Only the outermost open table (and its nested tables) is buffered; each is
+    turned into tradeline/inquiry events as soon as its closing tag arrives.
+    Section membership and creditor headers follow :class:`SectionIndex`, so a
+    streamed report yields the same tradelines and inquiries as the DOM path.
+    Personal information is emitted once its section gives way to the next
+    one (or at end of input) instead of absorbing every later table.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.events: List[ReportEvent] = []
+        self._stack: List[_StreamFrame] = [_StreamFrame("[document]")]
+        self._data: List[str] = []
+        self._seen: Set[str] = set()
+        self._pending = list(SECTION_PATTERNS)
+        self._tables: List[_StreamTable] = []
+        self._rows: List[List[Tuple[str, List[str]]]] = []
+        self._cells: List[Tuple[str, List[str]]] = []
+        self._captures: List[List[str]] = []
+        self._closed_tables: List[_StreamTable] = []
+        self._table_count = 0
+        self._raw_text_depth = 0
+        self._personal: Optional[Dict[str, Dict[str, str]]] = None
+        self._personal_done = False
+        self._grid_pending: List[Dict[str, Any]] = []
+        self._account_tables = 0
+
+    # -- tokenizer callbacks -------------------------------------------------
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self._flush_data()
+        if tag in VOID_TAGS:
+            return
+        frame = _StreamFrame(tag)
+        if tag in NON_TEXT_TAGS:
+            self._raw_text_depth += 1
+        if tag in HEADER_TAGS or (tag == "div" and self._has_header_class(attrs)):
+            frame.capture = []
+            self._captures.append(frame.capture)
+        if tag == "table":
+            header = next((f.header for f in reversed(self._stack) if f.header is not None), None)
+            frame.table = _StreamTable(self._table_count, frozenset(self._seen), header)
+            self._table_count += 1
+            self._tables.append(frame.table)
+        elif tag == "tr":
+            frame.row = []
+            for table in self._tables:
+                table.rows.append(frame.row)
+            self._rows.append(frame.row)
+        elif tag in ("td", "th"):
+            frame.cell = (tag, [])
+            for row in self._rows:
+                row.append(frame.cell)
+            self._cells.append(frame.cell)
+        self._stack.append(frame)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_data()
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                break
+        else:
+            return
+        while len(self._stack) > index:
+            self._close_frame(self._stack.pop())
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_comment(self, data: str) -> None:
+        self._flush_data()
+        self._match_sections(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush_data()
+        while len(self._stack) > 1:
+            self._close_frame(self._stack.pop())
+        self._finish_personal()
+
+    # -- internals -----------------------------------------------------------
+    @staticmethod
+    def _has_header_class(attrs: List[Tuple[str, Optional[str]]]) -> bool:
+        for name, value in attrs:
+            if name == "class" and value and set(value.split()) & HEADER_CLASSES:
+                return True
+        return False
+
+    def _flush_data(self) -> None:
+        if not self._data:
+            return
+        data = "".join(self._data)
+        self._data.clear()
+        self._match_sections(data)
+        stripped = data.strip()
+        if not stripped or self._raw_text_depth:
+            return
+        for _, parts in self._cells:
+            parts.append(stripped)
+        for capture in self._captures:
+            capture.append(stripped)
+        for table in self._tables:
+            table.strings.append(stripped)
+
+    def _match_sections(self, data: str) -> None:
+        if not self._pending:
+            return
+        for name, pattern in list(self._pending):
+            if pattern.search(data):
+                self._seen.add(name)
+                self._pending.remove((name, pattern))
+                if name != "personal_information":
+                    self._finish_personal()
+
+    def _close_frame(self, frame: _StreamFrame) -> None:
+        if frame.tag in NON_TEXT_TAGS:
+            self._raw_text_depth -= 1
+        if frame.capture is not None:
+            self._captures.pop()
+            self._stack[-1].header = " ".join(frame.capture)
+        if frame.cell is not None:
+            self._cells.pop()
+        elif frame.row is not None:
+            self._rows.pop()
+        elif frame.table is not None:
+            self._tables.pop()
+            self._closed_tables.append(frame.table)
+            if not self._tables:
+                # Nested tables close first; emit in document (open) order.
+                self._grid_pending = []
+                for table in sorted(self._closed_tables, key=lambda t: t.order):
+                    self._emit_table(table)
+                self._closed_tables.clear()
+
+    def _emit_table(self, table: _StreamTable) -> None:
+        rows = [
+            [" ".join(parts) for name, parts in row if name == "td"] for row in table.rows
+        ]
+        if "personal_information" in table.sections and not self._personal_done:
+            if self._personal is None:
+                self._personal = {bureau: {} for bureau in ALL_BUREAUS}
+            for cells in rows:
+                if len(cells) >= 4:
+                    _merge_personal_row(self._personal, cells[0], cells[1:4])
+
+        if "account_history" in table.sections and len(rows) >= 3 and is_grid_rows(rows):
+            _attach_payment_grids(self._grid_pending, rows)
+            self._grid_pending = []
+        elif "account_history" in table.sections and len(rows) >= 3:
+            field_map: Dict[str, Dict[str, str]] = {}
+            for cells in rows:
+                if len(cells) >= 4:
+                    field_map[cells[0]] = dict(zip(ALL_BUREAUS, cells[1:4]))
+            creditor = _creditor_name_from_text(table.header, lambda: " ".join(table.strings))
+            group_id = _group_id(self._account_tables)
+            self._account_tables += 1
+            for tradeline in _tradelines_from_field_map(field_map, creditor, group_id):
+                self.events.append(("tradeline", tradeline))
+                self._grid_pending.append(tradeline)
+
+        if "inquiries" in table.sections and len(rows) >= 2:
+            headers = [" ".join(parts) for _, parts in table.rows[0]]
+            if any("Creditor Name" in h for h in headers):
+                for cells in rows[1:]:
+                    if len(cells) >= 4:
+                        self.events.append(("inquiry", _inquiry_from_cells(cells)))
+
+    def _finish_personal(self) -> None:
+        if self._personal and not self._personal_done:
+            self.events.append(("personal_information", self._personal))
+        self._personal_done = True
+
+
+def _iter_text_chunks(source: Any, chunk_size: int) -> Iterator[str]:
+    if isinstance(source, str):
+        stripped = source.strip()
+        if "<" in stripped and ">" in stripped:
+            yield source
+            return
+        source = Path(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        yield bytes(source).decode("utf-8", errors="replace")
+        return
+    if isinstance(source, Path):
+        with source.open("rb") as handle:
+            yield from _iter_text_chunks(handle, chunk_size)
+        return
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            break
+        yield decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def iter_report_events(
+    source: Union[str, Path, bytes, IO[Any]], chunk_size: int = STREAM_CHUNK_BYTES
+) -> Iterator[ReportEvent]:
+    """Stream ``(kind, record)`` events out of an HTML report.
+
+    ``kind`` is ``"tradeline"`` for each per-bureau account record (emitted as
+    its Account History table closes), ``"inquiry"`` for each inquiry row, or
+    ``"personal_information"`` with the per-bureau mapping once that section
+    ends. ``source`` may be a path, markup, bytes or a text/binary stream; it
+    is fed to the tokenizer ``chunk_size`` characters at a time so memory
+    stays proportional to the largest table rather than the whole document.
+    """
+
+    parser = _ReportStreamParser()
+    for chunk in _iter_text_chunks(source, chunk_size):
+        for start in range(0, len(chunk), chunk_size):
+            parser.feed(chunk[start : start + chunk_size])
+            if parser.events:
+                yield from parser.events
+                parser.events.clear()
+    parser.close()
+    yield from parser.events
+    parser.events.clear()
+
+
+def iter_tradelines(
+    source: Union[str, Path, bytes, IO[Any]], chunk_size: int = STREAM_CHUNK_BYTES
+) -> Iterator[Dict[str, Any]]:
+    """Yield normalized per-bureau tradelines from ``source`` as tables close."""
+
+    for kind, record in iter_report_events(source, chunk_size):
+        if kind == "tradeline":
+            yield record
+
+
 # ───────────── Public API ─────────────
 def _parse_report(
-    doc: Union[str, Path, BeautifulSoup, Tag, None],
+    doc: ReportSource,
+    include_personal: bool,
+    backend: Optional[str] = None,
+    on_timings: Optional[TimingsCallback] = None,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
+    mode = timings_mode()
+    if on_timings is None and mode is None:
+        return _parse_report_timed(doc, include_personal, backend, DISABLED, dom_build)
+
+    timings = ParseTimings(trace_memory=mode == "memory")
+    try:
+        parsed = _parse_report_timed(doc, include_personal, backend, timings, dom_build)
+        timings.count("tradelines", len(parsed.get("accounts") or []))
+        timings.count("inquiries", len(parsed.get("inquiries") or []))
+        report = timings.finish()
+    finally:
+        timings.close()
+    if on_timings is not None:
+        on_timings(report)
+    if mode is not None:
+        parsed = dict(parsed)
+        parsed["_timings"] = report
+    return parsed
+
+
+def _parse_report_timed(
+    doc: ReportSource,
     include_personal: bool,
+    backend: Optional[str],
+    timings: Any,
+    dom_build: Optional[str] = None,
 ) -> Dict[str, Any]:
+    backend = resolve_html_backend(backend)
+    doc = _resolve_source(doc)
+    markup: Optional[_ReportMarkup] = None
+    if not is_pdf_source(doc):
+        with timings.stage("read"):
+            markup = _load_markup(doc, backend, dom_build)
+    try:
+        return _parse_loaded_report(doc, markup, include_personal, backend, timings)
+    finally:
+        if markup is not None:
+            markup.close()
+
+
+def _parse_loaded_report(
+    doc: Any,
+    markup: Optional[_ReportMarkup],
+    include_personal: bool,
+    backend: str,
+    timings: Any,
+) -> Dict[str, Any]:
+    cache = get_parse_cache()
+    cache_key: Optional[str] = None
+    if cache is not None:
+        with timings.stage("cache_lookup"):
+            keyed = markup.body if markup is not None else doc
+            dom_build = markup.dom_build if markup is not None else DEFAULT_DOM_BUILD
+            cache_key = cache.key_for(keyed, include_personal, backend, dom_build)
+            cached = cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            timings.count("engine", "cache")
+            return cached
+
     factory = ReportAdapterFactory(
-        html_parser=lambda source: _parse_with_bridge(source, include_personal=include_personal),
+        html_parser=lambda source: _parse_with_bridge(
+            source, include_personal=include_personal, backend=backend, timings=timings
+        ),
         pdf_parser=parse_credit_report_pdf,
     )
-    adapter = factory.adapter_for(doc)
-    return adapter.parse(doc)
-
-
-def parse_negative_item_cards(doc: Union[str, Path, BeautifulSoup, Tag, None]) -> Dict[str, Any]:
+    source = markup if markup is not None else doc
+    parsed = factory.adapter_for(source).parse(source)
+    if cache_key is not None:
+        with timings.stage("cache_store"):
+            cache.put(cache_key, parsed)
+    return parsed
+
+
+def parse_negative_item_cards(
+    doc: ReportSource,
+    backend: Optional[str] = None,
+    on_timings: Optional[TimingsCallback] = None,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
     """Return normalized tradelines + inquiries for negative item cards."""
 
-    parsed = _parse_report(doc, include_personal=False)
-    return {
+    parsed = _parse_report(
+        doc,
+        include_personal=False,
+        backend=backend,
+        on_timings=on_timings,
+        dom_build=dom_build,
+    )
+    cards = {
         "accounts": parsed.get("accounts", []),
         "inquiries": parsed.get("inquiries", []),
     }
+    if "_timings" in parsed:
+        cards["_timings"] = parsed["_timings"]
+    return cards
 
 
-def parse_client_portal_data(doc: Union[str, Path, BeautifulSoup, Tag, None]) -> Dict[str, Any]:
-    """Return structured data tailored for the client portal experience."""
-
-    return _parse_report(doc, include_personal=True)
+def parse_client_portal_data(
+    doc: ReportSource,
+    backend: Optional[str] = None,
+    on_timings: Optional[TimingsCallback] = None,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Return structured data tailored for the client portal experience.
+
+    ``on_timings`` receives per-stage wall times, bridge payload sizes and
+    record counts for this call (see :mod:`metro2.timings`). ``dom_build``
+    overrides ``METRO2_DOM_BUILD`` for the fallback tree (``full`` or
+    ``restricted``).
+    """
+
+    return _parse_report(
+        doc,
+        include_personal=True,
+        backend=backend,
+        on_timings=on_timings,
+        dom_build=dom_build,
+    )
 
 
-def parse_credit_report_html(doc: Union[str, Path, BeautifulSoup, Tag, None]) -> Dict[str, Any]:
+def parse_credit_report_html(
+    doc: ReportSource,
+    backend: Optional[str] = None,
+    on_timings: Optional[TimingsCallback] = None,
+    dom_build: Optional[str] = None,
+) -> Dict[str, Any]:
     """Backward-compatible wrapper that mirrors :func:`parse_client_portal_data`."""
 
-    return parse_client_portal_data(doc)
+    return parse_client_portal_data(
+        doc, backend=backend, on_timings=on_timings, dom_build=dom_build
+    )
 
 
 def parse_html_report(source: Union[str, Path, BeautifulSoup, Tag]) -> Dict[str, Any]:
@@ -492,6 +1468,12 @@ __all__ = [
     "parse_client_portal_data",
     "parse_html_report",
     "parse_credit_report_html",
+    "iter_report_events",
+    "iter_tradelines",
     "detect_tradeline_violations",
+    "resolve_html_backend",
+    "available_html_backends",
+    "resolve_dom_build",
+    "hedge_stats",
     "main",
 ]
@@ -0,0 +1,219 @@
+"""Compact month-by-month payment history grids.
+
+Report pages render a "Two-year payment history" grid per account: a Month
+row, a Year row and one status row per bureau.  :class:`PaymentGrid` keeps one
+bureau's row as an ``array('B')`` of severity codes starting at a month
+origin, so the audit rules can ask for the worst status, late counts or the
+first delinquency without re-scanning status strings.
+
+A grid is also a ``dict`` of ``"YYYY-MM" -> status label`` (months without
+data are left out), which is what ends up in the JSON output under a
+tradeline's ``payment_history`` key; :meth:`PaymentGrid.from_mapping` rebuilds
+the codes from that form.  The audit rules only take the grid path for an
+actual :class:`PaymentGrid`; a plain mapping is audited the way it always was.
+"""
+
+from __future__ import annotations
+
+import re
+from array import array
+from datetime import date
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+
+# Severity codes, ordered so that the worst status is the largest code.
+NO_DATA = 0
+CURRENT = 1
+LATE_30 = 2
+LATE_60 = 3
+LATE_90 = 4
+LATE_120 = 5
+LATE_150 = 6
+LATE_180 = 7
+DEROGATORY = 8  # collection, charge-off, repossession, foreclosure
+
+_LATE_CODES = {30: LATE_30, 60: LATE_60, 90: LATE_90, 120: LATE_120, 150: LATE_150, 180: LATE_180}
+_STATUS_CODES = {
+    "OK": CURRENT,
+    "C": CURRENT,
+    "CUR": CURRENT,
+    "CURRENT": CURRENT,
+    "PAID": CURRENT,
+    "CO": DEROGATORY,
+    "C/O": DEROGATORY,
+    "CA": DEROGATORY,
+    "COL": DEROGATORY,
+    "FC": DEROGATORY,
+    "RF": DEROGATORY,
+    "RPO": DEROGATORY,
+    "VS": DEROGATORY,
+}
+_DEROGATORY_WORDS = ("COLLECT", "CHARGE", "REPO", "FORECLOS", "DEROG")
+_LATE_WORDS = ("LATE", "DELIN", "PAST DUE")
+_DAYS_RE = re.compile(r"\d+")
+_MONTH_KEY_RE = re.compile(r"(\d{4})-(\d{2})\Z")
+_MONTH_NAMES = {
+    name: number
+    for number, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"), 1
+    )
+}
+
+
+def status_code(label: Any) -> int:
+    """Severity code for a grid cell such as ``"OK"``, ``"60"`` or ``"CO"``."""
+
+    text = str(label or "").strip().upper()
+    if not text:
+        return NO_DATA
+    code = _STATUS_CODES.get(text)
+    if code is not None:
+        return code
+    if any(word in text for word in _DEROGATORY_WORDS):
+        return DEROGATORY
+    match = _DAYS_RE.search(text)
+    if match:
+        days = int(match.group())
+        if days >= 30:
+            return _LATE_CODES.get(min(days - days % 30, 180), LATE_180)
+    if any(word in text for word in _LATE_WORDS):
+        return LATE_30
+    return NO_DATA
+
+
+def month_index(year: int, month: int) -> int:
+    return year * 12 + month - 1
+
+
+def month_start(index: int) -> date:
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class PaymentGrid(dict):
+    """One bureau's payment history: ``codes[i]`` is month ``origin + i``."""
+
+    __slots__ = ("origin", "codes")
+
+    def __init__(self, origin: int, codes: array, labels: Iterable[Tuple[int, str]] = ()) -> None:
+        super().__init__(
+            (f"{offset // 12:04d}-{offset % 12 + 1:02d}", label) for offset, label in labels
+        )
+        self.origin = origin
+        self.codes = codes
+
+    @classmethod
+    def from_months(cls, months: Iterable[Tuple[int, str]]) -> Optional["PaymentGrid"]:
+        """Build a grid from ``(month index, status label)`` pairs in any order."""
+
+        cells = sorted((index, label) for index, label in months if str(label or "").strip())
+        if not cells:
+            return None
+        origin = cells[0][0]
+        codes = array("B", bytes(cells[-1][0] - origin + 1))
+        for index, label in cells:
+            codes[index - origin] = max(codes[index - origin], status_code(label))
+        return cls(origin, codes, cells)
+
+    @classmethod
+    def from_mapping(cls, history: Mapping[Any, Any]) -> Optional["PaymentGrid"]:
+        """Rebuild a grid from its ``"YYYY-MM" -> label`` form (``None`` otherwise)."""
+
+        months = []
+        for key, label in history.items():
+            match = _MONTH_KEY_RE.match(str(key))
+            if not match:
+                return None
+            months.append((month_index(int(match.group(1)), int(match.group(2))), label))
+        return cls.from_months(months)
+
+    def worst_status(self) -> int:
+        return max(self.codes, default=NO_DATA)
+
+    def late_counts(self) -> Dict[int, int]:
+        """Months reported 30, 60 and 90+ days late (``{30: n, 60: n, 90: n}``)."""
+
+        codes = self.codes
+        return {
+            30: codes.count(LATE_30),
+            60: codes.count(LATE_60),
+            90: sum(codes.count(code) for code in (LATE_90, LATE_120, LATE_150, LATE_180)),
+        }
+
+    def has_late(self) -> bool:
+        return self.worst_status() >= LATE_30
+
+    def first_delinquency_month(self, min_status: int = LATE_30) -> Optional[date]:
+        """First day of the earliest month at ``min_status`` or worse."""
+
+        for offset, code in enumerate(self.codes):
+            if code >= min_status:
+                return month_start(self.origin + offset)
+        return None
+
+    def months(self) -> Iterable[Tuple[date, str]]:
+        """``(month start, label)`` for every month that has data."""
+
+        for key, label in self.items():
+            year, month = key.split("-")
+            yield date(int(year), int(month), 1), label
+
+
+def parse_grid_rows(rows: Sequence[Sequence[str]], bureaus: Sequence[str]) -> Dict[str, PaymentGrid]:
+    """Per-bureau grids from the text rows of a rendered payment history table.
+
+    ``rows`` holds each table row's cell texts, label cell first.  The Month
+    row may carry both the long and the short month name (``"Aug A"``) and the
+    Year row two- or four-digit years.
+    """
+
+    by_label = {str(row[0]).strip().lower(): row[1:] for row in rows if row}
+    months = by_label.get("month")
+    years = by_label.get("year")
+    if not months or not years:
+        return {}
+    columns = []
+    for month_text, year_text in zip(months, years):
+        month = _MONTH_NAMES.get(str(month_text).strip()[:3].upper())
+        digits = _DAYS_RE.search(str(year_text))
+        if month is None or digits is None:
+            columns.append(None)
+            continue
+        year = int(digits.group())
+        columns.append(month_index(year + 2000 if year < 100 else year, month))
+
+    grids: Dict[str, PaymentGrid] = {}
+    for bureau in bureaus:
+        cells = by_label.get(bureau.lower())
+        if not cells:
+            continue
+        grid = PaymentGrid.from_months(
+            (index, label) for index, label in zip(columns, cells) if index is not None
+        )
+        if grid is not None:
+            grids[bureau] = grid
+    return grids
+
+
+def is_grid_rows(rows: Sequence[Sequence[str]]) -> bool:
+    """True when the first two rows are labelled Month and Year."""
+
+    labels = [str(row[0]).strip().lower() if row else "" for row in rows[:2]]
+    return labels == ["month", "year"]
+
+
+__all__ = [
+    "CURRENT",
+    "DEROGATORY",
+    "LATE_30",
+    "LATE_60",
+    "LATE_90",
+    "LATE_120",
+    "LATE_150",
+    "LATE_180",
+    "NO_DATA",
+    "PaymentGrid",
+    "is_grid_rows",
+    "month_index",
+    "month_start",
+    "parse_grid_rows",
+    "status_code",
+]
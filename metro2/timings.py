@@ -0,0 +1,125 @@
+"""Opt-in per-stage timing for the parse pipeline.
+
+Instrumentation is off unless a caller passes ``on_timings`` to one of the
+public parse functions or ``METRO2_PARSE_TIMINGS`` is set (``1`` attaches a
+``_timings`` block to the payload, ``memory`` also records the tracemalloc
+peak, overall and per stage).  When disabled every hook is a shared no-op, so the hot path pays one
+attribute lookup per stage.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional
+
+TimingsCallback = Callable[[Dict[str, Any]], None]
+
+
+class ParseTimings:
+    """Wall time per named stage plus a few size/count counters."""
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.stages: Dict[str, float] = {}
+        self.stage_peaks: Dict[str, int] = {}
+        self.counters: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+        self._trace_memory = trace_memory
+        self._owns_trace = False
+        self._peak = 0
+        # [name, peak] for each stage still running; nested stages reset the
+        # tracemalloc peak, so it is folded into every open stage first.
+        self._open: List[List[Any]] = []
+        if trace_memory:
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+                self._owns_trace = True
+
+    def _fold_peak(self) -> None:
+        peak = tracemalloc.get_traced_memory()[1]
+        self._peak = max(self._peak, peak)
+        for entry in self._open:
+            entry[1] = max(entry[1], peak)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        entry = None
+        if self._trace_memory and tracemalloc.is_tracing():
+            self._fold_peak()
+            tracemalloc.reset_peak()
+            entry = [name, 0]
+            self._open.append(entry)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+            if entry is not None:
+                if tracemalloc.is_tracing():
+                    self._fold_peak()
+                self._open.remove(entry)
+                self.stage_peaks[name] = max(self.stage_peaks.get(name, 0), entry[1])
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return self._timed(name)
+
+    def count(self, name: str, value: Any) -> None:
+        self.counters[name] = value
+
+    def finish(self) -> Dict[str, Any]:
+        report: Dict[str, Any] = {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 3),
+            "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+        }
+        report.update(self.counters)
+        if self._trace_memory:
+            if tracemalloc.is_tracing():
+                self._fold_peak()
+            report["peak_memory_bytes"] = self._peak
+            report["stage_peak_bytes"] = dict(self.stage_peaks)
+        self.close()
+        return report
+
+    def close(self) -> None:
+        """Stop the tracemalloc session this object started, if any (idempotent)."""
+
+        if self._owns_trace:
+            tracemalloc.stop()
+            self._owns_trace = False
+
+
+class _DisabledTimings:
+    enabled = False
+    _NULL = nullcontext()
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return self._NULL
+
+    def count(self, name: str, value: Any) -> None:
+        return None
+
+
+DISABLED = _DisabledTimings()
+
+
+def timings_mode() -> Optional[str]:
+    """Return ``"on"``, ``"memory"`` or ``None`` from ``METRO2_PARSE_TIMINGS``."""
+
+    raw = (os.getenv("METRO2_PARSE_TIMINGS") or "").strip().lower()
+    if raw in ("", "0", "false", "no", "off"):
+        return None
+    return "memory" if raw in ("memory", "mem", "tracemalloc") else "on"
+
+
+__all__ = [
+    "DISABLED",
+    "ParseTimings",
+    "TimingsCallback",
+    "timings_mode",
+]
@@ -0,0 +1,79 @@
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from metro2 import async_parser  # noqa: E402
+from metro2.parser import parse_client_portal_data, parse_negative_item_cards  # noqa: E402
+from test_parser import SAMPLE_HTML  # noqa: E402
+
+
+class AsyncParserTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.pid_file = Path(self.tmpdir.name) / "bridge.pid"
+        # Stand-in bridge that records its pid and never answers.
+        script = (
+            f"import os, time; open({str(self.pid_file)!r}, 'w').write(str(os.getpid())); "
+            "time.sleep(30)"
+        )
+        patcher = mock.patch.object(
+            async_parser, "_bridge_command", return_value=[sys.executable, "-c", script]
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def _assert_bridge_killed(self):
+        pid = int(self.pid_file.read_text())
+        with self.assertRaises(ProcessLookupError):
+            os.kill(pid, 0)
+
+    def _wait_for_pid_file(self):
+        async def wait():
+            while not self.pid_file.exists() or not self.pid_file.read_text():
+                await asyncio.sleep(0.01)
+
+        return wait()
+
+    def test_timeout_kills_bridge_and_falls_back(self):
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            parsed = asyncio.run(
+                async_parser.parse_client_portal_data_async(
+                    SAMPLE_HTML, executor=executor, timeout=0.5
+                )
+            )
+        self.assertLess(time.monotonic() - started, 10)
+        self._assert_bridge_killed()
+        self.assertEqual(parsed, parse_client_portal_data(SAMPLE_HTML))
+
+    def test_cancellation_kills_bridge(self):
+        async def run():
+            task = asyncio.create_task(
+                async_parser.parse_negative_item_cards_async(SAMPLE_HTML, timeout=None)
+            )
+            await asyncio.wait_for(self._wait_for_pid_file(), 10)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+        self._assert_bridge_killed()
+
+    def test_negative_cards_match_sync_parser(self):
+        empty_bridge = [sys.executable, "-c", "print('{}')"]
+        with mock.patch.object(async_parser, "_bridge_command", return_value=empty_bridge):
+            parsed = asyncio.run(async_parser.parse_negative_item_cards_async(SAMPLE_HTML))
+        self.assertEqual(parsed, parse_negative_item_cards(SAMPLE_HTML))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import copy
+import itertools
+import sys
+import unittest
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from metro2 import audit_rules  # noqa: E402
+from metro2.audit_columnar import (  # noqa: E402
+    columnar_available,
+    columnar_prefilter,
+    run_columnar_audits,
+)
+
+
+def _date(days_ago):
+    return (audit_rules.today() - timedelta(days=days_ago)).strftime("%m/%d/%Y")
+
+
+def _tradelines():
+    statuses = ("Open", "Current", "Closed", "Charge-Off", "Collection", "Pays as agreed", "30 Days Late", "")
+    types = ("Revolving", "Installment", "Credit Card", "Student Loan", "")
+    amounts = ("$0", "$1", "$950", "$1,000", "$1,200", "")
+    dates = (_date(10), _date(181), _date(366), _date(400), "", "N/A", "2019-02-30")
+    records = []
+    for i, (status, acct_type, balance, limit, reported) in enumerate(
+        itertools.product(statuses, types, amounts, amounts[:4], dates)
+    ):
+        records.append(
+            {
+                "creditor_name": f"CREDITOR {i // 3}",
+                "account_number": f"{i // 3:04d}",
+                "bureau": ("TransUnion", "Experian", "Equifax")[i % 3],
+                "account_status": status,
+                "account_type": acct_type,
+                "balance": balance,
+                "credit_limit": limit,
+                "high_credit": amounts[i % len(amounts)],
+                "past_due": amounts[(i // 3) % len(amounts)],
+                "monthly_payment": amounts[(i // 5) % len(amounts)],
+                "date_opened": dates[(i // 2) % len(dates)],
+                "date_closed": dates[(i // 7) % len(dates)] if i % 4 == 0 else "",
+                "last_reported": reported if i % 9 else "",
+                "date_last_reported": dates[i % len(dates)] if i % 9 == 0 else "",
+                "comments": "High credit used as limit" if i % 6 == 0 else "",
+            }
+        )
+    return records
+
+
+class BatchAuditTest(unittest.TestCase):
+    def test_prefilter_positions_are_split_per_payload(self):
+        over = {"balance": "$990", "credit_limit": "$1000"}
+        payloads = [{"accounts": [dict(over), dict(over)]}, {"accounts": [dict(over), dict(over)]}]
+        seen = []
+
+        def prefilter(records, views):
+            seen.append(len(records))
+            self.assertEqual([view.balance for view in views], [990.0] * 4)
+            return {audit_rules.audit_high_utilization: [1, 2]}
+
+        audit_rules.run_batch_audits(payloads, prefilter=prefilter)
+        self.assertEqual(seen, [4])
+        flagged = [
+            [any(v["id"] == "HIGH_UTILIZATION" for v in record.get("violations", [])) for record in p["accounts"]]
+            for p in payloads
+        ]
+        self.assertEqual(flagged, [[False, True], [True, False]])
+
+
+@unittest.skipUnless(columnar_available(), "numpy is not installed")
+class ColumnarMaskTest(unittest.TestCase):
+    def test_columnar_prefilter_matches_the_dict_engine(self):
+        records = _tradelines()
+        expected = [{"accounts": copy.deepcopy(records[:2000])}, {"accounts": copy.deepcopy(records[2000:])}]
+        prefiltered = copy.deepcopy(expected)
+        columnar = copy.deepcopy(expected)
+        for payload in expected:
+            audit_rules.run_all_audits(payload)
+        audit_rules.run_batch_audits(prefiltered, prefilter=columnar_prefilter)
+        run_columnar_audits(columnar)
+        self.assertEqual(prefiltered, expected)
+        self.assertEqual(columnar, expected)
+
+    def test_masks_cover_every_row_the_rule_flags(self):
+        from metro2.audit_columnar import TradelineColumns, rule_masks
+
+        records = _tradelines()
+        views = [audit_rules.normalize_tradeline(record) for record in records]
+        masks = rule_masks(TradelineColumns.build(records, views), audit_rules.today().toordinal())
+        self.assertGreaterEqual(len(masks), 10)
+        for fn, mask in masks.items():
+            for row, (record, view) in enumerate(zip(records, views)):
+                probe = dict(record, violations=[])
+                fn.check(probe, view)
+                if probe["violations"]:
+                    self.assertTrue(mask[row], f"{fn.__name__} flags row {row} outside its mask")
+
+
+if __name__ == "__main__":
+    unittest.main()
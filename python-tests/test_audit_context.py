@@ -0,0 +1,183 @@
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from metro2 import audit_rules  # noqa: E402
+
+
+def _tradelines():
+    return [
+        {
+            "creditor_name": "Summit Credit",
+            "account_number": "3333-0000",
+            "account_status": status,
+            "balance": balance,
+            "bureau": bureau,
+        }
+        for bureau, status, balance in (
+            ("TransUnion", "Open", "$125"),
+            ("Experian", "Closed", "$0"),
+        )
+    ]
+
+
+class AuditContextTest(unittest.TestCase):
+    def test_run_groups_tradelines_once(self):
+        payload = {"accounts": _tradelines(), "inquiries": []}
+        with mock.patch.object(
+            audit_rules, "group_by_creditor", wraps=audit_rules.group_by_creditor
+        ) as grouping:
+            audit_rules.run_all_audits(payload)
+        self.assertEqual(grouping.call_count, 1)
+        ids = {v["id"] for v in payload["accounts"][0]["violations"]}
+        self.assertTrue({"BALANCE_MISMATCH", "OPEN_CLOSED_MISMATCH", "INCOMPLETE_BUREAU_REPORTING"} <= ids)
+
+    def test_rules_stay_callable_without_a_context(self):
+        standalone, shared = _tradelines(), _tradelines()
+        audit_rules.audit_balance_status_mismatch(standalone)
+        audit_rules.audit_balance_status_mismatch(shared, context=audit_rules.AuditContext(shared))
+        self.assertEqual(standalone, shared)
+        self.assertIn("violations", standalone[0])
+
+
+class TradelineViewTest(unittest.TestCase):
+    def test_normalize_returns_parsed_view_without_touching_the_record(self):
+        record = {
+            "Creditor Name": "Summit Credit",
+            "Account #": "3333-0000",
+            "Status": " Open ",
+            "Current Balance": "$1,250.50",
+            "Date Opened": "03/15/2020",
+        }
+        view = audit_rules.normalize_tradeline(record)
+        self.assertEqual(view.balance, 1250.5)
+        self.assertEqual(view.status, "open")
+        self.assertEqual(view.account_number, "33330000")
+        self.assertEqual(view.date_opened, date(2020, 3, 15))
+        self.assertIsNone(view.date_closed)
+        self.assertFalse(hasattr(view, "__dict__"))
+        self.assertFalse(any(isinstance(v, audit_rules.TradelineView) for v in record.values()))
+
+    def test_context_views_match_views_built_on_the_fly(self):
+        records = [
+            {"account_status": "Current", "past_due": "$40", "balance": "$0"},
+            {"account_status": "Open", "balance": "$0", "account_type": "Credit Card"},
+        ]
+        shared = [dict(r) for r in records]
+        context = audit_rules.AuditContext(shared)
+        for fn in (audit_rules.audit_current_with_past_due, audit_rules.audit_zero_balance_with_past_due):
+            fn(records)
+            fn(shared, context=context)
+        self.assertEqual(records, shared)
+        self.assertIs(context.view(shared[0]), context.view(shared[0]))
+
+
+class RuleScopeTest(unittest.TestCase):
+    def test_violation_order_matches_running_each_rule_in_turn(self):
+        accounts = _tradelines() + [
+            {
+                "creditor_name": "Summit Credit",
+                "account_number": "3333-0000",
+                "account_status": "Current",
+                "past_due": "$40",
+                "balance": "$125",
+                "bureau": "Equifax",
+            }
+        ]
+        for record in accounts:
+            record["violations"] = [{"id": "PARSER_NOTE", "title": "kept first"}]
+        sequential = [dict(r, violations=list(r["violations"])) for r in accounts]
+
+        audit_rules.run_all_audits({"accounts": accounts, "inquiries": []})
+        for record in sequential:
+            audit_rules.normalize_tradeline(record)
+        for fn in audit_rules.AUDIT_FUNCTIONS:
+            fn(sequential)
+        for record in sequential:
+            audit_rules._dedupe_violations(record)
+
+        self.assertEqual(accounts, sequential)
+        ids = [v["id"] for v in accounts[2]["violations"]]
+        self.assertEqual(ids[0], "PARSER_NOTE")
+        self.assertLess(ids.index("MISSING_OPEN_DATE"), ids.index("BALANCE_MISMATCH"))
+        self.assertLess(ids.index("BALANCE_MISMATCH"), ids.index("CURRENT_STATUS_WITH_PAST_DUE"))
+
+    def test_per_record_rules_expose_their_check(self):
+        rule = audit_rules.audit_high_utilization
+        self.assertEqual(rule.scope, "record")
+        record = {"balance": "$950", "credit_limit": "$1000"}
+        rule.check(record, audit_rules.TradelineView.build(record))
+        self.assertEqual([v["id"] for v in record["violations"]], ["HIGH_UTILIZATION"])
+        self.assertEqual(audit_rules.audit_missing_bureau.scope, "group")
+
+
+class ViolationIndexTest(unittest.TestCase):
+    def test_index_follows_appends_made_outside_attach(self):
+        shared = [{"id": "PARSER_NOTE"}]
+        first, second = {"violations": shared}, {"violations": shared}
+        token = audit_rules._VIOLATION_INDEX.set({})
+        try:
+            self.assertFalse(audit_rules._has_violation(first, "LATE"))
+            shared.append({"id": "LATE"})
+            self.assertTrue(audit_rules._has_violation(second, "LATE"))
+            audit_rules._attach_violation(first, "LATE", "again", unique=True)
+            self.assertEqual(len(shared), 2)
+            second["violations"] = [{"id": "OTHER"}]
+            self.assertFalse(audit_rules._has_violation(second, "LATE"))
+        finally:
+            audit_rules._VIOLATION_INDEX.reset(token)
+        self.assertIsNone(audit_rules._VIOLATION_INDEX.get())
+
+    def test_records_without_violations_are_not_indexed(self):
+        index = {}
+        token = audit_rules._VIOLATION_INDEX.set(index)
+        try:
+            for record in ({}, {"violations": []}, {"violations": None}):
+                self.assertFalse(audit_rules._has_violation(record, "LATE"))
+        finally:
+            audit_rules._VIOLATION_INDEX.reset(token)
+        self.assertEqual(index, {})
+
+    def test_unique_attach_without_a_run_scans_the_list(self):
+        record = {}
+        for _ in range(2):
+            audit_rules._attach_violation(record, "CROSS_BUREAU_UTILIZATION_GAP", "gap", unique=True)
+        self.assertEqual([v["id"] for v in record["violations"]], ["CROSS_BUREAU_UTILIZATION_GAP"])
+
+
+class CreditorPartitionTest(unittest.TestCase):
+    @staticmethod
+    def _scored_partitions(records):
+        partitions = []
+        for record in records:
+            scores = [audit_rules._match_score(record, partition) for partition in partitions]
+            best = max(scores, default=float("-inf"))
+            if best >= audit_rules.MATCH_SCORE_THRESHOLD:
+                partitions[scores.index(best)].append(record)
+            else:
+                partitions.append([record])
+        return partitions
+
+    def test_blocked_partitions_match_scoring_every_partition(self):
+        accounts = ("1234", "XX1234", "1234XX", "12", "34", "5678", "12345678", "", None)
+        records = [
+            {
+                "creditor_name": "Midland Credit",
+                "account_number": accounts[i % len(accounts)],
+                "date_opened": ("01/05/2020", "01/30/2020", "06/01/2021", "")[i % 4],
+                "last_reported": ("05/01/2024", "06/20/2024", "")[i % 3],
+                "account_type": ("Collection", "Revolving", "")[i % 5 % 3],
+            }
+            for i in range(60)
+        ]
+        self.assertEqual(
+            audit_rules._partition_records(records), self._scored_partitions(records)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from metro2 import audit_rules  # noqa: E402
+
+
+def _payload():
+    return {
+        "accounts": [
+            {
+                "creditor_name": "ALPHA BANK",
+                "account_number": "1234",
+                "bureau": "TransUnion",
+                "account_status": "Current",
+                "balance": "$500",
+                "past_due": "$120",
+                "credit_limit": "$400",
+                "high_credit": "$900",
+            }
+        ],
+        "inquiries": [],
+        "personal_information": {},
+    }
+
+
+class RunAllAuditsIdempotencyTest(unittest.TestCase):
+    def test_second_call_is_skipped_when_stamp_matches(self):
+        payload = audit_rules.run_all_audits(_payload())
+        violations = list(payload["accounts"][0]["violations"])
+        self.assertTrue(violations)
+        self.assertEqual(payload[audit_rules.AUDIT_STAMP_KEY], audit_rules.audit_stamp(payload))
+
+        with mock.patch.object(audit_rules, "normalize_tradeline") as normalize:
+            audit_rules.run_all_audits(payload)
+        normalize.assert_not_called()
+        self.assertEqual(payload["accounts"][0]["violations"], violations)
+
+    def test_forced_rerun_does_not_stack_violations(self):
+        payload = audit_rules.run_all_audits(_payload())
+        before = [(v["id"], v["title"]) for v in payload["accounts"][0]["violations"]]
+        audit_rules.run_all_audits(payload, force=True)
+        after = [(v["id"], v["title"]) for v in payload["accounts"][0]["violations"]]
+        self.assertEqual(before, after)
+
+    def test_copied_records_audited_again_stay_unique(self):
+        audited = audit_rules.run_all_audits(_payload())
+        fresh = {"accounts": [dict(tl) for tl in audited["accounts"]], "inquiries": []}
+        audit_rules.run_all_audits(fresh)
+        ids = [(v["id"], v["title"]) for v in fresh["accounts"][0]["violations"]]
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_edited_tradeline_is_audited_again(self):
+        payload = audit_rules.run_all_audits(_payload())
+        payload["accounts"][0]["account_type"] = "Installment"
+        audit_rules.run_all_audits(payload)
+        ids = [v["id"] for v in payload["accounts"][0]["violations"]]
+        self.assertIn("INSTALLMENT_HAS_LIMIT", ids)
+        self.assertEqual(payload[audit_rules.AUDIT_STAMP_KEY], audit_rules.audit_stamp(payload))
+
+    def test_violations_without_id_or_title_are_kept_unless_identical(self):
+        record = {"violations": [{"detail": "a"}, {"detail": "b"}, {"detail": "a"}]}
+        audit_rules._dedupe_violations(record)
+        self.assertEqual(record["violations"], [{"detail": "a"}, {"detail": "b"}])
+
+    def test_stamp_changes_with_as_of_date(self):
+        payload = audit_rules.run_all_audits(_payload())
+        with mock.patch.object(audit_rules, "today") as fake_today:
+            fake_today.return_value.isoformat.return_value = "1999-01-01"
+            self.assertNotEqual(audit_rules.audit_stamp(payload), payload[audit_rules.AUDIT_STAMP_KEY])
+
+
+if __name__ == "__main__":
+    unittest.main()
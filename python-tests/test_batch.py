@@ -0,0 +1,60 @@
+import multiprocessing
+import os
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from metro2 import batch  # noqa: E402
+from metro2.batch import parse_reports_many  # noqa: E402
+from metro2.parser import parse_client_portal_data  # noqa: E402
+from test_parser import SAMPLE_HTML  # noqa: E402
+
+_parse_one = batch._parse_one
+
+
+def _crash_on_marker(index, source, include_personal):
+    if source == "CRASH":
+        os._exit(1)  # like an OOM kill: no exception, the worker just dies
+    return _parse_one(index, source, include_personal)
+
+
+class ParseReportsManyTest(unittest.TestCase):
+    def test_results_follow_input_order_and_capture_errors(self):
+        missing = Path(__file__).with_name("does-not-exist.html")
+        sources = [SAMPLE_HTML, missing, SAMPLE_HTML.replace("ALPHA BANK", "BETA BANK")]
+        summaries = []
+        results = list(
+            parse_reports_many(sources, workers=2, chunksize=1, on_summary=summaries.append)
+        )
+
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual(results[0].payload, parse_client_portal_data(SAMPLE_HTML))
+        self.assertFalse(results[1].ok)
+        self.assertIn("FileNotFoundError", results[1].error)
+        self.assertEqual(results[1].source, str(missing))
+        self.assertTrue(results[2].ok)
+        self.assertEqual((summaries[0].reports, summaries[0].errors), (3, 1))
+        self.assertGreater(summaries[0].reports_per_second, 0)
+
+    def test_unordered_in_process_batch_yields_every_report(self):
+        results = list(
+            parse_reports_many([SAMPLE_HTML] * 5, workers=0, chunksize=2, ordered=False)
+        )
+        self.assertEqual(sorted(r.index for r in results), list(range(5)))
+        self.assertTrue(all(r.ok for r in results))
+
+    @unittest.skipUnless(multiprocessing.get_start_method() == "fork", "needs fork workers")
+    def test_dead_worker_fails_only_its_own_report(self):
+        sources = [SAMPLE_HTML, "CRASH", SAMPLE_HTML, SAMPLE_HTML]
+        with mock.patch.object(batch, "_parse_one", _crash_on_marker):
+            results = list(parse_reports_many(sources, workers=2, chunksize=2))
+        self.assertEqual([r.index for r in results], [0, 1, 2, 3])
+        self.assertEqual([r.ok for r in results], [True, False, True, True])
+        self.assertIn("BrokenProcessPool", results[1].error)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import shutil
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from metro2.bridge_pool import bridge_output_flags  # noqa: E402
+from metro2.parser import _flatten_tradelines  # noqa: E402
+
+COMPACT_MODULE = Path(__file__).resolve().parents[1] / "metro2" / "bridge_compact.mjs"
+ENCODE_STDIN = (
+    f"import {{ compactPayload }} from {json.dumps(COMPACT_MODULE.as_uri())};"
+    "let raw = ''; process.stdin.on('data', (c) => { raw += c; });"
+    "process.stdin.on('end', () => process.stdout.write(JSON.stringify(compactPayload(JSON.parse(raw)))));"
+)
+
+NESTED_PAYLOAD = {
+    "tradelines": [
+        {
+            "meta": {"creditor": "ALPHA BANK"},
+            "per_bureau": {
+                "TransUnion": {"account_number": "1234", "balance": "$10", "date_last_payment": "01/2024"},
+                "Experian": {"accountNumber": "1234", "balance": None, "past_due": "$5"},
+            },
+            "violations": [
+                {"id": "V1", "bureau": "TransUnion"},
+                {"id": "V2", "bureau": "Equifax"},
+                {"id": "V3"},
+            ],
+        },
+        "not-a-tradeline",
+        {
+            "meta": {},
+            "per_bureau": {
+                "Equifax": {"creditor": "BETA CARD", "date_first_delinquency": "02/2023"},
+                "TransUnion": {"creditor_name": "BETA", "balance": "$0"},
+            },
+            "violations": [{"id": "V4", "bureau": "Equifax"}],
+        },
+    ],
+    "inquiries": [{"creditor": "Capital One"}],
+}
+
+
+@unittest.skipUnless(shutil.which("node"), "node is not installed")
+class CompactWireFormatTest(unittest.TestCase):
+    def test_compact_payload_decodes_to_the_same_tradelines(self):
+        completed = subprocess.run(
+            ["node", "--input-type=module", "-e", ENCODE_STDIN],
+            input=json.dumps(NESTED_PAYLOAD),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        compact = json.loads(completed.stdout)
+        self.assertEqual(compact["format"], "metro2-compact/1")
+        self.assertEqual(compact["inquiries"], NESTED_PAYLOAD["inquiries"])
+        self.assertEqual(
+            _flatten_tradelines(compact["tradelines"]),
+            _flatten_tradelines(NESTED_PAYLOAD["tradelines"]),
+        )
+
+
+class CompactFlagTest(unittest.TestCase):
+    def test_environment_enables_compact_flag(self):
+        with mock.patch.dict("os.environ", {"METRO2_BRIDGE_COMPACT": "1"}):
+            self.assertEqual(bridge_output_flags(), ["--compact"])
+        with mock.patch.dict("os.environ", {"METRO2_BRIDGE_COMPACT": "off"}):
+            self.assertEqual(bridge_output_flags(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import sys
+import textwrap
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from metro2.bridge_pool import BridgeCancelled, BridgeError, BridgePool, BridgeTimeout  # noqa: E402
+
+# Minimal stand-in for ``node_parser_bridge.mjs --serve`` speaking the same
+# length-prefixed protocol, so the pool can be exercised without cheerio.
+STUB_WORKER = textwrap.dedent(
+    """
+    import json, os, struct, sys, time
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    while True:
+        header = stdin.read(4)
+        if len(header) < 4:
+            break
+        body = stdin.read(struct.unpack(">I", header)[0]).decode("utf-8")
+        if body == "crash":
+            os._exit(3)
+        if body == "hang":
+            time.sleep(30)
+        reply = json.dumps({"echo": body, "pid": os.getpid()}).encode("utf-8")
+        stdout.write(struct.pack(">I", len(reply)) + reply)
+        stdout.flush()
+    """
+)
+
+
+def build_pool(**kwargs):
+    return BridgePool(command=[sys.executable, "-c", STUB_WORKER], **kwargs)
+
+
+class BridgePoolTest(unittest.TestCase):
+    def test_worker_is_reused_between_requests(self):
+        pool = build_pool(size=1)
+        try:
+            first = pool.parse(b"<html>one</html>")
+            second = pool.parse(b"<html>two</html>")
+        finally:
+            pool.close()
+        self.assertEqual(first["echo"], "<html>one</html>")
+        self.assertEqual(first["pid"], second["pid"])
+        self.assertEqual(pool.stats()["spawned"], 1)
+
+    def test_large_payload_round_trips(self):
+        pool = build_pool(size=1)
+        body = ("<td>x</td>" * 200_000).encode("utf-8")
+        try:
+            reply = pool.parse(body)
+        finally:
+            pool.close()
+        self.assertEqual(len(reply["echo"]), len(body))
+
+    def test_reply_size_is_reported_on_request(self):
+        pool = build_pool(size=1)
+        sizes = {}
+        try:
+            reply = pool.parse(b"ping", sizes)
+        finally:
+            pool.close()
+        self.assertEqual(sizes["reply_bytes"], len(json.dumps(reply)))
+
+    def test_worker_recycled_after_max_requests(self):
+        pool = build_pool(size=1, max_requests=2)
+        try:
+            pids = [pool.parse(b"ping")["pid"] for _ in range(3)]
+        finally:
+            pool.close()
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pool.stats()["recycled"], 1)
+
+    def test_crashed_worker_is_respawned(self):
+        pool = build_pool(size=1)
+        try:
+            before = pool.parse(b"ping")["pid"]
+            with self.assertRaises(BridgeError):
+                pool.parse(b"crash")
+            after = pool.parse(b"ping")["pid"]
+        finally:
+            pool.close()
+        self.assertNotEqual(before, after)
+        self.assertEqual(pool.stats()["crashed"], 1)
+
+    def test_hung_worker_times_out_and_is_killed(self):
+        pool = build_pool(size=1, timeout=0.5)
+        try:
+            with self.assertRaises(BridgeTimeout):
+                pool.parse(b"hang")
+            reply = pool.parse(b"ping")
+        finally:
+            pool.close()
+        self.assertEqual(reply["echo"], "ping")
+        self.assertEqual(pool.stats()["timeouts"], 1)
+
+    def test_cancel_event_aborts_in_flight_request(self):
+        pool = build_pool(size=1)
+        cancel = threading.Event()
+        threading.Timer(0.2, cancel.set).start()
+        try:
+            with self.assertRaises(BridgeCancelled):
+                pool.parse(b"hang", cancel=cancel)
+            reply = pool.parse(b"ping")
+        finally:
+            pool.close()
+        self.assertEqual(reply["echo"], "ping")
+        self.assertEqual(pool.stats()["cancelled"], 1)
+
+    def test_missing_executable_raises_bridge_error(self):
+        pool = BridgePool(command=["definitely-not-a-real-node-binary"], size=1)
+        with self.assertRaises(BridgeError):
+            pool.parse(b"ping")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+CRM_DIR = ROOT / "metro2 (copy 1)" / "crm"
+
+
+def _loaded_after(statement, candidates, cwd=ROOT):
+    probe = f"import sys; {statement}; print(*(m for m in {candidates!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], cwd=cwd, capture_output=True, text=True, check=True
+    )
+    return completed.stdout.split()
+
+
+class LazyImportTest(unittest.TestCase):
+    def test_audit_rules_does_not_import_html_stack(self):
+        loaded = _loaded_after("import metro2.audit_rules", ["bs4", "pdfplumber", "metro2.parser"])
+        self.assertEqual(loaded, [])
+
+    def test_parser_defers_pdf_and_async_dependencies(self):
+        loaded = _loaded_after("import metro2.parser", ["pdfplumber", "asyncio", "sqlite3"])
+        self.assertEqual(loaded, [])
+
+    def test_package_exports_resolve_on_access(self):
+        loaded = _loaded_after(
+            "import metro2; metro2.parse_client_portal_data", ["metro2.parser", "metro2.async_parser"]
+        )
+        self.assertEqual(loaded, ["metro2.parser"])
+
+    def test_audit_multi_defers_rulebook_until_first_lookup(self):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import metro2_audit_multi as m; "
+                "print(m.RULEBOOK._data is None, len(m.RULEBOOK) > 0)",
+            ],
+            cwd=CRM_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        self.assertEqual(completed.stdout.split(), ["True", "True"])
+
+
+if __name__ == "__main__":
+    unittest.main()
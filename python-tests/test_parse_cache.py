@@ -0,0 +1,101 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from metro2 import parse_cache, parser  # noqa: E402
+from metro2.parse_cache import ParseCache, configure_parse_cache, hash_report_source  # noqa: E402
+from test_parser import SAMPLE_HTML  # noqa: E402
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.tmpdir.name) / "cache.sqlite3"
+
+    def tearDown(self):
+        configure_parse_cache(None)
+        self.tmpdir.cleanup()
+
+    def test_hit_skips_parse_and_audit(self):
+        cache = configure_parse_cache(self.db_path)
+        first = parser.parse_client_portal_data(SAMPLE_HTML)
+        with mock.patch.object(parser, "_parse_with_bridge") as parse_html:
+            second = parser.parse_client_portal_data(SAMPLE_HTML)
+        parse_html.assert_not_called()
+        self.assertEqual(first, second)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["stores"]), (1, 1, 1))
+
+    def test_key_separates_scope_and_as_of_date(self):
+        cache = ParseCache(self.db_path)
+        try:
+            personal = cache.key_for(SAMPLE_HTML, include_personal=True)
+            negative = cache.key_for(SAMPLE_HTML, include_personal=False)
+            with mock.patch("metro2.audit_rules.today") as fake_today:
+                fake_today.return_value.isoformat.return_value = "1999-01-01"
+                earlier = cache.key_for(SAMPLE_HTML, include_personal=True)
+        finally:
+            cache.close()
+        self.assertNotEqual(personal, negative)
+        self.assertNotEqual(personal, earlier)
+
+    def test_key_separates_pipeline_settings(self):
+        cache = ParseCache(self.db_path)
+        try:
+            keys = {cache.key_for(SAMPLE_HTML, True), cache.key_for(SAMPLE_HTML, True, dom_build="restricted")}
+            for env in ({"METRO2_HTML_SLIM": "0"}, {"METRO2_BRIDGE_COMPACT": "1"}):
+                with mock.patch.dict("os.environ", env):
+                    keys.add(cache.key_for(SAMPLE_HTML, True))
+        finally:
+            cache.close()
+        self.assertEqual(len(keys), 4)
+
+    def test_pipeline_version_covers_every_package_module(self):
+        real_read = Path.read_bytes
+        seen = []
+
+        def read_bytes(path):
+            seen.append(path.name)
+            return real_read(path)
+
+        with mock.patch.object(Path, "read_bytes", read_bytes):
+            parse_cache._pipeline_version()
+        for name in ("payment_history.py", "html_slim.py", "bridge_compact.mjs", "parser.py"):
+            self.assertIn(name, seen)
+
+    def test_cache_is_reopened_after_fork(self):
+        cache = configure_parse_cache(self.db_path)
+        cache.put("k", {"ok": True})
+        cache.pid = -1
+        reopened = parse_cache.get_parse_cache()
+        self.assertIsNot(reopened, cache)
+        self.assertEqual(reopened.get("k"), {"ok": True})
+        cache.close()
+
+    def test_path_and_markup_hash_identically(self):
+        report = Path(self.tmpdir.name) / "report.html"
+        report.write_text(SAMPLE_HTML, encoding="utf-8")
+        self.assertEqual(hash_report_source(report), hash_report_source(SAMPLE_HTML))
+        self.assertEqual(hash_report_source(str(report)), hash_report_source(SAMPLE_HTML))
+
+    def test_lru_eviction_respects_size_bound(self):
+        cache = ParseCache(self.db_path, max_bytes=250)
+        try:
+            cache.put("a", {"blob": "x" * 100})
+            cache.put("b", {"blob": "y" * 100})
+            self.assertIsNotNone(cache.get("a"))
+            cache.put("c", {"blob": "z" * 100})
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNotNone(cache.get("c"))
+            self.assertEqual(cache.stats()["evictions"], 1)
+        finally:
+            cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
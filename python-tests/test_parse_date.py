@@ -0,0 +1,37 @@
+import sys
+import unittest
+from datetime import date, datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from metro2 import audit_rules  # noqa: E402
+from metro2.audit_rules import parse_date  # noqa: E402
+
+
+class ParseDateTest(unittest.TestCase):
+    def test_fast_paths_agree_with_strptime_formats(self):
+        samples = [
+            "01/05/2024", "1/5/2024", " 12/31/1999 ", "2024-01-05", "02/30/2024",
+            "13/01/2024", "2024-02-30", "2024-1-5", "20240105", "01-05-2024",
+            "2024-01-05T10:00:00Z", "2024-01-05 10:00:00.5", "garbage",
+        ]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(parse_date(sample), audit_rules._parse_date_slow(sample.strip()))
+
+    def test_sentinels_and_non_strings(self):
+        for sentinel in ("", "  ", "-", "--", "N/A", "Not Reported", None, 0):
+            self.assertIsNone(parse_date(sentinel))
+        self.assertEqual(parse_date(datetime(2024, 1, 5, 9)), date(2024, 1, 5))
+        self.assertEqual(parse_date(20240105), date(2024, 1, 5))
+
+    def test_repeated_strings_hit_the_cache(self):
+        audit_rules._parse_date_text.cache_clear()
+        for _ in range(3):
+            parse_date("08/01/2025")
+        self.assertEqual(audit_rules._parse_date_text.cache_info().hits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
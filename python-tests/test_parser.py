@@ -1,14 +1,37 @@
+import io
+import mmap
+import os
 import sys
+import tempfile
+import time
+import tracemalloc
 import unittest
 from pathlib import Path
+from unittest import mock
 
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
+from bs4 import BeautifulSoup  # noqa: E402
+
+from metro2.html_slim import slim_html  # noqa: E402
 from metro2.parser import (  # noqa: E402
+    SectionIndex,
+    SectionStrainer,
+    _load_markup,
+    _fallback_parse_account_history,
+    _fallback_parse_inquiries,
+    _find_nearest_header,
+    _flatten_tradelines,
     detect_tradeline_violations,
+    hedge_stats,
+    iter_report_events,
+    iter_tradelines,
     parse_client_portal_data,
     parse_credit_report_html,
     parse_negative_item_cards,
+    resolve_dom_build,
+    resolve_html_backend,
+    text,
 )
 
 
@@ -91,6 +114,263 @@ SAMPLE_HTML = """
 """
 
 
+NESTED_HEADER_HTML = """
+<html><body>
+  <table id="before"><tr><td>Preamble</td></tr></table>
+  <h2>Account History</h2>
+  <div class="sub_header">ALPHA BANK</div>
+  <div class="wrapper">
+    <p>noise</p>
+    <table id="alpha"><tr><td>x</td></tr></table>
+  </div>
+  <div class="sub_header">BETA CARD</div>
+  <div><div><table id="beta"><tr><td>y</td></tr></table></div></div>
+  <h3>Inquiries</h3>
+  <table id="inq"><tr><td>Creditor Name</td></tr></table>
+</body></html>
+"""
+
+
+class SectionIndexTest(unittest.TestCase):
+    def setUp(self):
+        self.soup = BeautifulSoup(NESTED_HEADER_HTML, "html.parser")
+        self.index = SectionIndex.build(self.soup)
+        self.by_id = {ctx.table.get("id"): ctx for ctx in self.index.tables}
+
+    def test_sections_follow_preceding_headings(self):
+        self.assertEqual(self.by_id["before"].sections, frozenset())
+        self.assertEqual(self.by_id["alpha"].sections, {"account_history"})
+        self.assertEqual(self.by_id["inq"].sections, {"account_history", "inquiries"})
+
+    def test_headers_match_backward_sibling_walk(self):
+        for ctx in self.index.tables:
+            self.assertIs(ctx.header, _find_nearest_header(ctx.table))
+        self.assertEqual(self.by_id["beta"].header.get_text(strip=True), "BETA CARD")
+
+
+class StreamingParserTest(unittest.TestCase):
+    def test_stream_matches_dom_fallback(self):
+        index = SectionIndex.build(BeautifulSoup(SAMPLE_HTML, "html.parser"))
+        streamed = list(iter_tradelines(io.BytesIO(SAMPLE_HTML.encode("utf-8")), chunk_size=64))
+        self.assertEqual(streamed, _fallback_parse_account_history(index))
+        self.assertEqual([t["bureau"] for t in streamed], ["TransUnion", "Experian", "Equifax"])
+
+    def test_events_arrive_in_document_order(self):
+        events = list(iter_report_events(io.StringIO(SAMPLE_HTML), chunk_size=50))
+        kinds = [kind for kind, _ in events]
+        self.assertEqual(kinds, ["personal_information"] + ["tradeline"] * 3 + ["inquiry"])
+        self.assertEqual(events[0][1]["Experian"]["name"], "Jane Doe")
+        index = SectionIndex.build(BeautifulSoup(SAMPLE_HTML, "html.parser"))
+        self.assertEqual([events[-1][1]], _fallback_parse_inquiries(index))
+
+    def test_nested_headers_follow_dom_rules(self):
+        balance_row = "<tr><td>Balance</td><td>1</td><td>2</td><td>3</td></tr>"
+        html = NESTED_HEADER_HTML.replace("<tr><td>y</td></tr>", "<tr><td>y</td></tr>" * 2 + balance_row)
+        streamed = list(iter_tradelines(html))
+        self.assertEqual([t["creditor_name"] for t in streamed], ["BETA CARD"] * 3)
+
+
+class HtmlBackendTest(unittest.TestCase):
+    def test_missing_backend_falls_back_to_html_parser(self):
+        with mock.patch("metro2.parser.builder_registry.lookup", return_value=None):
+            self.assertEqual(resolve_html_backend("lxml"), "html.parser")
+            self.assertEqual(resolve_html_backend("auto"), "html.parser")
+
+    def test_environment_selects_backend(self):
+        with mock.patch.dict("os.environ", {"METRO2_HTML_BACKEND": "HTML.PARSER"}):
+            self.assertEqual(resolve_html_backend(), "html.parser")
+        with self.assertRaises(ValueError):
+            resolve_html_backend("regex")
+
+    def test_explicit_backend_argument_reaches_fallback(self):
+        parsed = parse_negative_item_cards(SAMPLE_HTML, backend="auto")
+        self.assertEqual(parsed["accounts"], parse_negative_item_cards(SAMPLE_HTML)["accounts"])
+
+
+class RestrictedDomBuildTest(unittest.TestCase):
+    def test_restricted_build_keeps_only_section_nodes(self):
+        soup = BeautifulSoup(NESTED_HEADER_HTML, "html.parser", parse_only=SectionStrainer())
+        self.assertEqual(soup.find_all("p"), [])
+        index = SectionIndex.build(soup)
+        by_id = {ctx.table.get("id"): ctx for ctx in index.tables}
+        self.assertEqual(text(by_id["alpha"].header), "ALPHA BANK")
+        self.assertEqual(text(by_id["beta"].header), "BETA CARD")
+        self.assertIn("inquiries", by_id["inq"].sections)
+
+    def test_restricted_build_matches_full_build(self):
+        for html in (SAMPLE_HTML, NESTED_HEADER_HTML):
+            self.assertEqual(
+                parse_client_portal_data(html, dom_build="restricted"),
+                parse_client_portal_data(html, dom_build="full"),
+            )
+        with mock.patch.dict("os.environ", {"METRO2_DOM_BUILD": "Restricted"}):
+            self.assertEqual(resolve_dom_build(), "restricted")
+        with self.assertRaises(ValueError):
+            resolve_dom_build("partial")
+
+
+class ParseTimingsTest(unittest.TestCase):
+    def test_callback_receives_stage_breakdown(self):
+        reports = []
+        parsed = parse_client_portal_data(SAMPLE_HTML, on_timings=reports.append)
+        self.assertNotIn("_timings", parsed)
+        (report,) = reports
+        self.assertIn("audit", report["stages_ms"])
+        self.assertEqual(report["tradelines"], 3)
+        self.assertEqual(report["inquiries"], 1)
+        self.assertNotIn("peak_memory_bytes", report)
+
+    def test_environment_attaches_timings_block_with_memory_peak(self):
+        with mock.patch.dict("os.environ", {"METRO2_PARSE_TIMINGS": "memory"}):
+            parsed = parse_negative_item_cards(SAMPLE_HTML)
+        self.assertGreater(parsed["_timings"]["peak_memory_bytes"], 0)
+        self.assertGreaterEqual(parsed["_timings"]["total_ms"], 0)
+        stage_peaks = parsed["_timings"]["stage_peak_bytes"]
+        self.assertEqual(set(stage_peaks), set(parsed["_timings"]["stages_ms"]))
+        self.assertLessEqual(max(stage_peaks.values()), parsed["_timings"]["peak_memory_bytes"])
+
+    def test_failed_parse_stops_memory_tracing(self):
+        with mock.patch.dict("os.environ", {"METRO2_PARSE_TIMINGS": "memory"}):
+            with self.assertRaises(ValueError):
+                parse_client_portal_data("<html></html>", backend="bogus")
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+class HedgedParseTest(unittest.TestCase):
+    BRIDGE_PAYLOAD = {
+        "tradelines": [
+            {
+                "meta": {"creditor": "BRIDGE BANK"},
+                "per_bureau": {"TransUnion": {"account_number": "9999", "balance": "$10"}},
+            }
+        ]
+    }
+
+    def _parse(self, fake_bridge, **env):
+        reports = []
+        with mock.patch.dict("os.environ", env), mock.patch(
+            "metro2.parser._call_js_parser", side_effect=fake_bridge
+        ):
+            parsed = parse_client_portal_data(SAMPLE_HTML, on_timings=reports.append)
+        return parsed, reports[0]
+
+    def test_fallback_wins_and_cancels_slow_bridge(self):
+        cancelled = []
+
+        def slow_bridge(html, timings=None, cancel=None):
+            cancelled.append(cancel.wait(5))
+            return self.BRIDGE_PAYLOAD
+
+        parsed, report = self._parse(slow_bridge, METRO2_HEDGE_DELAY="0.05")
+        self.assertEqual(report["hedge_winner"], "fallback")
+        self.assertEqual(parsed["accounts"][0]["account_number"], "1234")
+        for _ in range(100):
+            if cancelled:
+                break
+            time.sleep(0.01)
+        self.assertEqual(cancelled, [True])
+
+    def test_bridge_wins_within_head_start(self):
+        parsed, report = self._parse(
+            lambda html, timings=None, cancel=None: self.BRIDGE_PAYLOAD,
+            METRO2_HEDGE_DELAY="5",
+            METRO2_HEDGE_SMALL_BYTES="0",
+        )
+        self.assertEqual(report["hedge_winner"], "bridge")
+        self.assertEqual(parsed["accounts"][0]["creditor_name"], "BRIDGE BANK")
+
+    def test_failed_fallback_leaves_the_race_to_the_bridge(self):
+        def slow_bridge(html, timings=None, cancel=None):
+            time.sleep(0.1)
+            return self.BRIDGE_PAYLOAD
+
+        with mock.patch("metro2.parser._fallback_report", side_effect=RuntimeError("boom")):
+            parsed, report = self._parse(slow_bridge, METRO2_HEDGE_DELAY="0")
+            self.assertEqual(report["hedge_winner"], "bridge")
+            self.assertEqual(parsed["accounts"][0]["creditor_name"], "BRIDGE BANK")
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                self._parse(lambda html, timings=None, cancel=None: {}, METRO2_HEDGE_DELAY="0")
+
+    def test_winner_is_counted_with_timings_disabled(self):
+        before = hedge_stats()
+        with mock.patch.dict(
+            "os.environ", {"METRO2_HEDGE_DELAY": "5", "METRO2_HEDGE_SMALL_BYTES": "0"}
+        ), mock.patch("metro2.parser._call_js_parser", return_value=self.BRIDGE_PAYLOAD):
+            os.environ.pop("METRO2_PARSE_TIMINGS", None)
+            parsed = parse_client_portal_data(SAMPLE_HTML)
+        self.assertNotIn("_timings", parsed)
+        after = hedge_stats()
+        self.assertEqual(after["bridge"], before["bridge"] + 1)
+        self.assertEqual(after["fallback"], before["fallback"])
+
+
+class RawInputTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = Path(tmp.name) / "report.html"
+        self.path.write_bytes(SAMPLE_HTML.encode("utf-8"))
+        self.expected = parse_negative_item_cards(SAMPLE_HTML)
+
+    def test_bytes_memoryview_and_path_inputs_match_text(self):
+        raw = SAMPLE_HTML.encode("utf-8")
+        for source in (raw, bytearray(raw), memoryview(raw), self.path, str(self.path)):
+            with self.subTest(source=type(source).__name__):
+                self.assertEqual(parse_negative_item_cards(source), self.expected)
+
+    def test_large_files_are_memory_mapped(self):
+        with mock.patch("metro2.parser.MMAP_THRESHOLD_BYTES", 1):
+            markup = _load_markup(self.path)
+            self.assertIsInstance(markup.raw, mmap.mmap)
+            self.assertEqual(markup.slim(), 0)
+            self.assertIsInstance(markup.raw, mmap.mmap)
+            markup.close()
+            self.assertEqual(parse_negative_item_cards(self.path), self.expected)
+
+    def test_markup_is_not_decoded_when_bridge_has_data(self):
+        payload = dict(
+            HedgedParseTest.BRIDGE_PAYLOAD,
+            inquiry_details=[{"creditor_name": "Capital One", "date_of_inquiry": "01/01/2024"}],
+        )
+        with mock.patch("metro2.parser._call_js_parser", return_value=payload) as bridge, mock.patch(
+            "metro2.parser._ReportMarkup.text", side_effect=AssertionError("decoded")
+        ):
+            parsed = parse_negative_item_cards(self.path)
+        self.assertIsInstance(bridge.call_args.args[0], bytes)
+        self.assertEqual(parsed["accounts"][0]["creditor_name"], "BRIDGE BANK")
+
+
+class HtmlSlimTest(unittest.TestCase):
+    ASSETS = (
+        '<style>td { color: red }</style>\n'
+        '<script type="text/javascript">var t = "<table><td>Account #</td></table>";</script>\n'
+        '<svg viewBox="0 0 10 10"><text>TransUnion</text></svg><svg/>\n'
+        '<img src="data:image/png;base64,iVBORw0KGgo=" alt="logo">\n'
+    )
+
+    def test_strips_inline_assets_and_indentation(self):
+        slimmed, removed = slim_html(self.ASSETS + "<p>\n    kept   text\n  </p>")
+        self.assertEqual(slimmed, '\n<img src="" alt="logo">\n<p>\nkept   text\n</p>')
+        self.assertGreater(removed, 0)
+        raw_slimmed, raw_removed = slim_html(memoryview(self.ASSETS.encode("utf-8")))
+        self.assertIsInstance(raw_slimmed, bytes)
+        self.assertEqual(raw_removed, len(self.ASSETS) - len(raw_slimmed))
+
+    def test_unclosed_block_stops_the_scan(self):
+        markup = "<p>a</p><script>" * 3 + "<style>b</style>"
+        self.assertEqual(slim_html(markup), (markup, 0))
+        self.assertEqual(slim_html("<SCRIPT>x</Script ><p>a</p>")[0], "<p>a</p>")
+
+    def test_slimming_preserves_parse_output(self):
+        html = SAMPLE_HTML.replace("<body>", "<body>" + self.ASSETS)
+        reports = []
+        with mock.patch.dict("os.environ", {"METRO2_HTML_SLIM": "0"}):
+            unslimmed = parse_client_portal_data(html)
+        slimmed = parse_client_portal_data(html.encode("utf-8"), on_timings=reports.append)
+        self.assertEqual(slimmed, unslimmed)
+        self.assertGreater(reports[0]["slim_removed"], len(self.ASSETS) // 2)
+
+
 class DetectTradelineViolationsGroupingTest(unittest.TestCase):
     def test_different_accounts_same_creditor_not_grouped(self):
         tradelines = [
@@ -197,6 +477,34 @@ class DetectTradelineViolationsGroupingTest(unittest.TestCase):
         violation_ids = {v["id"] for tl in audited for v in tl.get("violations", [])}
         self.assertIn("POSSIBLE_MISMATCHED_ACCOUNTS_ACROSS_BUREAUS", violation_ids)
 
+    def test_parser_group_ids_override_fuzzy_matching(self):
+        same_masked_number = [
+            dict(build_tradeline("Nelnet", "9000****", "Open", balance, bureau), group_id=group)
+            for group, balance in (("tl-0", "$1,757"), ("tl-1", "$1,040"))
+            for bureau in ("TransUnion", "Experian")
+        ]
+        audited = detect_tradeline_violations(same_masked_number)
+        violation_ids = {v["id"] for tl in audited for v in tl.get("violations", [])}
+        self.assertNotIn("BALANCE_MISMATCH", violation_ids)
+
+    def test_bridge_and_fallback_records_carry_account_groups(self):
+        payload = [
+            {
+                "meta": {"creditor": "Navy FCU"},
+                "per_bureau": {
+                    "TransUnion": {"account_number": "542217501713****"},
+                    "Experian": {"account_number": "17**"},
+                },
+            }
+        ]
+        flattened = _flatten_tradelines(payload)
+        self.assertEqual({t["group_id"] for t in flattened}, {"tl-0"})
+        self.assertEqual({t["account_key"] for t in flattened}, {"NAVY FCU|542217501713"})
+
+        index = SectionIndex.build(BeautifulSoup(SAMPLE_HTML, "html.parser"))
+        tradelines = _fallback_parse_account_history(index)
+        self.assertEqual({(t["group_id"], t["account_key"][-5:]) for t in tradelines}, {("tl-0", "|1234")})
+
 
 class SplitParserCoverageTest(unittest.TestCase):
     def test_negative_item_parser_scope(self):
@@ -0,0 +1,140 @@
+import io
+import json
+import sys
+import unittest
+from datetime import date
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from metro2.audit_rules import (  # noqa: E402
+    audit_last_payment_integrity,
+    audit_student_loan_deferment,
+    normalize_tradeline,
+    run_all_audits,
+)
+from metro2.parser import (  # noqa: E402
+    SectionIndex,
+    _fallback_parse_account_history,
+    iter_tradelines,
+)
+from metro2.payment_history import (  # noqa: E402
+    CURRENT,
+    DEROGATORY,
+    LATE_60,
+    PaymentGrid,
+    parse_grid_rows,
+)
+
+GRID_HTML = """
+<html><body>
+  <h2>Account History</h2>
+  <table class="crPrint"><tr><td>
+    <div class="sub_header">ALPHA BANK</div>
+    <table>
+      <tr><td></td><td>TransUnion</td><td>Experian</td><td>Equifax</td></tr>
+      <tr><td>Account #:</td><td>1234</td><td>1234</td><td>1234</td></tr>
+      <tr><td>Account Status:</td><td>Open</td><td>Open</td><td>Open</td></tr>
+    </table>
+    <table class="addr_hsrty">
+      <tr><td>Month</td><td>Mar M</td><td>Feb F</td><td>Jan J</td><td>Dec D</td></tr>
+      <tr><td>Year</td><td>24</td><td>24</td><td>24</td><td>23</td></tr>
+      <tr><td>TransUnion</td><td>OK</td><td>60</td><td>30</td><td>OK</td></tr>
+      <tr><td>Experian</td><td>CO</td><td></td><td>OK</td><td>OK</td></tr>
+      <tr><td>Equifax</td><td></td><td></td><td></td><td></td></tr>
+    </table>
+  </td></tr></table>
+</body></html>
+"""
+
+
+class PaymentGridTest(unittest.TestCase):
+    def setUp(self):
+        rows = [
+            ["Month", "Mar M", "Feb F", "Jan J", "Dec D"],
+            ["Year", "24", "24", "24", "23"],
+            ["TransUnion", "OK", "60", "30", "OK"],
+            ["Experian", "CO", "", "OK", "OK"],
+        ]
+        self.grids = parse_grid_rows(rows, ("TransUnion", "Experian", "Equifax"))
+
+    def test_rows_become_per_bureau_month_arrays(self):
+        tu = self.grids["TransUnion"]
+        self.assertEqual(tu.origin, 2023 * 12 + 11)
+        self.assertEqual(tu.codes.typecode, "B")
+        self.assertEqual(list(tu), ["2023-12", "2024-01", "2024-02", "2024-03"])
+        self.assertEqual(tu.worst_status(), LATE_60)
+        self.assertEqual(tu.late_counts(), {30: 1, 60: 1, 90: 0})
+        self.assertEqual(tu.first_delinquency_month(), date(2024, 1, 1))
+        self.assertNotIn("Equifax", self.grids)
+
+    def test_blank_months_stay_in_the_array_but_not_the_mapping(self):
+        ex = self.grids["Experian"]
+        self.assertEqual(list(ex.codes), [CURRENT, CURRENT, 0, DEROGATORY])
+        self.assertNotIn("2024-02", ex)
+        self.assertEqual(ex.first_delinquency_month(DEROGATORY), date(2024, 3, 1))
+
+    def test_json_round_trip_can_be_rebuilt(self):
+        plain = json.loads(json.dumps(self.grids["TransUnion"]))
+        self.assertEqual(PaymentGrid.from_mapping(plain).codes, self.grids["TransUnion"].codes)
+
+
+class PaymentGridParserTest(unittest.TestCase):
+    def test_grid_attaches_to_its_account_instead_of_becoming_tradelines(self):
+        index = SectionIndex.build(BeautifulSoup(GRID_HTML, "html.parser"))
+        tradelines = _fallback_parse_account_history(index)
+        inner = [t for t in tradelines if t.get("account_#") == "1234" and "month" not in t]
+        self.assertEqual(len(inner), 3)
+        self.assertFalse(any(t.get("creditor_name") == "24 24 24 23" for t in tradelines))
+        by_bureau = {t["bureau"]: t for t in inner}
+        self.assertEqual(by_bureau["TransUnion"]["payment_history"]["2024-02"], "60")
+        self.assertNotIn("payment_history", by_bureau["Equifax"])
+
+    def test_stream_matches_dom_fallback(self):
+        index = SectionIndex.build(BeautifulSoup(GRID_HTML, "html.parser"))
+        streamed = list(iter_tradelines(io.StringIO(GRID_HTML), chunk_size=40))
+        self.assertEqual(streamed, _fallback_parse_account_history(index))
+
+
+class PaymentGridRulesTest(unittest.TestCase):
+    def test_plain_mapping_history_keeps_the_legacy_entries(self):
+        record = {
+            "account_status": "Paid",
+            "date_closed": "10/19/2018",
+            "payment_history": {"2023-01": "OK", "2023-02": "60"},
+        }
+        normalize_tradeline(record)
+        self.assertNotIsInstance(record["payment_history"], PaymentGrid)
+        payload = {"accounts": [record], "inquiries": []}
+        run_all_audits(payload)
+        ids = [v["id"] for v in payload["accounts"][0].get("violations", [])]
+        self.assertNotIn("INCORRECT_PAYMENT_HISTORY_AFTER_CLOSURE", ids)
+
+    def test_student_loan_deferment_reads_late_counts(self):
+        record = {
+            "account_type": "Student Loan",
+            "comments": "Deferred",
+            "payment_history": PaymentGrid.from_mapping({"2024-01": "OK", "2024-02": "90"}),
+        }
+        # A string scan would read "30" out of the 2030 key.
+        clean = dict(record, payment_history=PaymentGrid.from_mapping({"2030-01": "OK"}))
+        audit_student_loan_deferment([record, clean])
+        self.assertEqual([v["id"] for v in record["violations"]], ["SL_DEFERMENT_HAS_LATES"])
+        self.assertNotIn("violations", clean)
+
+    def test_last_payment_after_charge_off_month(self):
+        record = {
+            "account_status": "Open",
+            "date_of_last_payment": "05/10/2024",
+            "payment_history": PaymentGrid.from_mapping({"2024-03": "30", "2024-04": "CO"}),
+        }
+        same_month = dict(record, date_of_last_payment="04/20/2024")
+        audit_last_payment_integrity([record, same_month])
+        self.assertEqual([v["id"] for v in record["violations"]], ["fcra_last_payment_invalid"])
+        self.assertNotIn("violations", same_month)
+
+
+if __name__ == "__main__":
+    unittest.main()
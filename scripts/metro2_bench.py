@@ -0,0 +1,402 @@
+#!/usr/bin/env python3
+"""Micro-benchmarks for the Python Metro 2 parse/audit pipeline.
+
+Each sub-command times one stage against the bundled report fixtures (or the
+paths given on the command line) and prints a small table, e.g.::
+
+    python scripts/metro2_bench.py backends
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+DEFAULT_FIXTURES = [
+    REPO_ROOT / "metro2 (copy 1)" / "crm" / "JUSTYCE.html",
+    *sorted((REPO_ROOT / "attached_assets").glob("*.html")),
+    REPO_ROOT / "packages" / "metro2-cheerio" / "tests" / "fixtures" / "report.html",
+]
+
+
+def _fixtures(paths: Sequence[str]) -> List[Path]:
+    selected = [Path(p) for p in paths] if paths else DEFAULT_FIXTURES
+    return [path for path in selected if path.is_file()]
+
+
+def _median_seconds(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def bench_backends(args: argparse.Namespace) -> int:
+    """Fallback parse time and output parity for each installed tree builder."""
+
+    from bs4 import BeautifulSoup
+
+    from metro2 import parser
+
+    backends = parser.available_html_backends()
+    print(f"installed backends: {', '.join(backends)}")
+    mismatches = 0
+    for path in _fixtures(args.paths):
+        html = path.read_text(encoding="utf-8")
+        outputs: Dict[str, object] = {}
+        row = [f"{path.name[:40]:<40}"]
+        for backend in backends:
+
+            def run() -> object:
+                index = parser.SectionIndex.build(BeautifulSoup(html, backend))
+                return (
+                    parser._fallback_parse_account_history(index),
+                    parser._fallback_parse_inquiries(index),
+                    parser._fallback_parse_personal_info(index),
+                )
+
+            outputs[backend] = run()
+            row.append(f"{backend}={_median_seconds(run, args.repeat) * 1000:8.1f}ms")
+        reference = outputs.get(parser.DEFAULT_HTML_BACKEND)
+        differing = [name for name, output in outputs.items() if output != reference]
+        mismatches += len(differing)
+        row.append("parity=ok" if not differing else f"differs: {','.join(differing)}")
+        print("  ".join(row))
+    return 1 if mismatches else 0
+
+
+def bench_dom(args: argparse.Namespace) -> int:
+    """Full vs ``restricted`` (SoupStrainer) DOM build: time, nodes and parity."""
+
+    from bs4 import BeautifulSoup
+
+    from metro2 import parser
+    from metro2.html_slim import slim_html
+
+    mismatches = 0
+    for path in _fixtures(args.paths):
+        html, _ = slim_html(path.read_text(encoding="utf-8"))
+        row = [f"{path.name[:40]:<40}"]
+        outputs: Dict[str, object] = {}
+        for mode in parser.DOM_BUILD_MODES:
+            strainer = parser.SectionStrainer() if mode == "restricted" else None
+
+            def run() -> object:
+                index = parser.SectionIndex.build(
+                    BeautifulSoup(html, parser.DEFAULT_HTML_BACKEND, parse_only=strainer)
+                )
+                return index, (
+                    parser._fallback_parse_account_history(index),
+                    parser._fallback_parse_inquiries(index),
+                    parser._fallback_parse_personal_info(index),
+                )
+
+            index, outputs[mode] = run()
+            nodes = sum(1 for _ in index.soup.descendants)
+            row.append(f"{mode}={_median_seconds(run, args.repeat) * 1000:7.1f}ms/{nodes} nodes")
+        same = outputs["full"] == outputs["restricted"]
+        mismatches += 0 if same else 1
+        row.append("parity=ok" if same else "parity=DIFFERS")
+        print("  ".join(row))
+    return 1 if mismatches else 0
+
+
+def bench_slim(args: argparse.Namespace) -> int:
+    """Bytes removed by the HTML pre-slimming pass and end-to-end parse time."""
+
+    from unittest import mock
+
+    from metro2 import parser
+    from metro2.html_slim import slim_html
+
+    for path in _fixtures(args.paths):
+        raw = path.read_bytes()
+        slimmed, removed = slim_html(raw)
+        row = [
+            f"{path.name[:40]:<40}",
+            f"{len(raw) / 1024:8.1f}KiB -{removed / 1024:7.1f}KiB ({removed / max(len(raw), 1):5.1%})",
+            f"slim={_median_seconds(lambda: slim_html(raw), args.repeat) * 1000:6.1f}ms",
+        ]
+        for label, flag in (("off", "0"), ("on", "1")):
+            with mock.patch.dict(os.environ, {"METRO2_HTML_SLIM": flag}):
+                elapsed = _median_seconds(lambda: parser.parse_client_portal_data(raw), args.repeat)
+            row.append(f"parse[{label}]={elapsed * 1000:8.1f}ms")
+        print("  ".join(row))
+    return 0
+
+
+COMPACT_ENCODER = (
+    "import {{ compactPayload }} from {module};"
+    "let raw = ''; process.stdin.on('data', (c) => {{ raw += c; }});"
+    "process.stdin.on('end', () => process.stdout.write(JSON.stringify(compactPayload(JSON.parse(raw)))));"
+)
+
+
+def _nested_bridge_payload(accounts: List[Dict[str, object]]) -> Dict[str, object]:
+    """Rebuild the bridge's nested tradeline shape from flat per-bureau records."""
+
+    entries = []
+    for start in range(0, len(accounts), 3):
+        group = accounts[start : start + 3]
+        per_bureau: Dict[str, object] = {}
+        violations: List[object] = []
+        for record in group:
+            bureau = record["bureau"]
+            skipped = ("bureau", "creditor_name", "violations")
+            per_bureau[bureau] = {k: v for k, v in record.items() if k not in skipped}
+            violations.extend(dict(v, bureau=bureau) for v in record.get("violations") or [])
+        meta = {"creditor": group[0].get("creditor_name")}
+        entries.append({"meta": meta, "per_bureau": per_bureau, "violations": violations})
+    return {"tradelines": entries}
+
+
+def bench_wire(args: argparse.Namespace) -> int:
+    """Nested vs ``--compact`` bridge payload: bytes on the wire and Python decode time."""
+
+    import json
+
+    from metro2 import parser
+
+    module = json.dumps((REPO_ROOT / "metro2" / "bridge_compact.mjs").as_uri())
+    mismatches = 0
+    for path in _fixtures(args.paths):
+        accounts = parser.parse_negative_item_cards(path)["accounts"]
+        if not accounts:
+            continue
+        nested = json.dumps(_nested_bridge_payload(accounts)).encode("utf-8")
+        compact = subprocess.run(
+            ["node", "--input-type=module", "-e", COMPACT_ENCODER.format(module=module)],
+            input=nested,
+            capture_output=True,
+            check=True,
+        ).stdout
+        row = [f"{path.name[:40]:<40}", f"{len(accounts):4d} tradelines"]
+        decoded = {}
+        for label, body in (("nested", nested), ("compact", compact)):
+
+            def decode() -> object:
+                return parser._flatten_tradelines(json.loads(body)["tradelines"])
+
+            decoded[label] = decode()
+            elapsed = _median_seconds(decode, args.repeat)
+            row.append(f"{label}={len(body) / 1024:7.1f}KiB/{elapsed * 1000:6.1f}ms")
+        same = decoded["nested"] == decoded["compact"]
+        mismatches += 0 if same else 1
+        row.append("parity=ok" if same else "parity=DIFFERS")
+        print("  ".join(row))
+    return 1 if mismatches else 0
+
+
+DATE_SENTINELS = ("-", "N/A", "", "--")
+DATE_FIELDS = frozenset(
+    {
+        "date_opened",
+        "date_closed",
+        "last_reported",
+        "date_last_reported",
+        "date_last_active",
+        "date_of_last_payment",
+        "date_last_payment",
+        "date_of_first_delinquency",
+        "date_of_inquiry",
+    }
+)
+
+
+def _report_date_values(paths: Sequence[str]) -> List[str]:
+    """Every date field value the parser produces for the fixtures, sentinels included."""
+
+    from metro2 import parser
+
+    values: List[str] = []
+    for path in _fixtures(paths):
+        parsed = parser.parse_negative_item_cards(path)
+        for record in parsed["accounts"] + parsed["inquiries"]:
+            for key, value in record.items():
+                if key in DATE_FIELDS and isinstance(value, str):
+                    values.append(value)
+    return values or list(DATE_SENTINELS)
+
+
+def bench_dates(args: argparse.Namespace) -> int:
+    """``parse_date`` calls/sec on report date strings: legacy, fast path, memoized."""
+
+    from metro2 import audit_rules
+
+    values = _report_date_values(args.paths) * 20
+    sentinels = sum(
+        1 for value in values if not value.strip() or value.strip().lower() in audit_rules._EMPTY_DATE_TEXTS
+    )
+    print(f"{len(values)} values, {len(set(values))} distinct, {sentinels / len(values):.0%} sentinels")
+    legacy = audit_rules._parse_date_slow
+    uncached = audit_rules._parse_date_text.__wrapped__
+    mismatches = sum(1 for value in set(values) if legacy(value.strip()) != audit_rules.parse_date(value))
+    for label, fn in (
+        ("legacy", lambda v: legacy(v.strip()) if v.strip() else None),
+        ("fast-path", uncached),
+        ("memoized", audit_rules.parse_date),
+    ):
+        elapsed = _median_seconds(lambda: [fn(value) for value in values], args.repeat)
+        print(f"{label:<10} {len(values) / elapsed / 1000:9.1f}k calls/s")
+    print("parity=ok" if not mismatches else f"parity: {mismatches} values differ")
+    return 1 if mismatches else 0
+
+
+AUDIT_BATCH_SIZE = 500
+
+
+def _audit_batch(paths: Sequence[str], size: int = AUDIT_BATCH_SIZE) -> List[Dict[str, object]]:
+    """``size`` parsed fixture tradelines (cycled as needed), violations stripped."""
+
+    from metro2 import parser
+
+    accounts: List[Dict[str, object]] = []
+    for path in _fixtures(paths):
+        accounts.extend(parser.parse_negative_item_cards(path)["accounts"])
+    accounts = [{k: v for k, v in record.items() if k != "violations"} for record in accounts]
+    if not accounts:
+        return []
+    return [dict(accounts[i % len(accounts)]) for i in range(size)]
+
+
+def bench_audit(args: argparse.Namespace) -> int:
+    """``run_all_audits`` wall time on a batch of fixture tradelines."""
+
+    import copy
+
+    from metro2.audit_rules import run_all_audits
+
+    batch = _audit_batch(args.paths)
+    if not batch:
+        print("no tradelines")
+        return 1
+
+    def run() -> None:
+        run_all_audits({"accounts": copy.deepcopy(batch), "inquiries": []})
+
+    copies = _median_seconds(lambda: copy.deepcopy(batch), args.repeat)
+    elapsed = _median_seconds(run, args.repeat) - copies
+    print(f"{len(batch)} tradelines  audit={elapsed * 1000:7.1f}ms  ({elapsed / len(batch) * 1e6:6.1f}us/tradeline)")
+    return 0
+
+
+COLUMNAR_BATCH_REPORTS = 40
+
+
+def bench_columnar(args: argparse.Namespace) -> int:
+    """Batch re-audit of many reports: dict engine vs the NumPy prefilter."""
+
+    import copy
+
+    from metro2.audit_columnar import columnar_available, run_columnar_audits
+    from metro2.audit_rules import run_all_audits
+
+    if not columnar_available():
+        print("numpy is not installed; columnar mode falls back to the dict engine")
+        return 0
+    batch = _audit_batch(args.paths)
+    payloads = [{"accounts": batch, "inquiries": []} for _ in range(COLUMNAR_BATCH_REPORTS)]
+    expected = copy.deepcopy(payloads)
+    for payload in expected:
+        run_all_audits(payload)
+    actual = run_columnar_audits(copy.deepcopy(payloads))
+    copies = _median_seconds(lambda: copy.deepcopy(payloads), args.repeat)
+    tradelines = len(batch) * len(payloads)
+    for label, run in (
+        ("dict", lambda: [run_all_audits(p) for p in copy.deepcopy(payloads)]),
+        ("columnar", lambda: run_columnar_audits(copy.deepcopy(payloads))),
+    ):
+        elapsed = _median_seconds(run, args.repeat) - copies
+        print(f"{label:<9} {tradelines} tradelines  {elapsed * 1000:8.1f}ms  ({elapsed / tradelines * 1e6:6.1f}us/tradeline)")
+    print("parity=ok" if actual == expected else "parity: results differ")
+    return 0 if actual == expected else 1
+
+
+# Cumulative import time budgets (ms, warm bytecode cache) and modules each
+# entry point must not drag in.
+STARTUP_BUDGETS = {
+    "metro2": (30, ("bs4", "pdfplumber", "asyncio", "sqlite3")),
+    "metro2.audit_rules": (60, ("bs4", "pdfplumber", "asyncio", "sqlite3")),
+    "metro2.parser": (200, ("pdfplumber", "asyncio", "sqlite3")),
+}
+
+
+def _import_time_ms(module: str, env: Dict[str, str]) -> float:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(completed.stderr.splitlines()):
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == module:
+            return int(fields[1]) / 1000
+    raise RuntimeError(f"no importtime entry for {module}")
+
+
+def _leaked_modules(module: str, forbidden: Sequence[str], env: Dict[str, str]) -> List[str]:
+    probe = f"import sys, {module}; print(*(m for m in {list(forbidden)!r} if m in sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return completed.stdout.split()
+
+
+def bench_startup(args: argparse.Namespace) -> int:
+    """``python -X importtime`` per entry point; exit 1 when over budget."""
+
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    failures = 0
+    for module, (budget_ms, forbidden) in STARTUP_BUDGETS.items():
+        _import_time_ms(module, env)  # warm the bytecode cache
+        elapsed = min(_import_time_ms(module, env) for _ in range(args.repeat))
+        leaked = _leaked_modules(module, forbidden, env)
+        ok = elapsed <= budget_ms and not leaked
+        failures += 0 if ok else 1
+        status = "ok" if ok else "OVER BUDGET" if not leaked else f"imports {', '.join(leaked)}"
+        print(f"{module:<24} {elapsed:7.1f}ms / {budget_ms}ms  {status}")
+    return 1 if failures else 0
+
+
+COMMANDS = {
+    "audit": bench_audit,
+    "backends": bench_backends,
+    "columnar": bench_columnar,
+    "dates": bench_dates,
+    "dom": bench_dom,
+    "slim": bench_slim,
+    "startup": bench_startup,
+    "wire": bench_wire,
+}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("command", choices=sorted(COMMANDS))
+    parser.add_argument("paths", nargs="*", help="Report files (default: bundled fixtures)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Runs per measurement")
+    args = parser.parse_intermixed_args(argv)
+    return COMMANDS[args.command](args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())